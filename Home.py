@@ -1,5 +1,9 @@
 import streamlit as st
 
+from core.texts import GRADIENT_THEMES as gradient_themes, SOLID_THEMES as solid_themes
+from core.texts import HOME_CONTENT as content, TRACE_TEXTS
+from core.trace import Tracer, show_trace
+
 # =========================
 #   PAGE CONFIG
 # =========================
@@ -9,24 +13,6 @@ st.set_page_config(
     layout="wide",
 )
 
-# =========================
-#      THEME OPTIONS
-# =========================
-solid_themes = {
-    "Light Blue": "#E3F2FD",
-    "Soft Green": "#E8F5E9",
-    "Warm Beige": "#FFF3E0",
-    "Ice Gray": "#ECEFF1",
-    "Soft Pink": "#FCE4EC",
-}
-
-gradient_themes = {
-    "Sky Blue": "linear-gradient(135deg, #c9e9ff, #81c4ff)",
-    "Purple Sunset": "linear-gradient(135deg, #e3a7ff, #9b51e0)",
-    "Aqua Fresh": "linear-gradient(135deg, #d5fff7, #68e2c6)",
-    "Warm Flame": "linear-gradient(135deg, #ffd6a5, #ff8fab)",
-}
-
 # =========================
 #   SIDEBAR CONTROLS
 # =========================
@@ -37,6 +23,8 @@ lang = st.sidebar.selectbox(
     ["English", "Bahasa Indonesia"],
     index=0
 )
+trace_texts = TRACE_TEXTS["en" if lang == "English" else "id"]
+tracer = Tracer("home", st.sidebar.toggle(trace_texts["toggle"], key="trace_home"))
 
 # Theme mode
 theme_type = st.sidebar.selectbox(
@@ -159,63 +147,10 @@ elif theme_type == "Color Picker":
 # =========================
 #   APPLY CSS
 # =========================
-st.markdown(build_css(background_style, bg_is_dark), unsafe_allow_html=True)
-
-# =========================
-#   CONTENT (BILINGUAL)
-# =========================
-content = {
-    "English": {
-        "badge": "Graph Theory",
-        "title": "Introduction to Graph Theory",
-        "p1": """Graph theory is a branch of mathematics that studies structures made of
-                 <strong>vertices (nodes)</strong> and <strong>edges (connections)</strong>.
-                 It provides a powerful framework for analyzing and modeling networks in real-world systems.""",
-        "p2": """Examples include social networks, computer networks, transportation routes,
-                 biological networks, and many more.""",
-        "basic_title": "Basic Concepts",
-        "basic_list": [
-            "<strong>Vertex (Node):</strong> The basic unit in a graph.",
-            "<strong>Edge:</strong> A connection between two vertices.",
-            "<strong>Degree:</strong> Number of edges connected to a vertex.",
-            "<strong>Path:</strong> A sequence of connected vertices.",
-            "<strong>Cycle:</strong> A path that begins and ends at the same vertex.",
-            "<strong>Connected Graph:</strong> Every pair of vertices is reachable.",
-        ],
-        "app_title": "Applications of Graph Theory",
-        "app_list": [
-            "<strong>Social Networks:</strong> Modeling friendships and community structures.",
-            "<strong>Logistics & Routing:</strong> Shortest paths, delivery routes, and optimization.",
-            "<strong>Computer Networks:</strong> Understanding connections between servers and devices.",
-            "<strong>Machine Learning:</strong> Graph embeddings, clustering, and recommendation systems.",
-        ],
-    },
-    "Bahasa Indonesia": {
-        "badge": "Teori Graf",
-        "title": "Pengenalan Teori Graf",
-        "p1": """Teori graf adalah cabang matematika yang mempelajari struktur yang terdiri dari
-                 <strong>simpul (vertex/node)</strong> dan <strong>sisi (edge/hubungan)</strong>.
-                 Teori ini menjadi kerangka yang kuat untuk menganalisis dan memodelkan jaringan pada sistem nyata.""",
-        "p2": """Contohnya antara lain jejaring sosial, jaringan komputer, rute transportasi,
-                 jaringan biologis, dan masih banyak lagi.""",
-        "basic_title": "Konsep Dasar",
-        "basic_list": [
-            "<strong>Simpul (Vertex/Node):</strong> Unit dasar dalam graf.",
-            "<strong>Sisi (Edge):</strong> Hubungan yang menghubungkan dua simpul.",
-            "<strong>Derajat (Degree):</strong> Jumlah sisi yang terhubung ke sebuah simpul.",
-            "<strong>Lintasan (Path):</strong> Urutan simpul yang saling terhubung.",
-            "<strong>Siklus (Cycle):</strong> Lintasan yang berawal dan berakhir pada simpul yang sama.",
-            "<strong>Graf Terhubung (Connected Graph):</strong> Setiap pasangan simpul dapat dicapai.",
-        ],
-        "app_title": "Penerapan Teori Graf",
-        "app_list": [
-            "<strong>Jejaring Sosial:</strong> Memodelkan pertemanan dan struktur komunitas.",
-            "<strong>Logistik & Rute:</strong> Jalur terpendek, rute pengiriman, dan optimasi.",
-            "<strong>Jaringan Komputer:</strong> Memahami koneksi antar server dan perangkat.",
-            "<strong>Pembelajaran Mesin:</strong> Graph embedding, clustering, dan sistem rekomendasi.",
-        ],
-    },
-}
+with tracer.span("css") as span:
+    css = build_css(background_style, bg_is_dark)
+    st.markdown(css, unsafe_allow_html=True)
+    span.set(bytes=len(css.encode()))
 
 lang = "English"  # atau "Bahasa Indonesia"
 c = content[lang]
@@ -259,3 +194,4 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
+show_trace(tracer, trace_texts)
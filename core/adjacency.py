@@ -0,0 +1,97 @@
+"""Sparse (CSR) adjacency matrices, windowed views and streaming exports.
+
+A dense ``n x n`` matrix is never built: the viewer pulls one row/column block
+at a time and the exporters walk the CSR structure in row chunks, so memory
+stays proportional to the number of edges plus one chunk.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import scipy.sparse as sp
+
+# Rows per chunk when streaming exports; keeps each dense CSV block small.
+CHUNK_ROWS = 1024
+
+
+def build_csr(src: np.ndarray, dst: np.ndarray, num_vertices: int, dtype=np.int8) -> sp.csr_matrix:
+    """Build the symmetric CSR adjacency matrix of an undirected edge list."""
+    import scipy.sparse as sp
+
+    n = int(num_vertices)
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    # Mirror every edge except self-loops, which sit on the diagonal once.
+    off = src != dst
+    rows = np.concatenate([src, dst[off]])
+    cols = np.concatenate([dst, src[off]])
+    data = np.ones(rows.size, dtype=dtype)
+    return sp.coo_matrix((data, (rows, cols)), shape=(n, n)).tocsr()
+
+
+def adjacency_window(A: sp.csr_matrix, row_start: int, col_start: int,
+                     rows: int, cols: int) -> np.ndarray:
+    """Return the dense block ``A[row_start:row_start+rows, col_start:col_start+cols]``."""
+    n_rows, n_cols = A.shape
+    r0 = min(max(int(row_start), 0), n_rows)
+    c0 = min(max(int(col_start), 0), n_cols)
+    r1 = min(r0 + int(rows), n_rows)
+    c1 = min(c0 + int(cols), n_cols)
+    return A[r0:r1, c0:c1].toarray()
+
+
+def iter_matrix_market(A: sp.csr_matrix, chunk_rows: int = CHUNK_ROWS):
+    """Yield a Matrix Market (coordinate, symmetric) file in byte chunks.
+
+    Only the lower triangle is written, as the symmetric format requires.
+    """
+    import scipy.sparse as sp
+
+    n = A.shape[0]
+    nnz_lower = int(sp.tril(A).nnz)
+    field = "integer" if np.issubdtype(A.dtype, np.integer) else "real"
+    yield (f"%%MatrixMarket matrix coordinate {field} symmetric\n"
+           f"{n} {n} {nnz_lower}\n").encode()
+
+    for r0 in range(0, n, chunk_rows):
+        block = A[r0:r0 + chunk_rows].tocoo()
+        rows = block.row + r0
+        keep = block.col <= rows
+        if not keep.any():
+            continue
+        entries = np.column_stack([rows[keep] + 1, block.col[keep] + 1, block.data[keep]])
+        buffer = BytesIO()
+        np.savetxt(buffer, entries, fmt="%d" if field == "integer" else "%.17g")
+        yield buffer.getvalue()
+
+
+def iter_csv(A: sp.csr_matrix, labels=None, chunk_rows: int = CHUNK_ROWS):
+    """Yield the dense matrix as CSV in byte chunks of ``chunk_rows`` rows.
+
+    The output itself is n² cells, but only one block is densified at a time.
+    """
+    n = A.shape[0]
+    labels = np.arange(1, n + 1) if labels is None else np.asarray(labels)
+    yield ("," + ",".join(map(str, labels)) + "\n").encode()
+
+    for r0 in range(0, n, chunk_rows):
+        block = A[r0:r0 + chunk_rows].toarray()
+        lines = [
+            f"{label}," + ",".join(map(str, row))
+            for label, row in zip(labels[r0:r0 + chunk_rows], block.tolist())
+        ]
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def npz_bytes(A: sp.csr_matrix) -> bytes:
+    """Serialize the CSR arrays to compressed ``.npz`` bytes (``scipy.sparse.load_npz``)."""
+    import scipy.sparse as sp
+
+    buffer = BytesIO()
+    sp.save_npz(buffer, A.tocsr(), compressed=True)
+    return buffer.getvalue()
@@ -0,0 +1,127 @@
+"""Display-sized, pre-encoded image assets.
+
+Source images are decoded, resized and encoded once; the bytes are stored in
+a disk cache keyed by the source path, size and modification time and the
+output width, format and quality, and kept
+in memory as ready-to-inline data URIs.  A page render then only stats the
+source file and looks the result up, without touching PIL.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from io import BytesIO
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "assets"
+CACHE_VERSION = 1
+# Member cards are at most 320 CSS px wide; twice that stays sharp on HiDPI.
+DISPLAY_WIDTH = 640
+QUALITY = 82
+# Preferred encodings, best first; WebP needs a Pillow built with libwebp.
+FORMATS = ("WEBP", "JPEG")
+MIME_TYPES = {"WEBP": "image/webp", "JPEG": "image/jpeg"}
+
+
+def _has_webp() -> bool:
+    # The probe ``PIL.features`` uses, without importing ``PIL.Image`` first.
+    try:
+        import PIL._webp  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def encoder_format() -> str:
+    """First entry of ``FORMATS`` this Pillow build can write."""
+    for fmt in FORMATS:
+        if fmt != "WEBP" or _has_webp():
+            return fmt
+    return "JPEG"
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    data: bytes
+    mime: str
+    width: int
+    height: int
+
+    @cached_property
+    def data_uri(self) -> str:
+        return f"data:{self.mime};base64,{base64.b64encode(self.data).decode()}"
+
+
+def encode_image(path, width: int = DISPLAY_WIDTH, fmt: str = "JPEG",
+                 quality: int = QUALITY) -> EncodedImage:
+    """Decode ``path``, shrink it to at most ``width`` pixels wide and encode it."""
+    from PIL import Image, ImageOps
+
+    with Image.open(path) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.width > width:
+            img = img.resize((width, round(img.height * width / img.width)), Image.LANCZOS)
+        if img.mode not in ("RGB", "L") and not (fmt == "WEBP" and img.mode == "RGBA"):
+            img = img.convert("RGB")
+        buffer = BytesIO()
+        img.save(buffer, format=fmt, quality=quality, optimize=fmt == "JPEG", method=4)
+        return EncodedImage(buffer.getvalue(), MIME_TYPES[fmt], img.width, img.height)
+
+
+class ImageCache:
+    """Encoded thumbnails in memory, backed by files in ``cache_dir``.
+
+    Each entry is the encoded file plus a small JSON record of its type and
+    size, so a disk hit reads two files and never imports PIL.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, width: int = DISPLAY_WIDTH, quality: int = QUALITY,
+                 fmt: str | None = None):
+        self.cache_dir = Path(cache_dir)
+        self.width = width
+        self.quality = quality
+        self.fmt = fmt or encoder_format()
+        self._images = {}
+        self._lock = threading.Lock()
+
+    def _key(self, path: Path) -> str:
+        stat = path.stat()
+        raw = (f"{CACHE_VERSION}|{path}|{stat.st_size}|{stat.st_mtime_ns}|"
+               f"{self.width}|{self.fmt}|{self.quality}")
+        return hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+
+    def get(self, path) -> EncodedImage:
+        """Thumbnail of ``path``; re-encoded only when the source file changed."""
+        path = Path(path).resolve()
+        key = self._key(path)
+        image = self._images.get(key)
+        if image is not None:
+            return image
+
+        with self._lock:
+            image = self._images.get(key) or self._load(path, key)
+            self._images[key] = image
+        return image
+
+    def _load(self, path: Path, key: str) -> EncodedImage:
+        record = self.cache_dir / f"{key}.json"
+        if record.exists():
+            meta = json.loads(record.read_text())
+            data = (self.cache_dir / meta["file"]).read_bytes()
+            return EncodedImage(data, meta["mime"], meta["width"], meta["height"])
+
+        image = encode_image(path, self.width, self.fmt, self.quality)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        name = f"{key}.{self.fmt.lower()}"
+        meta = {"file": name, "mime": image.mime, "width": image.width, "height": image.height}
+        # The record is written last, so it only exists once the image does.
+        for target, payload in ((self.cache_dir / name, image.data),
+                                (record, json.dumps(meta).encode())):
+            tmp = target.with_name(f"{target.name}.tmp-{os.getpid()}")
+            tmp.write_bytes(payload)
+            os.replace(tmp, target)
+        return image
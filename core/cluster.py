@@ -0,0 +1,95 @@
+"""Hierarchical grid clustering of map points per zoom level (supercluster-style).
+
+Points are projected to Web Mercator in ``[0, 1]``.  Level ``max_zoom + 1``
+holds the individual points; each coarser zoom merges the previous level on
+a grid whose cell is ``radius_px`` screen pixels wide at that zoom, placing
+every cluster at the count-weighted centroid of its members.  A query then
+returns only the clusters of one zoom level inside a bounding box, so the
+map never carries more than about one feature per grid cell on screen.
+"""
+
+import numpy as np
+
+# Pixel width of a map tile; a cell spans radius_px / (TILE_PX * 2**zoom).
+TILE_PX = 256
+MIN_ZOOM = 0
+MAX_ZOOM = 16
+RADIUS_PX = 60
+# Web Mercator is undefined at the poles; clamp like Leaflet does.
+MAX_LATITUDE = 85.0511287798
+
+
+def project(lat, lon) -> tuple[np.ndarray, np.ndarray]:
+    """Web Mercator ``(x, y)`` in ``[0, 1]`` with ``y`` growing southwards."""
+    lat = np.clip(np.asarray(lat, dtype=float), -MAX_LATITUDE, MAX_LATITUDE)
+    x = np.asarray(lon, dtype=float) / 360 + 0.5
+    sin = np.sin(np.radians(lat))
+    y = 0.5 - 0.25 * np.log((1 + sin) / (1 - sin)) / np.pi
+    return x, np.clip(y, 0, 1)
+
+
+def unproject(x, y) -> tuple[np.ndarray, np.ndarray]:
+    """Inverse of :func:`project`."""
+    lon = (np.asarray(x) - 0.5) * 360
+    lat = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * np.asarray(y)))))
+    return lat, lon
+
+
+class ClusterIndex:
+    """Per-zoom cluster levels; built once per dataset and then only queried."""
+
+    def __init__(self, lat, lon, min_zoom: int = MIN_ZOOM, max_zoom: int = MAX_ZOOM,
+                 radius_px: int = RADIUS_PX):
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        x, y = project(lat, lon)
+        n = x.size
+        # Each level is (x, y, count, point): ``point`` is the source row for
+        # single-point clusters and -1 for merged ones.
+        level = (x, y, np.ones(n, dtype=np.int64), np.arange(n, dtype=np.int64))
+        self.levels = {max_zoom + 1: level}
+        for zoom in range(max_zoom, min_zoom - 1, -1):
+            level = self._merge(*level, radius_px / (TILE_PX * 2 ** zoom))
+            self.levels[zoom] = level
+
+    @staticmethod
+    def _merge(x, y, count, point, cell: float):
+        cells = int(np.ceil(1 / cell))
+        cx = np.minimum((x / cell).astype(np.int64), cells - 1)
+        cy = np.minimum((y / cell).astype(np.int64), cells - 1)
+        _, group, sizes = np.unique(cy * cells + cx, return_inverse=True, return_counts=True)
+        total = np.bincount(group, weights=count)
+        merged_x = np.bincount(group, weights=x * count) / total
+        merged_y = np.bincount(group, weights=y * count) / total
+        merged_point = np.full(sizes.size, -1, dtype=np.int64)
+        # A cell holding a single entry keeps it unchanged (possibly a point).
+        alone = (sizes == 1)[group]
+        merged_point[group[alone]] = point[alone]
+        return merged_x, merged_y, total.astype(np.int64), merged_point
+
+    def clusters(self, zoom: int, bounds=None):
+        """``(lat, lon, count, point)`` of the clusters shown at ``zoom``.
+
+        ``bounds`` is ``((south, west), (north, east))`` in degrees; clusters
+        outside it are left out.  ``point`` is the source row for unmerged
+        points and -1 for clusters.
+        """
+        zoom = int(np.clip(zoom, self.min_zoom, self.max_zoom + 1))
+        x, y, count, point = self.levels[zoom]
+        if bounds is not None:
+            (south, west), (north, east) = bounds
+            _, y1 = project(south, 0)
+            _, y0 = project(north, 0)
+            keep = (y >= y0) & (y <= y1)
+            if east - west < 360:
+                # Leaflet reports wrapped longitudes beyond +-180.
+                x0 = ((west + 180) % 360) / 360
+                x1 = ((east + 180) % 360) / 360
+                if x0 <= x1:
+                    keep &= (x >= x0) & (x <= x1)
+                else:
+                    # The box crosses the antimeridian.
+                    keep &= (x >= x0) | (x <= x1)
+            x, y, count, point = x[keep], y[keep], count[keep], point[keep]
+        lat, lon = unproject(x, y)
+        return lat, lon, count, point
@@ -0,0 +1,113 @@
+"""Sparse connection networks over a location set.
+
+Instead of the complete graph (O(n²) lines) a map can show the Delaunay
+triangulation, the minimum spanning tree or the k-nearest-neighbour graph,
+each with O(n) edges and computed in O(n log n).  The triangulation is taken
+on the sphere: points are stereographically projected from the antipode of
+their centroid, which maps circles to circles, so the planar Delaunay
+triangulation of the projection is the spherical one.  The geodesic minimum
+spanning tree is a subgraph of it and is found there.
+"""
+
+import numpy as np
+
+from core.distance import pairwise
+from core.spatial import SpatialIndex, to_unit_xyz
+
+MODES = ("complete", "mst", "delaunay", "knn")
+
+
+def _unique_pairs(src: np.ndarray, dst: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    src, dst = np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
+    keep = src != dst
+    lo, hi = np.minimum(src, dst)[keep], np.maximum(src, dst)[keep]
+    width = int(hi.max()) + 1 if hi.size else 1
+    # Sort and mask instead of np.unique: one in-place sort, no hash table.
+    pairs = lo * width + hi
+    pairs.sort()
+    if pairs.size:
+        pairs = pairs[np.concatenate([[True], pairs[1:] != pairs[:-1]])]
+    return pairs // width, pairs % width
+
+
+def stereographic(lat, lon) -> np.ndarray:
+    """Conformal plane coordinates (n, 2) centred on the points' centroid."""
+    xyz = to_unit_xyz(lat, lon)
+    center = xyz.mean(axis=0)
+    norm = np.linalg.norm(center)
+    center = center / norm if norm > 1e-9 else np.array([0.0, 0.0, 1.0])
+    # Any two unit vectors orthogonal to the centre span the tangent plane.
+    helper = np.array([1.0, 0.0, 0.0]) if abs(center[0]) < 0.9 else np.array([0.0, 1.0, 0.0])
+    u = np.cross(center, helper)
+    u /= np.linalg.norm(u)
+    v = np.cross(center, u)
+    scale = 1 + xyz @ center
+    return np.column_stack([xyz @ u, xyz @ v]) / np.maximum(scale, 1e-12)[:, None]
+
+
+def delaunay_edges(lat, lon) -> tuple[np.ndarray, np.ndarray]:
+    """Edges of the spherical Delaunay triangulation, each once with ``src < dst``.
+
+    Qhull drops repeated points, so the triangulation is taken over distinct
+    coordinates and every repeat is linked to the first point at its
+    location by a zero-length edge.
+    """
+    lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+    _, first, inverse = np.unique(np.column_stack([lat, lon]), axis=0,
+                                  return_index=True, return_inverse=True)
+    inverse = inverse.ravel()
+    src, dst = _distinct_delaunay_edges(lat[first], lon[first])
+    repeat = np.flatnonzero(first[inverse] != np.arange(lat.size))
+    return _unique_pairs(np.concatenate([first[src], first[inverse[repeat]]]),
+                         np.concatenate([first[dst], repeat]))
+
+
+def _distinct_delaunay_edges(lat: np.ndarray, lon: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import minimum_spanning_tree
+    from scipy.spatial import Delaunay, QhullError
+
+    n = np.size(lat)
+    if n < 3:
+        src, dst = np.triu_indices(n, k=1)
+        return src.astype(np.int64), dst.astype(np.int64)
+    try:
+        simplices = Delaunay(stereographic(lat, lon)).simplices
+    except QhullError:
+        # All points on one great circle: the triangulation degenerates to a
+        # path, which the spanning tree of the complete graph gives exactly.
+        src, dst = np.triu_indices(n, k=1)
+        dist = np.zeros((n, n))
+        dist[src, dst] = pairwise(lat[src], lon[src], lat[dst], lon[dst]) + 1e-12
+        tree = minimum_spanning_tree(sp.csr_matrix(dist)).tocoo()
+        return _unique_pairs(tree.row, tree.col)
+    src = simplices[:, [0, 1, 2]].ravel()
+    dst = simplices[:, [1, 2, 0]].ravel()
+    return _unique_pairs(src, dst)
+
+
+def spanning_tree_edges(lat, lon, method: str = "vincenty") -> tuple[np.ndarray, np.ndarray]:
+    """Geodesic minimum spanning tree, found on the Delaunay edges."""
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import minimum_spanning_tree
+
+    n = np.size(lat)
+    src, dst = delaunay_edges(lat, lon)
+    # Zero weights would be dropped by csgraph; the offset keeps the zero-length
+    # edges that join repeated coordinates.
+    weight = pairwise(lat[src], lon[src], lat[dst], lon[dst], method=method) + 1e-12
+    tree = minimum_spanning_tree(sp.csr_matrix((weight, (src, dst)), shape=(n, n))).tocoo()
+    return _unique_pairs(tree.row, tree.col)
+
+
+def connection_edges(mode: str, lat, lon, k: int = 3) -> tuple[np.ndarray, np.ndarray]:
+    """Edges for one of the sparse ``MODES`` (``"complete"`` is not sparse)."""
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    if mode == "delaunay":
+        return delaunay_edges(lat, lon)
+    if mode == "mst":
+        return spanning_tree_edges(lat, lon)
+    if mode == "knn":
+        return SpatialIndex(lat, lon).knn_edges(k)
+    raise ValueError(f"Unknown sparse connection mode {mode!r}; expected one of {MODES[1:]}")
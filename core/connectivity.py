@@ -0,0 +1,130 @@
+"""Connected components, bridges and articulation points on edge arrays.
+
+Components use a vectorized union-find (hooking plus pointer jumping over all
+edges at once).  Bridges and articulation points use Tarjan's low-link
+algorithm with an explicit stack, so deep graphs cannot hit Python's
+recursion limit.
+"""
+
+import numpy as np
+
+
+def component_labels(src: np.ndarray, dst: np.ndarray, num_vertices: int) -> np.ndarray:
+    """Label each vertex with its component id ``0 .. k-1`` (ordered by smallest vertex)."""
+    n = int(num_vertices)
+    parent = np.arange(n, dtype=np.int64)
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+
+    while True:
+        ps, pd = parent[src], parent[dst]
+        lo, hi = np.minimum(ps, pd), np.maximum(ps, pd)
+        mask = lo != hi
+        if not mask.any():
+            break
+        # Every parent is a root after the jumping below, so this hooks roots
+        # onto smaller roots and can never create a cycle.
+        np.minimum.at(parent, hi[mask], lo[mask])
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+        src, dst = src[mask], dst[mask]
+
+    _, labels = np.unique(parent, return_inverse=True)
+    return labels
+
+
+def _incidence(src: np.ndarray, dst: np.ndarray, n: int):
+    """CSR-style neighbour lists that also carry the id of each edge."""
+    ends = np.concatenate([src, dst])
+    others = np.concatenate([dst, src])
+    edge_ids = np.tile(np.arange(len(src)), 2)
+    order = np.argsort(ends, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(ends, minlength=n), out=indptr[1:])
+    return indptr, others[order], edge_ids[order]
+
+
+def bridges_and_articulation_points(src: np.ndarray, dst: np.ndarray, num_vertices: int):
+    """Return ``(bridge_edge_ids, articulation_vertices)`` as sorted arrays.
+
+    Parallel edges are handled by skipping the tree edge by id rather than by
+    parent vertex, so a doubled edge is never reported as a bridge.
+    """
+    n = int(num_vertices)
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    indptr, neighbours, edge_ids = _incidence(src, dst, n)
+
+    # Plain lists are much faster than NumPy scalars in the Python loop.
+    neighbours = neighbours.tolist()
+    edge_ids = edge_ids.tolist()
+    nxt = indptr[:-1].tolist()
+    end = indptr[1:].tolist()
+
+    disc = [-1] * n
+    low = [0] * n
+    parent_edge = [-1] * n
+    is_cut = [False] * n
+    bridges = []
+    clock = 0
+
+    for root in range(n):
+        if disc[root] != -1:
+            continue
+        disc[root] = low[root] = clock
+        clock += 1
+        root_children = 0
+        stack = [root]
+
+        while stack:
+            v = stack[-1]
+            i = nxt[v]
+            if i < end[v]:
+                nxt[v] = i + 1
+                e = edge_ids[i]
+                if e == parent_edge[v]:
+                    continue
+                w = neighbours[i]
+                if disc[w] == -1:
+                    parent_edge[w] = e
+                    disc[w] = low[w] = clock
+                    clock += 1
+                    stack.append(w)
+                    if v == root:
+                        root_children += 1
+                elif disc[w] < low[v]:
+                    low[v] = disc[w]
+            else:
+                stack.pop()
+                if not stack:
+                    break
+                u = stack[-1]
+                if low[v] < low[u]:
+                    low[u] = low[v]
+                if low[v] > disc[u]:
+                    bridges.append(parent_edge[v])
+                if u != root and low[v] >= disc[u]:
+                    is_cut[u] = True
+
+        if root_children > 1:
+            is_cut[root] = True
+
+    return np.sort(np.asarray(bridges, dtype=np.int64)), np.flatnonzero(is_cut)
+
+
+def analyze_connectivity(src: np.ndarray, dst: np.ndarray, num_vertices: int) -> dict:
+    """Component labels and sizes, bridges and articulation points in one dict."""
+    labels = component_labels(src, dst, num_vertices)
+    sizes = np.bincount(labels) if labels.size else np.empty(0, dtype=np.int64)
+    bridges, cut_vertices = bridges_and_articulation_points(src, dst, num_vertices)
+    return {
+        "labels": labels,
+        "sizes": sizes,
+        "num_components": int(sizes.size),
+        "largest_component": int(sizes.max()) if sizes.size else 0,
+        "bridges": bridges,
+        "articulation_points": cut_vertices,
+    }
@@ -0,0 +1,220 @@
+"""Location datasets (name, latitude, longitude) backed by a columnar disk cache.
+
+CSV, Parquet and GeoJSON sources are parsed once and written to a cache
+directory as ``.npy`` columns plus a UTF-8 name blob.  Opening a dataset
+afterwards memory-maps those files, so it takes milliseconds, never re-parses
+text, and every session in the process shares the same pages of memory.
+The cache is keyed by the source path, size and modification time.
+"""
+
+import hashlib
+import json
+import os
+from bisect import bisect_left
+from pathlib import Path
+
+import numpy as np
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "datasets"
+FORMATS = (".csv", ".parquet", ".geojson", ".json")
+CACHE_VERSION = 1
+
+NAME_COLUMNS = ("name", "nama", "city", "kota", "label", "id")
+LAT_COLUMNS = ("lat", "latitude", "y")
+LON_COLUMNS = ("lon", "lng", "long", "longitude", "x")
+
+# Rows per chunk when reading CSV files.
+CSV_CHUNK_ROWS = 200_000
+
+
+class LocationDataset:
+    """Read-only columns ``lat``/``lon`` with names addressed by row index."""
+
+    def __init__(self, key: str, lat: np.ndarray, lon: np.ndarray,
+                 name_blob: np.ndarray, name_offsets: np.ndarray, name_order: np.ndarray):
+        self.key = key
+        self.lat = lat
+        self.lon = lon
+        self._blob = name_blob
+        self._offsets = name_offsets
+        self._order = name_order
+        self._names = None
+
+    def __len__(self) -> int:
+        return self.lat.size
+
+    def name(self, i: int) -> str:
+        # Offsets include the newline separator after each name.
+        start, end = self._offsets[i], self._offsets[i + 1] - 1
+        return self._blob[start:end].tobytes().decode("utf-8")
+
+    def names(self) -> list[str]:
+        """All names, decoded once and kept for later calls."""
+        if self._names is None:
+            self._names = self._blob.tobytes().decode("utf-8").split("\n")[:len(self)]
+        return self._names
+
+    def _lower_bound(self, name: str) -> int:
+        """Position of the first name not below ``name`` in the sorted name order."""
+        return bisect_left(range(len(self)), name, key=lambda k: self.name(self._order[k]))
+
+    def find(self, name: str) -> int | None:
+        """Row of ``name`` by binary search over the sorted name order."""
+        pos = self._lower_bound(name)
+        if pos < len(self) and self.name(self._order[pos]) == name:
+            return int(self._order[pos])
+        return None
+
+    def search(self, prefix: str, limit: int) -> list[int]:
+        """Rows of the first ``limit`` names starting with ``prefix``, in name order.
+
+        Uses the same binary search as ``find``, so it costs O(log n + limit)
+        name decodes whatever the dataset size.
+        """
+        rows = []
+        start = self._lower_bound(prefix)
+        for pos in range(start, min(start + limit, len(self))):
+            row = int(self._order[pos])
+            if not self.name(row).startswith(prefix):
+                break
+            rows.append(row)
+        return rows
+
+    def coords(self, i: int) -> tuple[float, float]:
+        return float(self.lat[i]), float(self.lon[i])
+
+    def center(self) -> tuple[float, float]:
+        """Midpoint of the bounding box, used to centre maps."""
+        if len(self) == 0:
+            return 0.0, 0.0
+        return (float(self.lat.min() + self.lat.max()) / 2,
+                float(self.lon.min() + self.lon.max()) / 2)
+
+    @classmethod
+    def from_arrays(cls, names, lat, lon, key: str | None = None) -> "LocationDataset":
+        """In-memory dataset, e.g. for a small built-in point set."""
+        columns = _encode(list(map(str, names)), lat, lon)
+        if key is None:
+            digest = hashlib.blake2b(digest_size=8)
+            for column in columns.values():
+                digest.update(np.ascontiguousarray(column).tobytes())
+            key = digest.hexdigest()
+        return cls(key, **columns)
+
+
+def _encode(names: list, lat, lon) -> dict:
+    """Columnar representation shared by the cache writer and ``from_arrays``.
+
+    Names are joined with newlines into one byte blob; ``name_offsets[i]`` is
+    where name ``i`` starts and ``name_offsets[n]`` is ``len(blob) + 1``.
+    """
+    encoded = [name.replace("\n", " ").encode("utf-8") for name in names]
+    lengths = np.fromiter((len(b) + 1 for b in encoded), dtype=np.int64, count=len(encoded))
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return {
+        "lat": np.asarray(lat, dtype=np.float64),
+        "lon": np.asarray(lon, dtype=np.float64),
+        "name_blob": np.frombuffer(b"\n".join(encoded), dtype=np.uint8),
+        "name_offsets": offsets,
+        "name_order": np.argsort(np.array(names, dtype=object), kind="stable").astype(np.int64),
+    }
+
+
+def _pick(columns, candidates, kind: str) -> str:
+    lowered = {str(c).lower(): c for c in columns}
+    for candidate in candidates:
+        if candidate in lowered:
+            return lowered[candidate]
+    raise ValueError(f"No {kind} column found; expected one of {candidates}, got {list(columns)}")
+
+
+def _read_table(path: Path):
+    """Return ``(names, lat, lon)`` parsed from a CSV, Parquet or GeoJSON file."""
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        import pandas as pd
+
+        header = pd.read_csv(path, nrows=0).columns
+        cols = [_pick(header, NAME_COLUMNS, "name"), _pick(header, LAT_COLUMNS, "latitude"),
+                _pick(header, LON_COLUMNS, "longitude")]
+        names, lat, lon = [], [], []
+        for chunk in pd.read_csv(path, usecols=cols, chunksize=CSV_CHUNK_ROWS):
+            names.extend(chunk[cols[0]].astype(str).tolist())
+            lat.append(chunk[cols[1]].to_numpy(dtype=np.float64))
+            lon.append(chunk[cols[2]].to_numpy(dtype=np.float64))
+        return names, np.concatenate(lat or [[]]), np.concatenate(lon or [[]])
+
+    if suffix == ".parquet":
+        import pandas as pd
+
+        import pyarrow.parquet as pq
+
+        header = pq.read_schema(path).names
+        cols = [_pick(header, NAME_COLUMNS, "name"), _pick(header, LAT_COLUMNS, "latitude"),
+                _pick(header, LON_COLUMNS, "longitude")]
+        table = pd.read_parquet(path, columns=cols)
+        return (table[cols[0]].astype(str).tolist(), table[cols[1]].to_numpy(dtype=np.float64),
+                table[cols[2]].to_numpy(dtype=np.float64))
+
+    if suffix in (".geojson", ".json"):
+        with open(path, encoding="utf-8") as fh:
+            features = json.load(fh).get("features", [])
+        names, lat, lon = [], [], []
+        for k, feature in enumerate(features):
+            geometry = feature.get("geometry") or {}
+            if geometry.get("type") != "Point":
+                continue
+            props = feature.get("properties") or {}
+            key = next((c for c in props if str(c).lower() in NAME_COLUMNS), None)
+            names.append(str(props[key]) if key is not None else str(k))
+            lon.append(geometry["coordinates"][0])
+            lat.append(geometry["coordinates"][1])
+        return names, np.asarray(lat, dtype=np.float64), np.asarray(lon, dtype=np.float64)
+
+    raise ValueError(f"Unsupported dataset format {suffix!r}; expected one of {FORMATS}")
+
+
+def cache_key(path) -> str:
+    """Identifier that changes whenever the source file changes."""
+    path = Path(path).resolve()
+    stat = path.stat()
+    raw = f"{CACHE_VERSION}|{path}|{stat.st_size}|{stat.st_mtime_ns}"
+    return hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+
+
+def _open_cache(directory: Path, key: str) -> LocationDataset:
+    columns = {
+        name: np.load(directory / f"{name}.npy", mmap_mode="r")
+        for name in ("lat", "lon", "name_blob", "name_offsets", "name_order")
+    }
+    return LocationDataset(key, **columns)
+
+
+def load_dataset(path, cache_dir=CACHE_DIR) -> LocationDataset:
+    """Open ``path`` through the columnar cache, converting it on first use."""
+    key = cache_key(path)
+    directory = Path(cache_dir) / key
+    if (directory / "meta.json").exists():
+        return _open_cache(directory, key)
+
+    names, lat, lon = _read_table(Path(path))
+    columns = _encode(names, lat, lon)
+
+    # Write into a temporary directory and rename, so a half-written cache
+    # is never picked up by a concurrent reader.
+    tmp = directory.with_name(f"{key}.tmp-{os.getpid()}")
+    tmp.mkdir(parents=True, exist_ok=True)
+    for name, column in columns.items():
+        np.save(tmp / f"{name}.npy", column)
+    with open(tmp / "meta.json", "w", encoding="utf-8") as fh:
+        json.dump({"source": str(Path(path).resolve()), "rows": len(names),
+                   "version": CACHE_VERSION}, fh)
+    try:
+        tmp.rename(directory)
+    except OSError:
+        # Another process finished first; use its copy.
+        for child in tmp.iterdir():
+            child.unlink()
+        tmp.rmdir()
+    return _open_cache(directory, key)
@@ -0,0 +1,62 @@
+"""Vectorized degree statistics computed from edge arrays."""
+
+import numpy as np
+
+# Rows shown per page of the full per-node table, and default top-k size.
+PAGE_SIZE = 100
+TOP_K = 10
+
+
+def degrees_from_edges(src: np.ndarray, dst: np.ndarray, num_vertices: int) -> np.ndarray:
+    """Degree of every vertex ``0 .. n-1``; a self-loop counts twice, as in NetworkX."""
+    n = int(num_vertices)
+    return (np.bincount(src, minlength=n) + np.bincount(dst, minlength=n)).astype(np.int64)
+
+
+def degree_summary(degrees: np.ndarray) -> dict:
+    """Return min, max, mean and (population) variance of the degree sequence."""
+    if degrees.size == 0:
+        return {"min": 0, "max": 0, "mean": 0.0, "variance": 0.0}
+    return {
+        "min": int(degrees.min()),
+        "max": int(degrees.max()),
+        "mean": float(degrees.mean()),
+        "variance": float(degrees.var()),
+    }
+
+
+def log_binned_histogram(degrees: np.ndarray, bins_per_decade: int = 5):
+    """Histogram with logarithmically growing integer bins.
+
+    Returns ``(lower, upper, counts)`` where bin ``i`` covers degrees in
+    ``[lower[i], upper[i])``.  Degree 0 always gets its own bin.
+    """
+    max_degree = int(degrees.max()) if degrees.size else 0
+    decades = np.log10(max_degree + 1) if max_degree > 0 else 0.0
+    steps = max(int(np.ceil(decades * bins_per_decade)), 1)
+    edges = np.unique(np.floor(np.logspace(0, decades, steps + 1)).astype(np.int64))
+    edges = np.concatenate([[0], edges[edges > 0]])
+    if edges[-1] <= max_degree:
+        edges = np.append(edges, max_degree + 1)
+
+    counts = np.bincount(np.searchsorted(edges, degrees, side="right") - 1,
+                         minlength=edges.size - 1)
+    return edges[:-1], edges[1:], counts[:edges.size - 1]
+
+
+def top_k(degrees: np.ndarray, k: int = TOP_K) -> tuple[np.ndarray, np.ndarray]:
+    """Indices and degrees of the ``k`` highest-degree vertices, highest first."""
+    k = min(int(k), degrees.size)
+    if k == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=degrees.dtype)
+    index = np.argpartition(-degrees, k - 1)[:k]
+    # Stable tie-break on vertex index keeps the table deterministic.
+    index = index[np.lexsort((index, -degrees[index]))]
+    return index, degrees[index]
+
+
+def degree_page(degrees: np.ndarray, page: int, page_size: int = PAGE_SIZE):
+    """Vertex indices and degrees for 1-based ``page`` of the per-node table."""
+    start = (max(int(page), 1) - 1) * page_size
+    index = np.arange(start, min(start + page_size, degrees.size))
+    return index, degrees[index]
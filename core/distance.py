@@ -0,0 +1,118 @@
+"""Vectorized great-circle and ellipsoidal distances between many points.
+
+``haversine`` treats the Earth as a sphere (fast, ~0.5% error).  ``vincenty``
+solves the inverse problem on the WGS-84 ellipsoid and agrees with
+``geopy.distance.geodesic`` to well under a metre; the rare nearly-antipodal
+pairs where its iteration does not converge fall back to haversine.
+Inputs are degrees, outputs kilometres.
+"""
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+# WGS-84 ellipsoid.
+WGS84_A = 6378.137
+WGS84_F = 1 / 298.257223563
+WGS84_B = WGS84_A * (1 - WGS84_F)
+
+METHODS = ("haversine", "vincenty")
+# Rows/columns per tile when filling large matrices.
+TILE = 2048
+
+
+def haversine(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distance with NumPy broadcasting."""
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def vincenty(lat1, lon1, lat2, lon2, max_iter: int = 200, tol: float = 1e-12) -> np.ndarray:
+    """Vincenty's inverse formula on WGS-84 with NumPy broadcasting."""
+    lat1, lon1, lat2, lon2 = (np.asarray(x, dtype=float) for x in (lat1, lon1, lat2, lon2))
+    f = WGS84_F
+    # Reduced latitudes depend on one point only; compute them before broadcasting.
+    U1 = np.arctan((1 - f) * np.tan(np.radians(lat1)))
+    U2 = np.arctan((1 - f) * np.tan(np.radians(lat2)))
+    sinU1, cosU1 = np.sin(U1), np.cos(U1)
+    sinU2, cosU2 = np.sin(U2), np.cos(U2)
+    L = np.radians(lon2 - lon1) + np.zeros_like(lat1 + lat2)
+
+    lam = L.copy()
+    converged = np.zeros(L.shape, dtype=bool)
+    for _ in range(max_iter):
+        sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+        sin_sigma = np.hypot(cosU2 * sin_lam, cosU1 * sinU2 - sinU1 * cosU2 * cos_lam)
+        cos_sigma = sinU1 * sinU2 + cosU1 * cosU2 * cos_lam
+        sigma = np.arctan2(sin_sigma, cos_sigma)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sin_alpha = np.where(sin_sigma == 0, 0.0, cosU1 * cosU2 * sin_lam / sin_sigma)
+            cos2_alpha = 1 - sin_alpha ** 2
+            cos_2sm = np.where(cos2_alpha == 0, 0.0, cos_sigma - 2 * sinU1 * sinU2 / cos2_alpha)
+        C = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+        lam_prev = lam
+        lam = L + (1 - C) * f * sin_alpha * (
+            sigma + C * sin_sigma * (cos_2sm + C * cos_sigma * (-1 + 2 * cos_2sm ** 2))
+        )
+        converged = np.abs(lam - lam_prev) < tol
+        if converged.all():
+            break
+
+    u2 = cos2_alpha * (WGS84_A ** 2 - WGS84_B ** 2) / WGS84_B ** 2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    delta_sigma = B * sin_sigma * (
+        cos_2sm + B / 4 * (cos_sigma * (-1 + 2 * cos_2sm ** 2)
+                           - B / 6 * cos_2sm * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sm ** 2))
+    )
+    distance = WGS84_B * A * (sigma - delta_sigma)
+    if not converged.all():
+        fallback = haversine(lat1, lon1, lat2, lon2) + np.zeros_like(distance)
+        distance = np.where(converged, distance, fallback)
+    return distance
+
+
+def pairwise(lat1, lon1, lat2, lon2, method: str = "haversine") -> np.ndarray:
+    """Distances between aligned point arrays with the chosen ``method``."""
+    if method == "haversine":
+        return haversine(lat1, lon1, lat2, lon2)
+    if method == "vincenty":
+        return vincenty(lat1, lon1, lat2, lon2)
+    raise ValueError(f"Unknown distance method {method!r}; expected one of {METHODS}")
+
+
+def iter_distance_tiles(lat, lon, method: str = "haversine", tile: int = TILE,
+                        upper: bool = False):
+    """Yield ``(row_start, col_start, block)`` tiles of the full distance matrix.
+
+    Only one ``tile x tile`` block is alive at a time, so reductions such as
+    nearest neighbours can run over large point sets in bounded memory.  With
+    ``upper=True`` only tiles on or above the diagonal are produced.
+    """
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    n = lat.size
+    for r0 in range(0, n, tile):
+        rows = slice(r0, r0 + tile)
+        for c0 in range(r0 if upper else 0, n, tile):
+            cols = slice(c0, c0 + tile)
+            block = pairwise(lat[rows, None], lon[rows, None], lat[None, cols], lon[None, cols], method)
+            yield r0, c0, block
+
+
+def distance_matrix(lat, lon, method: str = "haversine", tile: int = TILE,
+                    dtype=np.float64, out: np.ndarray | None = None) -> np.ndarray:
+    """Full symmetric ``n x n`` distance matrix in km, filled tile by tile.
+
+    Pass ``out`` (for example a ``np.memmap``) to keep the result off the heap.
+    """
+    n = np.asarray(lat).size
+    if out is None:
+        out = np.empty((n, n), dtype=dtype)
+    for r0, c0, block in iter_distance_tiles(lat, lon, method, tile, upper=True):
+        out[r0:r0 + block.shape[0], c0:c0 + block.shape[1]] = block
+        if c0 != r0:
+            out[c0:c0 + block.shape[1], r0:r0 + block.shape[0]] = block.T
+    np.fill_diagonal(out, 0)
+    return out
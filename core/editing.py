@@ -0,0 +1,394 @@
+"""Incremental editing of a graph: add and remove vertices and edges.
+
+A ``GraphEditor`` starts from an edge list with its degrees, component labels
+and layout, and keeps all of them up to date per edit instead of recomputing:
+
+* degrees change by one at each endpoint;
+* adjacency is the original CSR matrix plus a small overlay of added
+  neighbours and removed edge keys, so a lookup costs one CSR row;
+* components merge on ``add_edge`` by relabelling the smaller one (union by
+  size).  On ``remove_edge`` two breadth-first searches from the endpoints
+  run in turns.  They stop when they meet; if one runs out first, its side
+  was cut off and gets a new label, at a cost bounded by the smaller side;
+* layout: the touched vertices take a few force steps among their
+  neighbours while everything else stays put.
+
+Vertices keep a stable internal id for their lifetime.  Removing a vertex
+moves the last vertex into its place, so the exposed numbering stays
+``0 .. n-1``.  ``snapshot()`` materialises the current arrays for the page with
+vectorized operations, once per edited version; bridges and articulation
+points have no cheap update and are recomputed there.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.layout import random_layout, relax_local
+
+# Edge keys are ``lo * KEY_BASE + hi`` over stable ids, however many vertices are added.
+KEY_BASE = 1 << 32
+EDIT_OPERATIONS = ("add_edge", "remove_edge", "add_vertex", "remove_vertex")
+
+
+@dataclass
+class GraphSnapshot:
+    src: np.ndarray
+    dst: np.ndarray
+    num_vertices: int
+    degrees: np.ndarray
+    # Component of every vertex, 0 .. k-1 in order of the smallest vertex.
+    components: np.ndarray
+    positions: np.ndarray
+    labels: np.ndarray
+
+
+def _grow(array: np.ndarray, size: int) -> np.ndarray:
+    """``array`` with at least ``size`` rows, doubling so appends are amortized O(1)."""
+    if size <= len(array):
+        return array
+    grown = np.zeros((max(size, 2 * len(array)), *array.shape[1:]), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class GraphEditor:
+    """Mutable simple undirected graph with incrementally maintained metrics.
+
+    Public methods take and return vertex positions ``0 .. n-1``; the layout
+    is the one named ``layout`` when editing started.
+    """
+
+    def __init__(self, src: np.ndarray, dst: np.ndarray, num_vertices: int, degrees=None,
+                 components=None, positions=None, labels=None, layout: str = "force", seed=None):
+        from core.adjacency import build_csr
+        from core.connectivity import component_labels
+        from core.degree import degrees_from_edges
+
+        n = int(num_vertices)
+        self.layout = layout
+        self.version = 0
+        self._rng = np.random.default_rng(seed)
+        self._n = n
+        self._next = n
+        self._stable = np.arange(n, dtype=np.int64)
+        self._current = np.arange(n, dtype=np.int64)
+
+        lo = np.minimum(src, dst).astype(np.int64)
+        hi = np.maximum(src, dst).astype(np.int64)
+        self._base_keys = np.sort(lo * KEY_BASE + hi)
+        self._base = build_csr(src, dst, n)
+        self._base.sort_indices()
+        self._base_n = n
+        self._added = {}
+        self._removed = set()
+        self.num_edges = len(self._base_keys)
+
+        if degrees is None:
+            degrees = degrees_from_edges(src, dst, n)
+        self._degrees = np.array(degrees, dtype=np.int64)
+        if components is None:
+            components = component_labels(src, dst, n)
+        self._components = np.array(components, dtype=np.int64)
+        self._sizes = dict(enumerate(np.bincount(self._components, minlength=0).tolist()))
+        self._next_component = len(self._sizes)
+        # Members per component as lists of id arrays; entries go stale when a
+        # vertex is relabelled, so readers filter on ``_components``.
+        order = np.argsort(self._components, kind="stable")
+        bounds = np.cumsum(np.bincount(self._components))
+        self._members = {c: [chunk] for c, chunk in enumerate(np.split(order, bounds[:-1]))
+                         if chunk.size}
+        self._positions = (random_layout(n, seed) if positions is None
+                           else np.array(positions, dtype=float))
+        self._labels = np.arange(1, n + 1) if labels is None else np.asarray(labels).copy()
+        if self._labels.dtype.kind in "US":
+            # Fixed-width strings would truncate the names of added vertices.
+            self._labels = self._labels.astype(object)
+        self._snapshot = None
+        self._connectivity = None
+
+    # ---------------- lookups ----------------
+    @property
+    def num_vertices(self) -> int:
+        return self._n
+
+    def _id(self, vertex) -> int:
+        vertex = int(vertex)
+        if not 0 <= vertex < self._n:
+            raise IndexError(f"Vertex {vertex} out of range 0..{self._n - 1}")
+        return int(self._stable[vertex])
+
+    def _neighbours(self, a: int) -> list:
+        """Stable neighbours of stable id ``a``."""
+        found = []
+        if a < self._base_n:
+            row = self._base.indices[self._base.indptr[a]:self._base.indptr[a + 1]]
+            if self._removed:
+                found = [b for b in row.tolist()
+                         if min(a, b) * KEY_BASE + max(a, b) not in self._removed]
+            else:
+                found = row.tolist()
+        return found + list(self._added.get(a, ()))
+
+    def _has(self, a: int, b: int) -> bool:
+        if b in self._added.get(a, ()):
+            return True
+        if a >= self._base_n or b >= self._base_n:
+            return False
+        if min(a, b) * KEY_BASE + max(a, b) in self._removed:
+            return False
+        row = self._base.indices[self._base.indptr[a]:self._base.indptr[a + 1]]
+        i = np.searchsorted(row, b)
+        return bool(i < row.size and row[i] == b)
+
+    def has_edge(self, u, v) -> bool:
+        return self._has(self._id(u), self._id(v))
+
+    def neighbors(self, u) -> np.ndarray:
+        return self._current[np.asarray(self._neighbours(self._id(u)), dtype=np.int64)]
+
+    def find(self, label) -> int | None:
+        """Position of the vertex named ``label`` (compared as text), or ``None``."""
+        names = self._labels[self._stable[:self._n]]
+        if names.dtype.kind in "iu":
+            try:
+                hits = np.flatnonzero(names == int(label))
+            except ValueError:
+                return None
+        else:
+            hits = np.flatnonzero(names.astype(str) == str(label))
+        return int(hits[0]) if hits.size else None
+
+    # ---------------- components ----------------
+    def _component_members(self, c: int) -> np.ndarray:
+        ids = np.concatenate(self._members[c])
+        ids = ids[self._components[ids] == c]
+        self._members[c] = [ids]
+        return ids
+
+    def _merge(self, a: int, b: int):
+        ca, cb = int(self._components[a]), int(self._components[b])
+        if ca == cb:
+            return
+        if self._sizes[ca] < self._sizes[cb]:
+            ca, cb = cb, ca
+        # Relabel the smaller component into the larger one.
+        moved = self._component_members(cb)
+        self._components[moved] = ca
+        self._members[ca].extend(self._members.pop(cb))
+        self._sizes[ca] += self._sizes.pop(cb)
+
+    def _new_component(self, ids) -> int:
+        c = self._next_component
+        self._next_component += 1
+        ids = np.asarray(ids, dtype=np.int64)
+        old = int(self._components[ids[0]])
+        self._components[ids] = c
+        self._members[c] = [ids]
+        self._sizes[c] = len(ids)
+        self._sizes[old] -= len(ids)
+        if not self._sizes[old]:
+            del self._sizes[old], self._members[old]
+        return c
+
+    def _split_if_disconnected(self, a: int, b: int) -> bool:
+        """Search from ``a`` and ``b`` in turns; relabel the side that runs out first."""
+        seen = ({a}, {b})
+        queues = (deque([a]), deque([b]))
+        while True:
+            for side in (0, 1):
+                if not queues[side]:
+                    self._new_component(list(seen[side]))
+                    return True
+                vertex = queues[side].popleft()
+                for w in self._neighbours(vertex):
+                    if w in seen[1 - side]:
+                        return False
+                    if w not in seen[side]:
+                        seen[side].add(w)
+                        queues[side].append(w)
+
+    # ---------------- layout ----------------
+    def _relax(self, moving):
+        moving = list(dict.fromkeys(moving))
+        if not moving:
+            return
+        fixed, src, dst = [], [], []
+        index = {v: i for i, v in enumerate(moving)}
+        for v in moving:
+            for w in self._neighbours(v):
+                if w not in index:
+                    index[w] = len(moving) + len(fixed)
+                    fixed.append(w)
+                src.append(index[v])
+                dst.append(index[w])
+        rows = np.asarray(moving + fixed, dtype=np.int64)
+        k = 1.0 / np.sqrt(max(self._n, 1))
+        self._positions[moving] = relax_local(self._positions[rows], len(moving), src, dst, k)
+
+    # ---------------- edits ----------------
+    def _changed(self):
+        self.version += 1
+        self._snapshot = None
+        self._connectivity = None
+
+    def _add(self, a: int, b: int):
+        key = min(a, b) * KEY_BASE + max(a, b)
+        if key in self._removed:
+            self._removed.discard(key)
+        else:
+            self._added.setdefault(a, set()).add(b)
+            self._added.setdefault(b, set()).add(a)
+        self._degrees[[a, b]] += 1
+        self.num_edges += 1
+        self._merge(a, b)
+
+    def _remove(self, a: int, b: int):
+        if b in self._added.get(a, ()):
+            self._added[a].discard(b)
+            self._added[b].discard(a)
+        else:
+            self._removed.add(min(a, b) * KEY_BASE + max(a, b))
+        self._degrees[[a, b]] -= 1
+        self.num_edges -= 1
+
+    def add_edge(self, u, v) -> bool:
+        """Add edge ``u``-``v``; ``False`` for self-loops and existing edges."""
+        a, b = self._id(u), self._id(v)
+        if a == b or self._has(a, b):
+            return False
+        self._add(a, b)
+        self._relax([a, b])
+        self._changed()
+        return True
+
+    def remove_edge(self, u, v) -> bool:
+        """Remove edge ``u``-``v``; ``False`` when there is no such edge."""
+        a, b = self._id(u), self._id(v)
+        if a == b or not self._has(a, b):
+            return False
+        self._remove(a, b)
+        self._split_if_disconnected(a, b)
+        self._relax([a, b])
+        self._changed()
+        return True
+
+    def add_vertex(self, neighbors=(), label=None) -> int:
+        """Append a vertex joined to ``neighbors``; returns its position."""
+        targets = list(dict.fromkeys(self._id(u) for u in neighbors))
+        s = self._next
+        self._next += 1
+        for name in ("_current", "_degrees", "_components", "_positions", "_labels"):
+            setattr(self, name, _grow(getattr(self, name), self._next))
+        self._stable = _grow(self._stable, self._n + 1)
+        self._stable[self._n] = s
+        self._current[s] = self._n
+        self._n += 1
+        self._degrees[s] = 0
+        c = self._next_component
+        self._next_component += 1
+        self._components[s] = c
+        self._members[c] = [np.array([s])]
+        self._sizes[c] = 1
+        if targets:
+            # Start at the centre of the new neighbours, slightly jittered.
+            centre = self._positions[targets].mean(axis=0)
+            self._positions[s] = centre + self._rng.normal(0, 0.01, 2)
+        else:
+            self._positions[s] = self._rng.random(2)
+        if label is None and self._labels.dtype.kind in "iu":
+            label = int(self._labels[:s].max(initial=0)) + 1
+        elif label is None:
+            label = str(self._n)
+            while self.find(label) is not None:
+                label += "'"
+        self._labels[s] = label
+        for t in targets:
+            self._add(s, t)
+        self._relax([s])
+        self._changed()
+        return self._n - 1
+
+    def remove_vertex(self, u):
+        """Delete vertex ``u`` and its edges; the last vertex takes its position."""
+        s = self._id(u)
+        neighbours = self._neighbours(s)
+        for w in neighbours:
+            self._remove(s, w)
+        if neighbours:
+            self._new_component([s])
+            # Neighbours sharing a label must still be connected; any that are
+            # not are split off, one search per pair.
+            representatives = []
+            for w in neighbours:
+                joined = False
+                for r in representatives:
+                    if self._components[r] == self._components[w]:
+                        if not self._split_if_disconnected(r, w):
+                            joined = True
+                            break
+                if not joined:
+                    representatives.append(w)
+        c = int(self._components[s])
+        del self._sizes[c], self._members[c]
+        self._components[s] = -1
+
+        position, last = int(u), int(self._stable[self._n - 1])
+        self._stable[position] = last
+        self._current[last] = position
+        self._current[s] = -1
+        self._n -= 1
+        self._relax(neighbours)
+        self._changed()
+
+    # ---------------- views ----------------
+    def snapshot(self) -> GraphSnapshot:
+        """Current graph as arrays indexed by position (cached until the next edit)."""
+        if self._snapshot is not None:
+            return self._snapshot
+        stable = self._stable[:self._n]
+        keys = self._base_keys
+        if self._removed:
+            keys = keys[~np.isin(keys, np.fromiter(self._removed, np.int64, len(self._removed)))]
+        added = [a * KEY_BASE + b for a, targets in self._added.items() for b in targets if a < b]
+        if added:
+            keys = np.concatenate([keys, np.asarray(added, dtype=np.int64)])
+        a, b = self._current[keys // KEY_BASE], self._current[keys % KEY_BASE]
+        src, dst = np.minimum(a, b), np.maximum(a, b)
+
+        # Compact component labels to 0 .. k-1, numbered by their smallest vertex.
+        components = self._components[stable]
+        first = np.full(self._next_component, self._n, dtype=np.int64)
+        np.minimum.at(first, components, np.arange(self._n))
+        rank = np.argsort(first)
+        renumber = np.empty_like(rank)
+        renumber[rank] = np.arange(rank.size)
+
+        self._snapshot = GraphSnapshot(
+            src=src, dst=dst, num_vertices=self._n,
+            degrees=self._degrees[stable].copy(),
+            components=renumber[components],
+            positions=self._positions[stable].copy(),
+            labels=self._labels[stable].copy(),
+        )
+        return self._snapshot
+
+    def connectivity(self) -> dict:
+        """``analyze_connectivity``-shaped report using the maintained components."""
+        from core.connectivity import bridges_and_articulation_points
+
+        if self._connectivity is None:
+            snap = self.snapshot()
+            sizes = np.bincount(snap.components) if snap.num_vertices else np.empty(0, np.int64)
+            bridges, cut_vertices = bridges_and_articulation_points(snap.src, snap.dst,
+                                                                    snap.num_vertices)
+            self._connectivity = {
+                "labels": snap.components,
+                "sizes": sizes,
+                "num_components": int(sizes.size),
+                "largest_component": int(sizes.max()) if sizes.size else 0,
+                "bridges": bridges,
+                "articulation_points": cut_vertices,
+            }
+        return self._connectivity
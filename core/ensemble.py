@@ -0,0 +1,220 @@
+"""Batch generation and analysis of G(n, m) ensembles.
+
+Each graph goes through the same sampling and analysis as the visualization
+page (edge sampling, degrees, CSR adjacency, connectivity) and is reduced to
+one row of scalar statistics.  Graphs are processed in shards: a worker
+process generates a shard, writes its rows (and optionally the edge lists)
+to disk and returns only the small row table, so memory stays bounded by one
+shard per worker.
+
+Graph ``i`` of an ensemble is sampled from ``SeedSequence(seed,
+spawn_key=(i,))``: the streams are independent, and every graph can be
+reproduced on its own whatever the number of workers or the shard size.
+"""
+
+import importlib.util
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+
+from core.adjacency import build_csr
+from core.connectivity import analyze_connectivity
+from core.degree import degree_summary, degrees_from_edges
+from core.sampling import max_edges, sample_gnm_edges
+
+SHARD_SIZE = 100
+FORMATS = ("parquet", "npz")
+FIELDS = (
+    "graph", "vertices", "edges", "deg_min", "deg_max", "deg_mean", "deg_var",
+    "isolated", "components", "largest_component", "bridges", "articulation_points",
+    "adjacency_nnz",
+)
+QUANTILES = (0.05, 0.5, 0.95)
+
+
+def graph_seed(seed: int, graph: int) -> np.random.SeedSequence:
+    """Seed of graph ``graph`` in the ensemble started from ``seed``."""
+    return np.random.SeedSequence(int(seed), spawn_key=(int(graph),))
+
+
+def default_format() -> str:
+    """``"parquet"`` when a Parquet engine is installed, else ``"npz"``."""
+    for engine in ("pyarrow", "fastparquet"):
+        if importlib.util.find_spec(engine) is not None:
+            return "parquet"
+    return "npz"
+
+
+def analyze_graph(num_vertices: int, num_edges: int, seed) -> tuple[dict, np.ndarray, np.ndarray]:
+    """Sample one G(n, m) graph and return ``(row, src, dst)``."""
+    src, dst = sample_gnm_edges(num_vertices, num_edges, seed=seed)
+    degrees = degrees_from_edges(src, dst, num_vertices)
+    summary = degree_summary(degrees)
+    report = analyze_connectivity(src, dst, num_vertices)
+    row = {
+        "vertices": int(num_vertices),
+        "edges": int(num_edges),
+        "deg_min": summary["min"],
+        "deg_max": summary["max"],
+        "deg_mean": summary["mean"],
+        "deg_var": summary["variance"],
+        "isolated": int(np.count_nonzero(degrees == 0)),
+        "components": report["num_components"],
+        "largest_component": report["largest_component"],
+        "bridges": len(report["bridges"]),
+        "articulation_points": len(report["articulation_points"]),
+        "adjacency_nnz": int(build_csr(src, dst, num_vertices).nnz),
+    }
+    return row, src, dst
+
+
+def _write_atomic(path: Path, write):
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    with open(tmp, "wb") as fh:
+        write(fh)
+    os.replace(tmp, path)
+
+
+def write_rows(path: Path, columns: dict, fmt: str):
+    """Store a column table as ``path`` (Parquet or NPZ)."""
+    if fmt == "parquet":
+        import pandas as pd
+
+        frame = pd.DataFrame(columns)
+        _write_atomic(path, lambda fh: frame.to_parquet(fh, index=False))
+    else:
+        _write_atomic(path, lambda fh: np.savez(fh, **columns))
+
+
+def read_rows(path) -> dict:
+    """Column table of a shard written by ``write_rows``."""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        import pandas as pd
+
+        frame = pd.read_parquet(path)
+        return {name: frame[name].to_numpy() for name in frame.columns}
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
+
+
+def run_shard(shard: int, graphs: range, num_vertices: int, num_edges: int, seed: int,
+              out_dir=None, fmt: str = "npz", save_edges: bool = False) -> dict:
+    """Generate and analyse ``graphs``; returns the column table and CPU time used.
+
+    With ``out_dir`` the table is written as ``rows-<shard>.<fmt>`` and, if
+    ``save_edges``, all edge lists as ``edges-<shard>.npz`` (concatenated
+    ``src``/``dst`` with per-graph ``offsets``).
+    """
+    start = time.process_time()
+    rows, sources, targets = [], [], []
+    for graph in graphs:
+        row, src, dst = analyze_graph(num_vertices, num_edges, graph_seed(seed, graph))
+        rows.append({"graph": graph, **row})
+        if save_edges:
+            sources.append(src)
+            targets.append(dst)
+    columns = {name: np.array([row[name] for row in rows]) for name in FIELDS}
+
+    if out_dir is not None:
+        out_dir = Path(out_dir)
+        write_rows(out_dir / f"rows-{shard:05d}.{fmt}", columns, fmt)
+        if save_edges:
+            offsets = np.concatenate([[0], np.cumsum([len(s) for s in sources])])
+            edges = {
+                "graph": columns["graph"],
+                "offsets": offsets.astype(np.int64),
+                "src": np.concatenate(sources).astype(np.int64),
+                "dst": np.concatenate(targets).astype(np.int64),
+            }
+            _write_atomic(out_dir / f"edges-{shard:05d}.npz", lambda fh: np.savez(fh, **edges))
+    return {"shard": shard, "columns": columns, "cpu_s": time.process_time() - start}
+
+
+def aggregate(columns: dict) -> dict:
+    """Mean, standard deviation, extremes and quantiles of every statistic."""
+    stats = {}
+    for name in FIELDS[3:]:
+        values = np.asarray(columns[name], dtype=float)
+        if values.size == 0:
+            continue
+        stats[name] = {
+            "mean": float(values.mean()),
+            "std": float(values.std()),
+            "min": float(values.min()),
+            "max": float(values.max()),
+            **{f"q{round(q * 100):02d}": float(np.quantile(values, q)) for q in QUANTILES},
+        }
+    count = len(columns["graph"])
+    stats["connected_fraction"] = (
+        float(np.mean(np.asarray(columns["components"]) == 1)) if count else 0.0
+    )
+    return stats
+
+
+def run_ensemble(num_vertices: int, num_edges: int, count: int, seed: int = 0,
+                 out_dir=None, workers: int | None = None, shard_size: int = SHARD_SIZE,
+                 fmt: str | None = None, save_edges: bool = False, progress=None) -> dict:
+    """Analyse ``count`` G(n, m) graphs on ``workers`` processes.
+
+    Returns the merged column table (sorted by graph), the aggregate
+    statistics and timings; ``progress(done, total)`` is called as shards
+    finish.  ``workers=1`` runs in this process.
+    """
+    limit = max_edges(num_vertices)
+    if not 0 <= num_edges <= limit:
+        raise ValueError(f"num_edges must be between 0 and {limit}, got {num_edges}")
+    fmt = fmt or default_format()
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown shard format {fmt!r}; expected one of {FORMATS}")
+    workers = max(1, workers or os.cpu_count() or 1)
+    shard_size = max(1, int(shard_size))
+    if out_dir is not None:
+        Path(out_dir).mkdir(parents=True, exist_ok=True)
+
+    shards = [range(start, min(start + shard_size, count))
+              for start in range(0, count, shard_size)]
+    workers = min(workers, max(len(shards), 1))
+    args = (num_vertices, num_edges, seed, out_dir, fmt, save_edges)
+    start = time.perf_counter()
+    results = []
+    if workers == 1:
+        for index, graphs in enumerate(shards):
+            results.append(run_shard(index, graphs, *args))
+            if progress:
+                progress(len(results), len(shards))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_shard, index, graphs, *args)
+                       for index, graphs in enumerate(shards)]
+            for future in as_completed(futures):
+                results.append(future.result())
+                if progress:
+                    progress(len(results), len(shards))
+    wall = time.perf_counter() - start
+
+    results.sort(key=lambda result: result["shard"])
+    columns = {
+        name: np.concatenate([r["columns"][name] for r in results]) if results else np.empty(0)
+        for name in FIELDS
+    }
+    cpu = sum(result["cpu_s"] for result in results)
+    return {
+        "columns": columns,
+        "stats": aggregate(columns),
+        "timing": {
+            "graphs": count,
+            "shards": len(shards),
+            "workers": workers,
+            "wall_s": wall,
+            "cpu_s": cpu,
+            "graphs_per_s": count / wall if wall > 0 else 0.0,
+            # Worker CPU time over wall time: the average number of busy cores
+            # (CPU utilisation), not a speedup over a serial run.
+            "parallelism": cpu / wall if wall > 0 else 0.0,
+        },
+        "format": fmt,
+    }
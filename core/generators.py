@@ -0,0 +1,307 @@
+"""Array-based random graph models: G(n, p), Barabási–Albert, Watts–Strogatz,
+random geometric and stochastic block model graphs.
+
+Every generator returns ``(src, dst)`` edge arrays of a simple undirected
+graph with ``src < dst`` and runs in O(n + m) array operations, so graphs
+with 10^5–10^6 nodes take seconds instead of the minutes NetworkX's Python
+loops need.  All of them take a ``seed`` passed to ``np.random.default_rng``.
+
+* G(n, p) and SBM blocks use geometric skip sampling (Batagelj & Brandes):
+  the gap to the next present pair is geometric, so only present edges are
+  drawn.
+* Barabási–Albert uses the repeated-node array: edge ``k`` copies a uniform
+  earlier entry of the endpoint list, which picks a vertex with probability
+  proportional to its degree.  The copies form chains back to a source
+  entry, resolved for many edges at once by pointer jumping: each pass
+  replaces every pointer by its target's pointer, halving the chains.
+* Random geometric graphs bucket points into a grid of cells at least
+  ``radius`` wide and only compare points in neighbouring cells.
+"""
+
+import numpy as np
+
+from core.graph_io import simplify
+from core.sampling import max_edges, sample_gnm_edges, unrank_pairs
+
+MODELS = ("gnm", "gnp", "ba", "ws", "geometric", "sbm")
+# Skip-sampling batch size; a batch overshoots the expected count a little.
+BATCH = 1 << 20
+# Barabási–Albert vertices settled together at first; later windows double.
+BA_WINDOW = 256
+# Redraw rounds for Watts–Strogatz rewirings that hit an existing edge.
+REWIRE_ROUNDS = 8
+
+
+def _empty():
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+
+def skip_sample(rng: np.random.Generator, total: int, p: float) -> np.ndarray:
+    """Sorted indices in ``[0, total)``, each present independently with probability ``p``."""
+    if p <= 0 or total <= 0:
+        return np.empty(0, dtype=np.int64)
+    if p >= 1:
+        return np.arange(total, dtype=np.int64)
+    chunks, last = [], -1
+    expected = total * p
+    while last < total - 1:
+        size = int(min(max(expected * 1.05 + 64, 64), BATCH))
+        index = last + np.cumsum(rng.geometric(p, size=size), dtype=np.int64)
+        chunks.append(index[index < total])
+        last = int(index[-1])
+        expected -= chunks[-1].size
+    return np.concatenate(chunks)
+
+
+def gnp_edges(num_vertices: int, p: float, seed=None):
+    """Erdős–Rényi G(n, p): every pair is an edge independently with probability ``p``."""
+    rng = np.random.default_rng(seed)
+    return unrank_pairs(skip_sample(rng, max_edges(num_vertices), p), num_vertices)
+
+
+def _jump(pointer: np.ndarray, entries: np.ndarray, star: int, flagged=None):
+    """Point ``entries`` at the root of their copy chain, in place, by pointer jumping.
+
+    ``pointer[entries]`` starts at the entry each one copies; even entries and
+    entries below ``star`` are roots.  Each pass replaces every pending pointer
+    by its target's pointer, halving the chains.  With ``flagged``, returns
+    whether each chain passed a flagged entry.
+    """
+    copied = None
+    if flagged is not None:
+        copied = np.zeros(pointer.size, dtype=bool)
+        copied[entries] = flagged[pointer[entries]]
+    pending = entries
+    while pending.size:
+        ahead = pointer[pending]
+        if copied is not None:
+            copied[pending] |= copied[ahead]
+        pointer[pending] = pointer[ahead]
+        ahead = pointer[pending]
+        pending = pending[(ahead % 2 == 1) & (ahead >= star)]
+    return copied
+
+
+def barabasi_albert_edges(num_vertices: int, m: int, seed=None):
+    """Preferential attachment: each new vertex links to ``m`` degree-weighted vertices.
+
+    Growth starts from a star on ``m + 1`` vertices, so the graph is connected
+    and a tree for ``m = 1``.  Targets repeated within one vertex are drawn
+    again, so every added vertex gets exactly ``m`` distinct neighbours.
+    """
+    n, m = int(num_vertices), min(int(m), int(num_vertices) - 1)
+    if n < 2 or m < 1:
+        return _empty()
+    rng = np.random.default_rng(seed)
+    # Edges 0 .. m-1 form the star (vertex k + 1 to vertex 0); after that,
+    # vertex v = m + 1 + (k - m) // m adds edge k.
+    k = np.arange(m * (n - m), dtype=np.int64)
+    source = np.where(k < m, k + 1, m + 1 + (k - m) // m)
+    drawn = k[m:]
+    # Entries written before the first edge of a vertex are open to its picks,
+    # so a vertex never picks itself.
+    first = 2 * (m + (source[drawn] - m - 1) * m)
+    ref = (rng.random(drawn.size) * first).astype(np.int64)
+
+    # Entry 2k is the source of edge k, entry 2k + 1 its target.  Drawn
+    # targets point at the entry they copy until resolved to a source or star
+    # entry.  The rows of m picks (one per added vertex) are settled in
+    # windows of doubling size: once the rows before a window are final, its
+    # picks depend only on them and on each other.
+    pointer = np.arange(2 * k.size, dtype=np.int64)
+    target = np.zeros(k.size, dtype=np.int64)
+    picks = target[m:].reshape(-1, m)
+    rows, low = picks.shape[0], 0
+    while low < rows:
+        # Single picks never repeat, so m = 1 resolves in one go.
+        high = rows if m == 1 else min(max(2 * low, low + BA_WINDOW), rows)
+        span = slice(low * m, high * m)
+        edges = drawn[span]
+        entries = 2 * edges + 1
+        while True:
+            pointer[entries] = ref[span]
+            _jump(pointer, entries, 2 * m)
+            root = pointer[entries]
+            target[edges] = np.where(root % 2 == 0, source[root // 2], 0)
+            if m == 1:
+                break
+
+            # Rows that picked the same vertex twice draw the later pick again.
+            window = picks[low:high]
+            order = np.argsort(window, axis=1, kind="stable")
+            ordered = np.take_along_axis(window, order, axis=1)
+            row, col = np.nonzero(ordered[:, 1:] == ordered[:, :-1])
+            if row.size == 0:
+                break
+            # A repeat is only certain when no pick of the row copied, directly
+            # or through a chain, a pick of another repeating row, which may
+            # change.  The first repeating row always qualifies.
+            flagged = np.zeros(pointer.size, dtype=bool)
+            flagged[2 * (m + ((low + row)[:, None] * m + np.arange(m)).ravel()) + 1] = True
+            pointer[entries] = ref[span]
+            copied = _jump(pointer, entries, 2 * m, flagged)
+            certain = ~copied[entries].reshape(-1, m).any(axis=1)[row]
+            again = (low + row[certain]) * m + order[row[certain], col[certain] + 1]
+            ref[again] = (rng.random(again.size) * first[again]).astype(np.int64)
+        low = high
+    return target, source
+
+
+def watts_strogatz_edges(num_vertices: int, k: int, p: float, seed=None):
+    """Small-world ring: ``k`` nearest neighbours, each edge rewired with probability ``p``."""
+    n, half = int(num_vertices), int(k) // 2
+    if n < 3 or half < 1:
+        return _empty()
+    half = min(half, (n - 1) // 2)
+    rng = np.random.default_rng(seed)
+    src = np.repeat(np.arange(n, dtype=np.int64), half)
+    dst = (src + np.tile(np.arange(1, half + 1), n)) % n
+
+    rewire = np.flatnonzero(rng.random(src.size) < p)
+    for _ in range(REWIRE_ROUNDS):
+        if rewire.size == 0:
+            break
+        # Uniform new endpoint other than the source vertex.
+        target = rng.integers(0, n - 1, size=rewire.size)
+        dst[rewire] = target + (target >= src[rewire])
+        # Rewirings that duplicate another edge are drawn again.
+        key = np.minimum(src, dst) * n + np.maximum(src, dst)
+        order = np.argsort(key, kind="stable")
+        repeated = np.zeros(src.size, dtype=bool)
+        repeated[order[1:]] = key[order[1:]] == key[order[:-1]]
+        is_rewired = np.zeros(src.size, dtype=bool)
+        is_rewired[rewire] = True
+        rewire = np.flatnonzero(repeated & is_rewired)
+    src, dst, _, _ = simplify(src, dst, n)
+    return src, dst
+
+
+# Cell offsets covering each neighbouring pair of grid cells once.
+_HALF_NEIGHBOURHOOD = ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def random_geometric_edges(num_vertices: int, radius: float, seed=None, return_positions=False):
+    """Points uniform in the unit square, joined when closer than ``radius``."""
+    n = int(num_vertices)
+    rng = np.random.default_rng(seed)
+    pos = rng.random((n, 2))
+    if n < 2 or radius <= 0:
+        edges = _empty()
+        return (*edges, pos) if return_positions else edges
+
+    # Floor, so every cell is at least ``radius`` wide and neighbours are one cell apart.
+    side = max(int(1 / radius), 1)
+    cx = np.minimum((pos[:, 0] * side).astype(np.int64), side - 1)
+    cy = np.minimum((pos[:, 1] * side).astype(np.int64), side - 1)
+    cell = cx * side + cy
+    order = np.argsort(cell, kind="stable")
+    cell_sorted = cell[order]
+    cx, cy = cx[order], cy[order]
+    rank = np.arange(n, dtype=np.int64)
+
+    sources, targets = [], []
+    for dx, dy in _HALF_NEIGHBOURHOOD:
+        nx_, ny_ = cx + dx, cy + dy
+        valid = (nx_ < side) & (ny_ >= 0) & (ny_ < side)
+        target = nx_ * side + ny_
+        lo = np.searchsorted(cell_sorted, target, side="left")
+        hi = np.searchsorted(cell_sorted, target, side="right")
+        if (dx, dy) == (0, 0):
+            lo = rank + 1  # same cell: each pair once, later point only
+        counts = np.where(valid, np.maximum(hi - lo, 0), 0)
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        i = np.repeat(rank, counts)
+        start = np.repeat(lo - np.cumsum(counts) + counts, counts)
+        j = start + np.arange(total, dtype=np.int64)
+        delta = pos[order[i]] - pos[order[j]]
+        close = np.einsum("ij,ij->i", delta, delta) < radius * radius
+        sources.append(order[i[close]])
+        targets.append(order[j[close]])
+
+    if sources:
+        src, dst = np.concatenate(sources), np.concatenate(targets)
+        src, dst, _, _ = simplify(src, dst, n)
+    else:
+        src, dst = _empty()
+    return (src, dst, pos) if return_positions else (src, dst)
+
+
+def sbm_edges(sizes, probabilities, seed=None):
+    """Stochastic block model: blocks of ``sizes`` with pair probabilities ``probabilities[a][b]``."""
+    sizes = np.asarray(sizes, dtype=np.int64)
+    probabilities = np.asarray(probabilities, dtype=float)
+    if probabilities.shape != (sizes.size, sizes.size):
+        raise ValueError(f"probabilities must be {sizes.size} x {sizes.size}, "
+                         f"got {probabilities.shape}")
+    rng = np.random.default_rng(seed)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    sources, targets = [], []
+    for a in range(sizes.size):
+        for b in range(a, sizes.size):
+            if a == b:
+                index = skip_sample(rng, max_edges(sizes[a]), probabilities[a, a])
+                i, j = unrank_pairs(index, sizes[a])
+            else:
+                index = skip_sample(rng, int(sizes[a] * sizes[b]), probabilities[a, b])
+                i, j = index // sizes[b], index % sizes[b]
+            sources.append(i + starts[a])
+            targets.append(j + starts[b])
+    if not sources:
+        return _empty()
+    return np.concatenate(sources), np.concatenate(targets)
+
+
+def expected_edges(model: str, num_vertices: int, **params) -> float:
+    """Expected edge count of ``generate(model, num_vertices, **params)``, without generating.
+
+    Lets callers refuse a request before it allocates the edge arrays.
+    """
+    n = int(num_vertices)
+    if model == "gnm":
+        return float(params["edges"])
+    if model == "gnp":
+        return params["p"] * max_edges(n)
+    if model == "ba":
+        m = min(int(params["m"]), n - 1)
+        return float(m * (n - m)) if n > 1 and m > 0 else 0.0
+    if model == "ws":
+        return float(n * min(int(params["k"]) // 2, (n - 1) // 2)) if n >= 3 else 0.0
+    if model == "geometric":
+        # pi r^2 n^2 / 2 ignores the border, so it overestimates; never above all pairs.
+        return min(np.pi * params["radius"] ** 2 * n * n / 2, max_edges(n))
+    if model == "sbm":
+        blocks = max(1, min(int(params["blocks"]), n))
+        sizes = np.full(blocks, n // blocks)
+        sizes[:n % blocks] += 1
+        pairs_in = float(sum(max_edges(size) for size in sizes))
+        return params["p_in"] * pairs_in + params["p_out"] * (max_edges(n) - pairs_in)
+    raise ValueError(f"Unknown graph model {model!r}; expected one of {MODELS}")
+
+
+def generate(model: str, num_vertices: int, seed=None, **params):
+    """``(src, dst)`` of a graph from one of ``MODELS``.
+
+    Parameters per model: ``gnm`` edges; ``gnp`` p; ``ba`` m; ``ws`` k, p;
+    ``geometric`` radius; ``sbm`` blocks, p_in, p_out (equal-sized blocks).
+    """
+    n = int(num_vertices)
+    if model == "gnm":
+        return sample_gnm_edges(n, params["edges"], seed=seed)
+    if model == "gnp":
+        return gnp_edges(n, params["p"], seed=seed)
+    if model == "ba":
+        return barabasi_albert_edges(n, params["m"], seed=seed)
+    if model == "ws":
+        return watts_strogatz_edges(n, params["k"], params["p"], seed=seed)
+    if model == "geometric":
+        return random_geometric_edges(n, params["radius"], seed=seed)
+    if model == "sbm":
+        blocks = max(1, min(int(params["blocks"]), n))
+        sizes = np.full(blocks, n // blocks)
+        sizes[:n % blocks] += 1
+        probabilities = np.full((blocks, blocks), float(params["p_out"]))
+        np.fill_diagonal(probabilities, float(params["p_in"]))
+        return sbm_edges(sizes, probabilities, seed=seed)
+    raise ValueError(f"Unknown graph model {model!r}; expected one of {MODELS}")
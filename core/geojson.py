@@ -0,0 +1,64 @@
+"""GeoJSON builders so a whole network can be sent to Leaflet as one layer."""
+
+import numpy as np
+
+
+def select_pairs(dist: np.ndarray, max_edges: int | None = None,
+                 max_km: float | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Pick point pairs ``i < j`` from a distance matrix, shortest first.
+
+    ``max_km`` drops longer connections and ``max_edges`` keeps only the
+    shortest ones, which bounds the layer size for large point sets.
+    """
+    i, j = np.triu_indices(dist.shape[0], k=1)
+    d = dist[i, j]
+    if max_km is not None:
+        keep = d <= max_km
+        i, j, d = i[keep], j[keep], d[keep]
+    if max_edges is not None and d.size > max_edges:
+        keep = np.argpartition(d, max_edges - 1)[:max_edges] if max_edges > 0 else []
+        i, j, d = i[keep], j[keep], d[keep]
+    order = np.argsort(d, kind="stable")
+    return i[order], j[order]
+
+
+def line_collection(lat: np.ndarray, lon: np.ndarray, i: np.ndarray, j: np.ndarray,
+                    properties: dict | None = None) -> dict:
+    """FeatureCollection with one LineString per ``(i[k], j[k])`` pair.
+
+    ``properties`` maps property names to per-feature sequences; they become
+    each feature's ``properties`` (used for tooltips and styling).
+    """
+    properties = properties or {}
+    columns = {key: np.asarray(values).tolist() for key, values in properties.items()}
+    lat_i, lon_i = lat[i].tolist(), lon[i].tolist()
+    lat_j, lon_j = lat[j].tolist(), lon[j].tolist()
+
+    features = []
+    for k in range(len(lat_i)):
+        features.append({
+            "type": "Feature",
+            "geometry": {
+                "type": "LineString",
+                # GeoJSON positions are (longitude, latitude).
+                "coordinates": [[lon_i[k], lat_i[k]], [lon_j[k], lat_j[k]]],
+            },
+            "properties": {key: values[k] for key, values in columns.items()},
+        })
+    return {"type": "FeatureCollection", "features": features}
+
+
+def point_collection(lat: np.ndarray, lon: np.ndarray, properties: dict | None = None) -> dict:
+    """FeatureCollection with one Point per location; see ``line_collection``."""
+    properties = properties or {}
+    columns = {key: np.asarray(values).tolist() for key, values in properties.items()}
+    lat, lon = np.asarray(lat).tolist(), np.asarray(lon).tolist()
+
+    features = []
+    for k in range(len(lat)):
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [lon[k], lat[k]]},
+            "properties": {key: values[k] for key, values in columns.items()},
+        })
+    return {"type": "FeatureCollection", "features": features}
@@ -0,0 +1,249 @@
+"""Streaming import of user-supplied graphs: edge lists, Matrix Market, adjacency lists.
+
+Files are parsed ``CHUNK_LINES`` lines at a time, so parsing holds one chunk
+of text plus the compact integer arrays built so far.  Vertex ids of any
+type are relabelled to ``0 .. n-1`` without a Python loop over edges: each
+chunk is factorized on its own (local codes plus a small table of distinct
+ids), and the per-chunk tables are merged with one more factorization at the
+end.  Numeric ids are parsed as integers and keep their numeric order;
+anything else is read as text.  The result is a simple undirected graph, so
+self-loops and repeated edges are dropped.
+"""
+
+import gzip
+import io
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+
+FORMATS = ("edgelist", "mtx", "adjlist")
+SUFFIXES = {
+    ".csv": "edgelist", ".tsv": "edgelist", ".txt": "edgelist", ".edges": "edgelist",
+    ".edgelist": "edgelist", ".el": "edgelist",
+    ".mtx": "mtx",
+    ".adjlist": "adjlist", ".adj": "adjlist",
+}
+# Lines parsed per chunk; bounds the text held in memory at once.
+CHUNK_LINES = 1 << 20
+COMMENTS = (b"#", b"%")
+# First-line column names recognised as an edge-list header.
+HEADER_NAMES = {"source", "target", "src", "dst", "from", "to", "u", "v", "node1", "node2"}
+
+
+@dataclass
+class ImportedGraph:
+    src: np.ndarray
+    dst: np.ndarray
+    num_vertices: int
+    # Original id of every vertex, indexed by its new number.
+    labels: np.ndarray
+    # Lines and edges read, self-loops and duplicate edges dropped.
+    stats: dict = field(default_factory=dict)
+
+
+def detect_format(name) -> str:
+    """Format implied by a file name (``.gz`` is looked through)."""
+    suffixes = [s.lower() for s in Path(str(name)).suffixes]
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes.pop()
+    fmt = SUFFIXES.get(suffixes[-1] if suffixes else "")
+    if fmt is None:
+        raise ValueError(f"Cannot tell the graph format of {name!r}; expected one of "
+                         f"{sorted(SUFFIXES)} (optionally .gz)")
+    return fmt
+
+
+def _open(source, name: str):
+    """Binary, seekable handle for a path or an uploaded file object."""
+    compressed = str(name).lower().endswith(".gz")
+    if isinstance(source, (str, Path)):
+        return gzip.open(source, "rb") if compressed else open(source, "rb")
+    return gzip.GzipFile(fileobj=source) if compressed else source
+
+
+def _first_data_line(handle) -> bytes:
+    for line in handle:
+        line = line.strip()
+        if line and not line.startswith(COMMENTS):
+            return line
+    return b""
+
+
+class _Relabeler:
+    """Collects edge chunks as local codes and merges the id tables at the end."""
+
+    def __init__(self):
+        self.codes = []
+        self.uniques = []
+
+    def add(self, src, dst, nodes=None):
+        """Add an edge chunk; ``nodes`` lists ids that may have no edges."""
+        import pandas as pd
+
+        values = [src, dst] if nodes is None else [src, dst, nodes]
+        codes, uniques = pd.factorize(np.concatenate(values))
+        self.codes.append((codes[:2 * len(src)].astype(np.int32), len(src)))
+        self.uniques.append(np.asarray(uniques))
+
+    def finish(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        import pandas as pd
+
+        if not self.codes:
+            return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, dtype=object)
+        merged, labels = pd.factorize(np.concatenate(self.uniques), sort=True)
+        total = sum(count for _, count in self.codes)
+        dtype = np.int32 if len(labels) < np.iinfo(np.int32).max else np.int64
+        src, dst = np.empty(total, dtype), np.empty(total, dtype)
+        edge, offset = 0, 0
+        while self.codes:
+            # Chunks are released as they are copied, so peak memory stays low.
+            (codes, count), uniques = self.codes.pop(0), self.uniques.pop(0)
+            local = merged[offset:offset + len(uniques)]
+            src[edge:edge + count] = local[codes[:count]]
+            dst[edge:edge + count] = local[codes[count:]]
+            edge += count
+            offset += len(uniques)
+        return src, dst, np.asarray(labels)
+
+
+def _is_int(token: str) -> bool:
+    return token.lstrip("+-").isdigit()
+
+
+def _edgelist_chunks(handle, numeric: bool):
+    import pandas as pd
+
+    first = _first_data_line(handle).decode(errors="replace")
+    handle.seek(0)
+    if "," in first:
+        sep = ","
+    elif "\t" in first:
+        sep = "\t"
+    else:
+        sep = r"\s+"
+    tokens = first.replace(",", " ").split()[:2]
+    # With integer ids any other first line is a header; with text ids only
+    # the usual column names are.
+    if numeric:
+        header = not all(_is_int(token) for token in tokens)
+    else:
+        header = bool({token.strip("\"'").lower() for token in tokens} & HEADER_NAMES)
+
+    reader = pd.read_csv(
+        handle, sep=sep, header=0 if header else None, usecols=[0, 1],
+        dtype=np.int64 if numeric else str, comment="#", chunksize=CHUNK_LINES, engine="c",
+    )
+    for chunk in reader:
+        yield chunk.iloc[:, 0].to_numpy(), chunk.iloc[:, 1].to_numpy(), None
+
+
+def _adjlist_chunks(handle, numeric: bool):
+    while True:
+        lines = list(islice(handle, CHUNK_LINES))
+        if not lines:
+            return
+        heads, tails, counts = [], [], []
+        for line in lines:
+            parts = line.split(b"#", 1)[0].split()
+            if parts:
+                heads.append(parts[0])
+                tails.extend(parts[1:])
+                counts.append(len(parts) - 1)
+        heads, tails = np.array(heads), np.array(tails)
+        if numeric:
+            heads, tails = heads.astype(np.int64), tails.astype(np.int64)
+        else:
+            heads = heads.astype(str) if heads.size else heads
+            tails = tails.astype(str) if tails.size else tails
+        # Heads are passed on as well, so a vertex without neighbours is kept.
+        yield np.repeat(heads, counts), tails, heads
+
+
+def _mtx_edges(handle) -> tuple[np.ndarray, np.ndarray, int]:
+    """Entries of a coordinate Matrix Market file as 0-based ``(row, col)``."""
+    import pandas as pd
+
+    banner = handle.readline().decode(errors="replace").lower().split()
+    if banner[:3] != ["%%matrixmarket", "matrix", "coordinate"]:
+        raise ValueError("Only coordinate Matrix Market files are supported")
+    # The size line ends the header; the handle is left at the first entry.
+    rows, cols, _ = (int(value) for value in _first_data_line(handle).split()[:3])
+    n = max(rows, cols)
+    dtype = np.int32 if n < np.iinfo(np.int32).max else np.int64
+
+    sources, targets = [], []
+    reader = pd.read_csv(handle, sep=r"\s+", header=None, usecols=[0, 1], dtype=np.int64,
+                         comment="%", chunksize=CHUNK_LINES, engine="c")
+    for chunk in reader:
+        src, dst = chunk[0].to_numpy() - 1, chunk[1].to_numpy() - 1
+        if src.size and (min(src.min(), dst.min()) < 0 or max(src.max(), dst.max()) >= n):
+            raise ValueError(f"Matrix Market entry outside the declared {rows} x {cols} size")
+        sources.append(src.astype(dtype))
+        targets.append(dst.astype(dtype))
+    if not sources:
+        return np.empty(0, dtype), np.empty(0, dtype), n
+    return np.concatenate(sources), np.concatenate(targets), n
+
+
+def simplify(src: np.ndarray, dst: np.ndarray, num_vertices: int):
+    """Drop self-loops and repeated (undirected) edges; returns ``(src, dst, loops, duplicates)``."""
+    lo, hi = np.minimum(src, dst), np.maximum(src, dst)
+    keep = lo != hi
+    loops = int(keep.size - np.count_nonzero(keep))
+    key = lo[keep].astype(np.int64) * int(num_vertices) + hi[keep]
+    # Sort and mask instead of np.unique: one in-place sort, no hash table.
+    key.sort()
+    if key.size:
+        key = key[np.concatenate([[True], key[1:] != key[:-1]])]
+    duplicates = int(np.count_nonzero(keep)) - key.size
+    dtype = src.dtype if src.size else np.int64
+    return ((key // num_vertices).astype(dtype), (key % num_vertices).astype(dtype),
+            loops, duplicates)
+
+
+def load_graph(source, fmt: str | None = None, name: str | None = None) -> ImportedGraph:
+    """Parse ``source`` (a path or a binary file object) into an ``ImportedGraph``.
+
+    ``fmt`` is one of ``FORMATS``; by default it is taken from ``name`` (or
+    the path).  Raises ``ValueError`` for unknown formats and malformed files.
+    """
+    name = str(name or getattr(source, "name", None) or source)
+    fmt = fmt or detect_format(name)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown graph format {fmt!r}; expected one of {FORMATS}")
+
+    handle = _open(source, name)
+    try:
+        if fmt == "mtx":
+            src, dst, n = _mtx_edges(handle)
+            labels = np.arange(1, n + 1)
+        else:
+            chunks = _edgelist_chunks if fmt == "edgelist" else _adjlist_chunks
+            # Integer ids are tried first; any other token restarts as text.
+            for numeric in (True, False):
+                relabel = _Relabeler()
+                try:
+                    for chunk in chunks(handle, numeric):
+                        relabel.add(*chunk)
+                    break
+                except ValueError:
+                    if not numeric:
+                        raise
+                    handle.seek(0)
+            src, dst, labels = relabel.finish()
+            n = len(labels)
+    except (ValueError, IndexError, io.UnsupportedOperation) as exc:
+        raise ValueError(f"Cannot parse {name} as {fmt}: {exc}") from exc
+    finally:
+        if isinstance(source, (str, Path)) or handle is not source:
+            handle.close()
+
+    if n == 0:
+        raise ValueError(f"{name} contains no vertices")
+    read = int(src.size)
+    src, dst, loops, duplicates = simplify(src, dst, max(n, 1))
+    return ImportedGraph(src, dst, n, labels, {
+        "edges_read": read, "self_loops": loops, "duplicates": duplicates,
+    })
@@ -0,0 +1,307 @@
+"""Graph layouts on NumPy edge arrays, with a cache keyed by graph hash and seed.
+
+The force-directed solver follows Fruchterman-Reingold.  Attraction is summed
+over the edge arrays; repulsion is exact for small graphs and, above
+``EXACT_LIMIT`` nodes, approximated on a grid: node masses are deposited with
+cloud-in-cell weights and convolved with the repulsion kernel via FFT, which
+costs O(n + G² log G) per iteration instead of O(n²).
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+LAYOUTS = ("force", "spectral", "circular", "random")
+
+# Graphs up to this size use exact O(n²) repulsion.
+EXACT_LIMIT = 300
+# Upper bound for the repulsion grid side (the FFT runs on twice this size).
+MAX_GRID = 256
+# Pull towards the centroid so isolated vertices do not drift off to the edge.
+GRAVITY = 2.0
+# Warm starts begin cooler and run fewer iterations than a cold start.
+WARM_TEMPERATURE = 0.02
+WARM_ITERATIONS = 15
+# Minimum Jaccard similarity of edge sets for a warm start to be worthwhile.
+WARM_SIMILARITY = 0.8
+
+
+def graph_hash(src: np.ndarray, dst: np.ndarray, num_vertices: int) -> str:
+    """Order-independent digest of an undirected edge list."""
+    lo = np.minimum(src, dst).astype(np.int64)
+    hi = np.maximum(src, dst).astype(np.int64)
+    order = np.lexsort((hi, lo))
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.int64(num_vertices).tobytes())
+    digest.update(lo[order].tobytes())
+    digest.update(hi[order].tobytes())
+    return digest.hexdigest()
+
+
+def edge_keys(src: np.ndarray, dst: np.ndarray, num_vertices: int) -> np.ndarray:
+    """Sorted unique linear keys ``min * n + max`` identifying each undirected edge."""
+    lo = np.minimum(src, dst).astype(np.int64)
+    hi = np.maximum(src, dst).astype(np.int64)
+    return np.unique(lo * int(num_vertices) + hi)
+
+
+def edge_similarity(keys_a: np.ndarray, keys_b: np.ndarray) -> float:
+    """Jaccard similarity of two ``edge_keys`` arrays."""
+    union = len(keys_a) + len(keys_b)
+    if union == 0:
+        return 1.0
+    common = len(np.intersect1d(keys_a, keys_b, assume_unique=True))
+    return common / (union - common)
+
+
+def random_layout(num_vertices: int, seed=None) -> np.ndarray:
+    """Uniform positions in the unit square."""
+    return np.random.default_rng(seed).random((int(num_vertices), 2))
+
+
+def circular_layout(num_vertices: int) -> np.ndarray:
+    """Vertices evenly spaced on a circle of radius 0.5 centred at (0.5, 0.5)."""
+    n = int(num_vertices)
+    theta = 2 * np.pi * np.arange(n) / max(n, 1)
+    return 0.5 + 0.5 * np.column_stack([np.cos(theta), np.sin(theta)])
+
+
+def spectral_layout(src: np.ndarray, dst: np.ndarray, num_vertices: int, seed=None) -> np.ndarray:
+    """Coordinates from the 2nd and 3rd leading eigenvectors of D^-1/2 A D^-1/2."""
+    import scipy.sparse as sp
+    import scipy.sparse.linalg as spla
+
+    n = int(num_vertices)
+    if n < 3 or len(src) == 0:
+        return circular_layout(n)
+
+    A = sp.coo_matrix((np.ones(len(src)), (src, dst)), shape=(n, n))
+    A = (A + A.T).tocsr()
+    deg = np.asarray(A.sum(axis=1)).ravel()
+    inv_sqrt = np.where(deg > 0, 1.0 / np.sqrt(np.maximum(deg, 1e-12)), 0.0)
+    M = sp.diags(inv_sqrt) @ A @ sp.diags(inv_sqrt)
+
+    if n <= 500:
+        _, vectors = np.linalg.eigh(M.toarray())
+        coords = vectors[:, -3:-1]
+    else:
+        v0 = np.random.default_rng(seed).random(n)
+        _, vectors = spla.eigsh(M, k=3, which="LA", v0=v0)
+        coords = vectors[:, :2]
+    return _normalize(coords)
+
+
+def _normalize(pos: np.ndarray) -> np.ndarray:
+    """Scale positions into the unit square, preserving aspect ratio."""
+    if pos.size == 0:
+        return pos
+    pos = pos - pos.min(axis=0)
+    span = pos.max()
+    return pos / span if span > 0 else pos + 0.5
+
+
+def _exact_repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    dx = pos[:, 0, None] - pos[None, :, 0]
+    dy = pos[:, 1, None] - pos[None, :, 1]
+    dist2 = dx * dx + dy * dy
+    np.fill_diagonal(dist2, np.inf)
+    inv = k * k / np.maximum(dist2, 1e-9)
+    return np.column_stack([(dx * inv).sum(axis=1), (dy * inv).sum(axis=1)])
+
+
+def _grid_repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    n = len(pos)
+    g = int(min(MAX_GRID, max(16, 2 ** np.ceil(np.log2(np.sqrt(n))))))
+    lo = pos.min(axis=0)
+    span = max(float((pos.max(axis=0) - lo).max()), 1e-9)
+    h = span / (g - 1)
+
+    # Cloud-in-cell deposit of unit masses onto a g x g grid.
+    u = (pos - lo) / h
+    cell = np.minimum(np.floor(u).astype(np.int64), g - 2)
+    frac = u - cell
+    corners = []
+    for dx in (0, 1):
+        for dy in (0, 1):
+            w = (frac[:, 0] if dx else 1 - frac[:, 0]) * (frac[:, 1] if dy else 1 - frac[:, 1])
+            corners.append(((cell[:, 0] + dx) * g + cell[:, 1] + dy, w))
+    rho = np.zeros(g * g)
+    for flat, w in corners:
+        rho += np.bincount(flat, weights=w, minlength=g * g)
+    rho = rho.reshape(g, g)
+
+    # Repulsion kernel k² r / |r|² on offsets -(g-1)..(g-1), zero at the origin.
+    offsets = np.arange(-(g - 1), g) * h
+    ox, oy = np.meshgrid(offsets, offsets, indexing="ij")
+    r2 = ox * ox + oy * oy
+    r2[g - 1, g - 1] = np.inf
+    kx = k * k * ox / r2
+    ky = k * k * oy / r2
+
+    size = 2 * g
+    rho_hat = np.fft.rfft2(rho, s=(size, size))
+    fx = np.fft.irfft2(rho_hat * np.fft.rfft2(kx, s=(size, size)), s=(size, size))
+    fy = np.fft.irfft2(rho_hat * np.fft.rfft2(ky, s=(size, size)), s=(size, size))
+    fx = fx[g - 1:2 * g - 1, g - 1:2 * g - 1].ravel()
+    fy = fy[g - 1:2 * g - 1, g - 1:2 * g - 1].ravel()
+
+    # Interpolate the force field back with the same weights.
+    force = np.zeros_like(pos)
+    for flat, w in corners:
+        force[:, 0] += w * fx[flat]
+        force[:, 1] += w * fy[flat]
+    return force
+
+
+def force_layout(src: np.ndarray, dst: np.ndarray, num_vertices: int, seed=None,
+                 iterations: int = 50, init_pos: np.ndarray | None = None,
+                 temperature: float = 0.1) -> np.ndarray:
+    """Fruchterman-Reingold layout in the unit square.
+
+    ``init_pos`` warm-starts the solver from earlier coordinates; pass a lower
+    ``temperature`` and fewer ``iterations`` when the graph changed only a little.
+    """
+    n = int(num_vertices)
+    if n == 0:
+        return np.empty((0, 2))
+    pos = random_layout(n, seed) if init_pos is None else np.array(init_pos, dtype=float)
+    if n == 1:
+        return np.full((1, 2), 0.5)
+
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    k = 1.0 / np.sqrt(n)
+    repulsion = _exact_repulsion if n <= EXACT_LIMIT else _grid_repulsion
+
+    for step in range(iterations):
+        force = repulsion(pos, k)
+        force -= GRAVITY * (pos - pos.mean(axis=0))
+
+        delta = pos[src] - pos[dst]
+        dist = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 1e-9)
+        pull = delta * (dist / k)[:, None]
+        for axis in (0, 1):
+            force[:, axis] -= np.bincount(src, weights=pull[:, axis], minlength=n)
+            force[:, axis] += np.bincount(dst, weights=pull[:, axis], minlength=n)
+
+        length = np.maximum(np.hypot(force[:, 0], force[:, 1]), 1e-9)
+        limit = temperature * (1 - step / iterations)
+        pos += force * (np.minimum(length, limit) / length)[:, None]
+
+    return _normalize(pos)
+
+
+def relax_local(pos: np.ndarray, num_moving: int, src: np.ndarray, dst: np.ndarray, k: float,
+                iterations: int = WARM_ITERATIONS,
+                temperature: float = WARM_TEMPERATURE) -> np.ndarray:
+    """Fruchterman-Reingold steps on a neighbourhood; only the first ``num_moving`` rows move.
+
+    ``pos`` holds the moving vertices followed by the fixed vertices around
+    them, and ``src``/``dst`` index its rows.  ``k`` is the ideal edge length
+    of the whole graph (``1 / sqrt(n)``).  Returns the new moving positions.
+    """
+    pos = np.array(pos, dtype=float)
+    m = int(num_moving)
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    moving = np.arange(m)
+    for step in range(iterations):
+        # Repulsion on the moving rows only: O(moving x neighbourhood).
+        dx = pos[:m, 0, None] - pos[None, :, 0]
+        dy = pos[:m, 1, None] - pos[None, :, 1]
+        dist2 = dx * dx + dy * dy
+        dist2[moving, moving] = np.inf
+        inv = k * k / np.maximum(dist2, 1e-9)
+        force = np.column_stack([(dx * inv).sum(axis=1), (dy * inv).sum(axis=1)])
+        delta = pos[src] - pos[dst]
+        dist = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 1e-9)
+        pull = delta * (dist / k)[:, None]
+        for axis in (0, 1):
+            force[:, axis] -= np.bincount(src, weights=pull[:, axis], minlength=len(pos))[:m]
+            force[:, axis] += np.bincount(dst, weights=pull[:, axis], minlength=len(pos))[:m]
+        length = np.maximum(np.hypot(force[:, 0], force[:, 1]), 1e-9)
+        limit = temperature * (1 - step / iterations)
+        pos[:m] += force * (np.minimum(length, limit) / length)[:, None]
+    return np.clip(pos[:m], 0.0, 1.0)
+
+
+def compute_layout(algorithm: str, src: np.ndarray, dst: np.ndarray, num_vertices: int,
+                   seed=None, init_pos: np.ndarray | None = None) -> np.ndarray:
+    """Dispatch to one of ``LAYOUTS``; ``init_pos`` only affects ``"force"``."""
+    if algorithm == "force":
+        if init_pos is not None:
+            return force_layout(src, dst, num_vertices, seed=seed, init_pos=init_pos,
+                                iterations=WARM_ITERATIONS, temperature=WARM_TEMPERATURE)
+        return force_layout(src, dst, num_vertices, seed=seed)
+    if algorithm == "spectral":
+        return spectral_layout(src, dst, num_vertices, seed=seed)
+    if algorithm == "circular":
+        return circular_layout(num_vertices)
+    if algorithm == "random":
+        return random_layout(num_vertices, seed)
+    raise ValueError(f"Unknown layout {algorithm!r}; expected one of {LAYOUTS}")
+
+
+class LayoutCache:
+    """Bounded LRU of layouts keyed by ``(graph hash, algorithm, seed)``.
+
+    On a miss for the force-directed layout of an edited graph, the cached
+    layout of the graph it was edited from (same algorithm and seed) seeds
+    the solver when its edge set is similar enough (new vertices start at
+    random positions), so small edits keep their overall shape and converge
+    in a few iterations.  Such layouts are keyed by that parent as well, so
+    a graph's coordinates never depend on what other sessions laid out.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, algorithm: str, src: np.ndarray, dst: np.ndarray, num_vertices: int,
+            seed=0, graph_key: str | None = None, parent_key: str | None = None) -> np.ndarray:
+        """Return cached positions, computing them on a miss.
+
+        ``parent_key`` is the ``graph_hash`` of the graph this one was edited
+        from; its cold-started layout, when cached, is the warm start.
+        """
+        graph_key = graph_key or graph_hash(src, dst, num_vertices)
+        with self._lock:
+            parent = None
+            if parent_key is not None and algorithm == "force":
+                parent = self._entries.get((parent_key, algorithm, seed, None))
+            key = (graph_key, algorithm, seed, parent_key if parent is not None else None)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+
+        init_pos = None
+        keys = None
+        if algorithm == "force":
+            # Keys are encoded against a fixed base so graphs of different
+            # sizes remain comparable.
+            keys = edge_keys(src, dst, 1 << 31)
+            if parent is not None and edge_similarity(parent[1], keys) >= WARM_SIMILARITY:
+                init_pos = _resize_positions(parent[0], num_vertices, seed)
+        pos = compute_layout(algorithm, src, dst, num_vertices, seed=seed, init_pos=init_pos)
+
+        with self._lock:
+            self._entries[key] = (pos, keys)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return pos
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def _resize_positions(previous: np.ndarray, num_vertices: int, seed=None) -> np.ndarray:
+    """Reuse the first ``num_vertices`` rows of ``previous``, padding randomly."""
+    n = int(num_vertices)
+    if len(previous) >= n:
+        return previous[:n].copy()
+    extra = random_layout(n - len(previous), seed)
+    return np.vstack([previous, extra])
@@ -0,0 +1,158 @@
+"""Folium builders for the map page: a static base map and small overlays.
+
+The base map (city markers plus the connection layer) only depends on the
+dataset and language, so pages build it once and cache it.  Per-selection
+content such as a route goes into a ``folium.FeatureGroup`` that
+``streamlit_folium.st_folium(feature_group_to_add=...)`` draws on top without
+reloading the base map in the browser.
+"""
+
+import math
+
+import folium
+
+
+def fit_zoom(lat, lon, width_px: int = 600) -> int:
+    """Leaflet zoom level at which the points' extent spans about ``width_px``."""
+    span = max(float(lat.max() - lat.min()), float(lon.max() - lon.min()), 1e-3) if len(lat) else 360.0
+    # One 256 px tile covers 360 degrees at zoom 0.
+    return int(min(max(math.floor(math.log2(360 * width_px / (256 * span))), 2), 12))
+
+
+def build_base_map(names, coords, center, zoom: int, marker_tooltip: str,
+                   connections: dict | None = None, connection_field: str = "label") -> folium.Map:
+    """City markers (and optionally a GeoJSON connection layer) on a new map.
+
+    ``marker_tooltip`` is formatted with ``city=<name>``; ``connections`` is a
+    FeatureCollection whose ``connection_field`` property is used as tooltip.
+    """
+    m = folium.Map(location=list(center), zoom_start=zoom)
+
+    for city, latlon in zip(names, coords):
+        folium.Marker(
+            location=latlon,
+            popup=f"<b>{city}</b>",
+            tooltip=marker_tooltip.format(city=city),
+            icon=folium.Icon(color='blue', icon='info-sign')
+        ).add_to(m)
+
+        folium.CircleMarker(
+            location=latlon,
+            radius=8,
+            popup=city,
+            color='red',
+            fill=True,
+            fill_color='red',
+            fill_opacity=0.6,
+            weight=2
+        ).add_to(m)
+
+    if connections is not None:
+        folium.GeoJson(
+            connections,
+            name="connections",
+            style_function=lambda feature: {"color": "gray", "weight": 1, "opacity": 0.3},
+            tooltip=folium.GeoJsonTooltip(fields=[connection_field], labels=False),
+        ).add_to(m)
+
+    return m
+
+
+def route_overlay(start, end, start_label: str, end_label: str, route_tooltip: str,
+                  path=None) -> folium.FeatureGroup:
+    """Start/end markers and the route line as one feature group.
+
+    ``path`` is the list of ``(lat, lon)`` points along the route; it defaults
+    to the straight segment from ``start`` to ``end``.
+    """
+    fg = folium.FeatureGroup(name="route")
+
+    folium.Marker(
+        location=start,
+        popup=f"<b>{start_label}</b>",
+        tooltip=start_label,
+        icon=folium.Icon(color='green', icon='play', prefix='fa')
+    ).add_to(fg)
+
+    folium.Marker(
+        location=end,
+        popup=f"<b>{end_label}</b>",
+        tooltip=end_label,
+        icon=folium.Icon(color='red', icon='stop', prefix='fa')
+    ).add_to(fg)
+
+    folium.PolyLine(
+        locations=path if path is not None else [start, end],
+        color="blue",
+        weight=4,
+        opacity=0.8,
+        tooltip=route_tooltip
+    ).add_to(fg)
+
+    for location, label, color in ((start, start_label, 'green'), (end, end_label, 'red')):
+        folium.CircleMarker(
+            location=location,
+            radius=10,
+            popup=label,
+            color=color,
+            fill=True,
+            fill_color=color,
+            fill_opacity=0.7,
+            weight=3
+        ).add_to(fg)
+
+    return fg
+
+
+def tour_overlay(coords, labels, tour_tooltip: str) -> folium.FeatureGroup:
+    """Closed tour line through ``coords`` with numbered stop markers."""
+    fg = folium.FeatureGroup(name="tour")
+
+    folium.PolyLine(
+        locations=list(coords) + list(coords[:1]),
+        color="blue",
+        weight=4,
+        opacity=0.8,
+        tooltip=tour_tooltip
+    ).add_to(fg)
+
+    for k, (location, label) in enumerate(zip(coords, labels)):
+        color = 'green' if k == 0 else 'blue'
+        folium.CircleMarker(
+            location=location,
+            radius=8,
+            popup=f"<b>{k + 1}. {label}</b>",
+            tooltip=f"{k + 1}. {label}",
+            color=color,
+            fill=True,
+            fill_color=color,
+            fill_opacity=0.7,
+            weight=2
+        ).add_to(fg)
+
+    return fg
+
+
+def cluster_overlay(points: dict, label_field: str = "label") -> folium.FeatureGroup:
+    """Cluster circles for the visible part of a large map as one feature group.
+
+    ``points`` is a Point FeatureCollection whose ``radius`` property sets the
+    circle size and whose ``label_field`` property is used as tooltip.
+    """
+    fg = folium.FeatureGroup(name="clusters")
+    folium.GeoJson(
+        points,
+        name="clusters",
+        marker=folium.CircleMarker(radius=6, color='red', fill=True, fill_color='red',
+                                   fill_opacity=0.6, weight=2),
+        style_function=lambda feature: {"radius": feature["properties"]["radius"]},
+        tooltip=folium.GeoJsonTooltip(fields=[label_field], labels=False),
+    ).add_to(fg)
+    return fg
+
+
+def detach(m: folium.Map, *overlays):
+    """Remove overlays that ``st_folium`` attached to a cached base map."""
+    for name, child in list(m._children.items()):
+        if any(child is overlay for overlay in overlays):
+            del m._children[name]
@@ -0,0 +1,235 @@
+"""Level-of-detail graph rendering with a bounded number of matplotlib artists.
+
+* ``"labels"``: small graphs, drawn like ``nx.draw(with_labels=True)``.
+* ``"vector"``: one ``LineCollection`` for all edges and one scatter for all
+  nodes, no labels.
+* ``"raster"``: edges and nodes are accumulated into pixel-density images, so
+  the figure holds two images no matter how large the graph is.
+
+Encoded images are kept in a ``RenderCache`` keyed by a digest of everything
+that affects the picture (edges, positions, labels, mode, size, format), so an
+unchanged graph is not drawn and encoded again on every rerun.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+# matplotlib is imported by the functions that draw, so pages that import this
+# module do not pay for it until the first render.
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+RENDER_MODES = ("auto", "labels", "vector", "raster")
+
+# Automatic mode switches: labels up to LABEL_LIMIT nodes, vector artists up
+# to RASTER_EDGE_LIMIT edges, density raster beyond that.
+LABEL_LIMIT = 100
+RASTER_EDGE_LIMIT = 20000
+
+NODE_COLOR = "lightblue"
+# Edges are rasterized in chunks to bound the temporary sample arrays.
+RASTER_CHUNK = 200_000
+MAX_SAMPLES_PER_EDGE = 256
+# Total samples across all edges; long edges get sparser sampling beyond it.
+SAMPLE_BUDGET = 4_000_000
+# Image formats ``encode_figure`` writes; PNG matches what st.pyplot sends.
+IMAGE_FORMATS = ("png", "svg")
+# Default byte budget of a ``RenderCache``.
+RENDER_CACHE_BYTES = 64 << 20
+
+
+def choose_mode(num_vertices: int, num_edges: int) -> str:
+    """Pick the cheapest mode that still gives a readable picture."""
+    if num_vertices <= LABEL_LIMIT:
+        return "labels"
+    if num_edges <= RASTER_EDGE_LIMIT:
+        return "vector"
+    return "raster"
+
+
+def node_size(num_vertices: int) -> float:
+    """Marker area that shrinks with graph size (800 matches the old page)."""
+    return float(np.clip(800 * 20 / max(num_vertices, 1), 2, 800))
+
+
+def _new_figure(size_px, dpi):
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(size_px[0] / dpi, size_px[1] / dpi), dpi=dpi)
+    ax = fig.add_subplot()
+    ax.set_axis_off()
+    ax.set_xlim(-0.05, 1.05)
+    ax.set_ylim(-0.05, 1.05)
+    return fig, ax
+
+
+def edge_density(pos: np.ndarray, src: np.ndarray, dst: np.ndarray, shape) -> np.ndarray:
+    """Count how many edge samples fall in each pixel of a ``(rows, cols)`` grid.
+
+    Each edge is sampled about once per pixel of its length, capped at
+    ``MAX_SAMPLES_PER_EDGE`` and by an overall ``SAMPLE_BUDGET``, and the work
+    is done in fixed-size chunks.
+    """
+    rows, cols = shape
+    scale = np.array([cols - 1, rows - 1], dtype=float)
+    density = np.zeros(rows * cols, dtype=np.int64)
+    cap = int(np.clip(SAMPLE_BUDGET // max(len(src), 1), 1, MAX_SAMPLES_PER_EDGE))
+
+    for start in range(0, len(src), RASTER_CHUNK):
+        a = pos[src[start:start + RASTER_CHUNK]] * scale
+        b = pos[dst[start:start + RASTER_CHUNK]] * scale
+        length = np.hypot(*(b - a).T)
+        samples = np.clip(np.ceil(length), 1, cap).astype(np.int64) + 1
+
+        owner = np.repeat(np.arange(len(a)), samples)
+        # Position of every sample along its own edge, in [0, 1].
+        first = np.cumsum(samples) - samples
+        step = np.arange(owner.size) - first[owner]
+        frac = step / (samples[owner] - 1)
+
+        points = a[owner] + (b - a)[owner] * frac[:, None]
+        x = np.clip(np.rint(points[:, 0]).astype(np.int64), 0, cols - 1)
+        y = np.clip(np.rint(points[:, 1]).astype(np.int64), 0, rows - 1)
+        density += np.bincount(y * cols + x, minlength=rows * cols)
+
+    return density.reshape(rows, cols)
+
+
+def render_graph(pos: np.ndarray, src: np.ndarray, dst: np.ndarray, labels=None,
+                 mode: str = "auto", size_px=(800, 600), dpi: int = 100) -> "Figure":
+    """Draw a graph from unit-square positions and return the matplotlib figure.
+
+    ``labels`` gives the text for each node in ``"labels"`` mode (default 1..n).
+    The figure is created without pyplot so it is not tracked globally.
+    """
+    from matplotlib.collections import LineCollection
+    from matplotlib.colors import LogNorm
+
+    n = len(pos)
+    if mode == "auto":
+        mode = choose_mode(n, len(src))
+    if mode not in RENDER_MODES:
+        raise ValueError(f"Unknown render mode {mode!r}; expected one of {RENDER_MODES}")
+
+    fig, ax = _new_figure(size_px, dpi)
+
+    if mode == "raster":
+        # Pixel grid matching the axes area so one sample is roughly one pixel.
+        cols, rows = int(size_px[0] / 1.1), int(size_px[1] / 1.1)
+        density = edge_density(pos, src, dst, (rows, cols))
+        extent = (0, 1, 0, 1)
+        if density.any():
+            ax.imshow(np.ma.masked_equal(density, 0), origin="lower", extent=extent,
+                      cmap="Greys", norm=LogNorm(vmin=1, vmax=density.max()),
+                      interpolation="nearest", aspect="auto")
+        nodes, _, _ = np.histogram2d(pos[:, 1], pos[:, 0], bins=(rows, cols),
+                                     range=((0, 1), (0, 1)))
+        if nodes.any():
+            ax.imshow(np.ma.masked_equal(nodes, 0), origin="lower", extent=extent,
+                      cmap="Blues", norm=LogNorm(vmin=1, vmax=nodes.max()), alpha=0.8,
+                      interpolation="nearest", aspect="auto")
+        return fig
+
+    if len(src):
+        segments = np.stack([pos[src], pos[dst]], axis=1)
+        linewidth = 1.0 if mode == "labels" else 0.4
+        alpha = 1.0 if mode == "labels" else 0.5
+        ax.add_collection(LineCollection(segments, colors="black", linewidths=linewidth,
+                                         alpha=alpha, zorder=1))
+
+    ax.scatter(pos[:, 0], pos[:, 1], s=node_size(n), c=NODE_COLOR,
+               linewidths=0, zorder=2)
+
+    if mode == "labels":
+        labels = range(1, n + 1) if labels is None else labels
+        for (x, y), label in zip(pos, labels):
+            ax.text(x, y, str(label), fontsize=12, ha="center", va="center", zorder=3)
+    return fig
+
+
+def render_key(pos: np.ndarray, src: np.ndarray, dst: np.ndarray, labels=None,
+               mode: str = "auto", size_px=(800, 600), dpi: int = 100,
+               fmt: str = "png", image_dpi: int = 200) -> str:
+    """Digest of the inputs of ``render_graph`` plus the encoding settings."""
+    if mode == "auto":
+        mode = choose_mode(len(pos), len(src))
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((mode, tuple(size_px), dpi, fmt, image_dpi, len(pos))).encode())
+    for array in (pos, src, dst):
+        array = np.ascontiguousarray(array)
+        digest.update(str(array.dtype).encode())
+        digest.update(array.tobytes())
+    # Labels are only drawn in "labels" mode.
+    if mode == "labels" and labels is not None:
+        digest.update("\0".join(map(str, labels)).encode())
+    return digest.hexdigest()
+
+
+def encode_figure(fig: "Figure", fmt: str = "png", dpi: int = 200) -> bytes:
+    """Encode ``fig`` like ``st.pyplot`` (tight bounding box) and release it."""
+    if fmt not in IMAGE_FORMATS:
+        raise ValueError(f"Unknown image format {fmt!r}; expected one of {IMAGE_FORMATS}")
+    buffer = BytesIO()
+    try:
+        fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches="tight")
+    finally:
+        # Drop the artists now rather than when the figure is garbage collected.
+        fig.clear()
+    return buffer.getvalue()
+
+
+class RenderCache:
+    """LRU of encoded images bounded by their total size in bytes.
+
+    Safe to share between sessions; an image larger than the whole budget is
+    returned but not stored.
+    """
+
+    def __init__(self, max_bytes: int = RENDER_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        """Cached image for ``key``, or ``None`` (counted as a miss)."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: str, data: bytes):
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= len(self._entries.pop(key))
+            if len(data) > self.max_bytes:
+                return
+            self._entries[key] = data
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
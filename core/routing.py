@@ -0,0 +1,158 @@
+"""Shortest-path routing over a weighted graph of locations.
+
+The road graph is either given as an edge list (e.g. a loaded road adjacency
+list) or built as a k-nearest-neighbour graph, joined with the minimum
+spanning tree so that every pair of locations is reachable.  Small networks
+precompute all-pairs shortest paths (repeated Dijkstra), after which a route
+lookup only walks the predecessor row; larger ones answer queries with A*
+and a haversine heuristic.
+"""
+
+import heapq
+
+import numpy as np
+
+from core.distance import haversine, pairwise
+
+# Networks up to this many nodes get an all-pairs predecessor matrix.
+APSP_LIMIT = 2000
+# Haversine on the mean-radius sphere can exceed the ellipsoidal distance by
+# a fraction of a percent; shrink it so the A* heuristic stays admissible.
+HEURISTIC_SCALE = 0.99
+
+
+def knn_edges(dist: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Undirected edges joining every point to its ``k`` nearest neighbours."""
+    n = dist.shape[0]
+    k = min(int(k), n - 1)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    masked = dist.copy()
+    np.fill_diagonal(masked, np.inf)
+    nearest = np.argpartition(masked, k - 1, axis=1)[:, :k]
+    src = np.repeat(np.arange(n), k)
+    dst = nearest.ravel()
+    return np.minimum(src, dst), np.maximum(src, dst)
+
+
+def mst_edges(dist: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Edges of the minimum spanning tree of a dense distance matrix."""
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import minimum_spanning_tree
+
+    tree = minimum_spanning_tree(sp.csr_matrix(np.triu(dist, k=1))).tocoo()
+    return tree.row.astype(np.int64), tree.col.astype(np.int64)
+
+
+class RoadNetwork:
+    """Weighted undirected graph over points with cached shortest paths."""
+
+    def __init__(self, lat, lon, src, dst, weight):
+        import scipy.sparse as sp
+        from scipy.sparse.csgraph import shortest_path
+
+        self.lat = np.asarray(lat, dtype=float)
+        self.lon = np.asarray(lon, dtype=float)
+        n = self.lat.size
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weight = np.asarray(weight, dtype=float)
+
+        # Keep the shortest of any parallel edges, in both directions.
+        rows = np.concatenate([src, dst])
+        cols = np.concatenate([dst, src])
+        w = np.concatenate([weight, weight])
+        order = np.lexsort((w, cols, rows))
+        rows, cols, w = rows[order], cols[order], w[order]
+        first = np.ones(rows.size, dtype=bool)
+        first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+        self.graph = sp.csr_matrix((w[first], (rows[first], cols[first])), shape=(n, n))
+
+        self.distances = None
+        self.predecessors = None
+        if n <= APSP_LIMIT:
+            self.distances, self.predecessors = shortest_path(
+                self.graph, method="D", directed=False, return_predecessors=True
+            )
+
+    @classmethod
+    def from_knn(cls, lat, lon, dist: np.ndarray, k: int = 4):
+        """k-nearest-neighbour graph plus the MST, weighted by ``dist``."""
+        ks, kd = knn_edges(dist, k)
+        ms, md = mst_edges(dist)
+        src = np.concatenate([ks, ms])
+        dst = np.concatenate([kd, md])
+        return cls(lat, lon, src, dst, dist[src, dst])
+
+    @classmethod
+    def from_index(cls, index, k: int = 4):
+        """k-nearest-neighbour graph plus the geodesic MST from a ``SpatialIndex``,
+        for point sets too large for a dense distance matrix; edges are
+        weighted with Vincenty."""
+        from core.connections import spanning_tree_edges
+
+        ks, kd = index.knn_edges(k)
+        # The tree comes from the Delaunay triangulation, in O(n log n).
+        ms, md = spanning_tree_edges(index.lat, index.lon)
+        src = np.concatenate([ks, ms])
+        dst = np.concatenate([kd, md])
+        weight = pairwise(index.lat[src], index.lon[src], index.lat[dst], index.lon[dst],
+                          method="vincenty")
+        return cls(index.lat, index.lon, src, dst, weight)
+
+    @property
+    def num_edges(self) -> int:
+        return self.graph.nnz // 2
+
+    def edges(self) -> tuple[np.ndarray, np.ndarray]:
+        """Each undirected edge once, as ``(src, dst)`` with ``src < dst``."""
+        import scipy.sparse as sp
+
+        upper = sp.triu(self.graph, k=1).tocoo()
+        return upper.row.astype(np.int64), upper.col.astype(np.int64)
+
+    def route(self, source: int, target: int) -> tuple[list, float]:
+        """Shortest path as ``(node list, length)``; ``([], inf)`` if unreachable."""
+        if self.predecessors is not None:
+            return self._lookup(source, target)
+        return self.astar(source, target)
+
+    def _lookup(self, source: int, target: int):
+        length = float(self.distances[source, target])
+        if not np.isfinite(length):
+            return [], float("inf")
+        pred = self.predecessors[source]
+        path = [target]
+        while path[-1] != source:
+            path.append(int(pred[path[-1]]))
+        return path[::-1], length
+
+    def astar(self, source: int, target: int):
+        """A* search with a scaled haversine heuristic towards ``target``."""
+        indptr = self.graph.indptr
+        indices = self.graph.indices
+        weights = self.graph.data
+        h = HEURISTIC_SCALE * haversine(self.lat, self.lon, self.lat[target], self.lon[target])
+
+        best = {source: 0.0}
+        parent = {source: source}
+        heap = [(h[source], 0.0, source)]
+        closed = set()
+        while heap:
+            _, g, v = heapq.heappop(heap)
+            if v == target:
+                path = [v]
+                while path[-1] != source:
+                    path.append(parent[path[-1]])
+                return path[::-1], g
+            if v in closed:
+                continue
+            closed.add(v)
+            for i in range(indptr[v], indptr[v + 1]):
+                w = int(indices[i])
+                cost = g + weights[i]
+                if cost < best.get(w, np.inf):
+                    best[w] = cost
+                    parent[w] = v
+                    heapq.heappush(heap, (cost + h[w], cost, w))
+        return [], float("inf")
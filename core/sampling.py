@@ -0,0 +1,85 @@
+"""Uniform G(n, m) edge sampling without materialising the list of vertex pairs.
+
+Every undirected pair ``(i, j)`` with ``0 <= i < j < n`` has a linear index in
+row-major order of the strict upper triangle.  Sampling ``m`` distinct indices
+and unranking them back into pairs costs O(m) time and memory instead of the
+O(n²) needed to build ``possible_edges`` and call ``random.sample`` on it.
+"""
+
+import numpy as np
+
+# Below this fill ratio, rejection sampling of pair indices wastes little work;
+# above it we sample the (smaller) complement and take the set difference.
+DENSE_FRACTION = 0.5
+
+
+def max_edges(num_vertices: int) -> int:
+    """Number of edges in the complete simple graph on ``num_vertices`` nodes."""
+    n = int(num_vertices)
+    return n * (n - 1) // 2 if n > 1 else 0
+
+
+def _row_offset(i: np.ndarray, n: int) -> np.ndarray:
+    """Linear index of pair ``(i, i + 1)``, i.e. the first pair in row ``i``."""
+    return i * (2 * n - i - 1) // 2
+
+
+def unrank_pairs(index: np.ndarray, num_vertices: int) -> tuple[np.ndarray, np.ndarray]:
+    """Map linear pair indices back to ``(i, j)`` arrays with ``i < j``."""
+    n = int(num_vertices)
+    k = np.asarray(index, dtype=np.int64)
+
+    # Closed-form inverse of the row offset, then a one-step fix-up for
+    # floating-point rounding when n(n-1)/2 is too large for exact sqrt.
+    b = 2 * n - 1
+    i = np.floor((b - np.sqrt(float(b) * b - 8.0 * k)) / 2).astype(np.int64)
+    np.clip(i, 0, max(n - 2, 0), out=i)
+    i -= _row_offset(i, n) > k
+    i += _row_offset(i + 1, n) <= k
+
+    j = k - _row_offset(i, n) + i + 1
+    return i, j
+
+
+def _distinct_indices(rng: np.random.Generator, total: int, count: int) -> np.ndarray:
+    """Draw ``count`` distinct integers from ``[0, total)`` by rejection."""
+    if count == 0:
+        return np.empty(0, dtype=np.int64)
+
+    chosen = np.empty(0, dtype=np.int64)
+    while chosen.size < count:
+        need = count - chosen.size
+        # Over-draw a little so one round is usually enough.
+        draw = rng.integers(0, total, size=need + need // 8 + 16, dtype=np.int64)
+        chosen = np.union1d(chosen, draw)
+
+    if chosen.size > count:
+        chosen = rng.choice(chosen, size=count, replace=False)
+    return chosen
+
+
+def sample_edge_indices(num_vertices: int, num_edges: int, seed=None) -> np.ndarray:
+    """Sample ``num_edges`` distinct linear pair indices uniformly at random."""
+    total = max_edges(num_vertices)
+    m = int(num_edges)
+    if m < 0 or m > total:
+        raise ValueError(f"num_edges must be between 0 and {total}, got {m}")
+
+    rng = np.random.default_rng(seed)
+    if m <= DENSE_FRACTION * total:
+        index = _distinct_indices(rng, total, m)
+    else:
+        # total < 2m here, so the complement costs O(m) as well.
+        excluded = _distinct_indices(rng, total, total - m)
+        index = np.setdiff1d(np.arange(total, dtype=np.int64), excluded, assume_unique=True)
+    return rng.permutation(index)
+
+
+def sample_gnm_edges(num_vertices: int, num_edges: int, seed=None) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(src, dst)`` arrays for a uniform random simple graph G(n, m).
+
+    Vertices are numbered ``0 .. n-1`` and every edge satisfies ``src < dst``.
+    Raises ``ValueError`` when ``num_edges`` exceeds ``max_edges(num_vertices)``.
+    """
+    index = sample_edge_indices(num_vertices, num_edges, seed=seed)
+    return unrank_pairs(index, num_vertices)
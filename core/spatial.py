@@ -0,0 +1,77 @@
+"""Spatial index for nearest-k and radius queries on latitude/longitude points.
+
+Points are mapped to unit vectors on the sphere and stored in a KD-tree, so
+great-circle order equals Euclidean (chord) order and each query costs
+O(log n) instead of a scan over every location.
+"""
+
+import numpy as np
+
+from core.distance import EARTH_RADIUS_KM
+
+
+def to_unit_xyz(lat, lon) -> np.ndarray:
+    """Unit vectors (n, 3) for latitude/longitude arrays in degrees."""
+    lat = np.radians(np.asarray(lat, dtype=float))
+    lon = np.radians(np.asarray(lon, dtype=float))
+    cos_lat = np.cos(lat)
+    return np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def chord_to_km(chord):
+    """Great-circle distance (km) for a chord length on the unit sphere."""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(np.asarray(chord) / 2, 0, 1))
+
+
+def km_to_chord(km):
+    """Chord length on the unit sphere for a great-circle distance in km."""
+    return 2 * np.sin(np.minimum(np.asarray(km, dtype=float), np.pi * EARTH_RADIUS_KM)
+                      / (2 * EARTH_RADIUS_KM))
+
+
+class SpatialIndex:
+    """KD-tree over points on the sphere; distances are reported in km."""
+
+    def __init__(self, lat, lon):
+        from scipy.spatial import cKDTree
+
+        self.lat = np.asarray(lat, dtype=float)
+        self.lon = np.asarray(lon, dtype=float)
+        self.tree = cKDTree(to_unit_xyz(self.lat, self.lon))
+
+    def __len__(self) -> int:
+        return self.lat.size
+
+    def nearest(self, lat, lon, k: int = 1):
+        """Indices and distances (km) of the ``k`` nearest points, closest first.
+
+        Scalar queries return 1-D arrays of length ``k``; array queries return
+        ``(m, k)`` arrays.
+        """
+        k = min(int(k), len(self))
+        chord, index = self.tree.query(to_unit_xyz(lat, lon), k=k)
+        if k == 1:
+            chord, index = np.asarray(chord)[..., None], np.asarray(index)[..., None]
+        return index, chord_to_km(chord)
+
+    def within(self, lat: float, lon: float, radius_km: float):
+        """Indices and distances (km) of all points within ``radius_km``, closest first."""
+        point = to_unit_xyz(lat, lon)
+        index = np.asarray(self.tree.query_ball_point(point, km_to_chord(radius_km)), dtype=np.int64)
+        dist = chord_to_km(np.linalg.norm(self.tree.data[index] - point, axis=1))
+        order = np.argsort(dist, kind="stable")
+        return index[order], dist[order]
+
+    def knn_edges(self, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Undirected edges joining every point to its ``k`` nearest neighbours,
+        each once as ``(src, dst)`` with ``src < dst``."""
+        n = len(self)
+        k = min(int(k), n - 1)
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        nearest, _ = self.nearest(self.lat, self.lon, k=k + 1)
+        src = np.repeat(np.arange(n), k + 1)
+        dst = nearest.ravel()
+        keep = src != dst
+        pairs = np.unique(np.minimum(src, dst)[keep] * n + np.maximum(src, dst)[keep])
+        return pairs // n, pairs % n
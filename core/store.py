@@ -0,0 +1,90 @@
+"""Bounded history of generated graphs and the data derived from them.
+
+The store itself is plain Python; pages keep one instance per browser session
+in ``st.session_state`` so graphs survive reruns triggered by other widgets.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+# Default number of graphs remembered per session.
+HISTORY_SIZE = 8
+
+
+class GraphEntry:
+    """An edge list plus memoized derived values (degrees, adjacency, layouts...)."""
+
+    def __init__(self, key, src: np.ndarray, dst: np.ndarray, num_vertices: int):
+        self.key = key
+        self.src = src
+        self.dst = dst
+        self.num_vertices = int(num_vertices)
+        self._derived = {}
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.src)
+
+    def derived(self, name, compute):
+        """Return the value stored under ``name``, calling ``compute()`` once if missing."""
+        if name not in self._derived:
+            self._derived[name] = compute()
+        return self._derived[name]
+
+    def update(self, src: np.ndarray, dst: np.ndarray, num_vertices: int, derived=None):
+        """Swap in an edited edge list; derived values are replaced by ``derived``."""
+        self.src = src
+        self.dst = dst
+        self.num_vertices = int(num_vertices)
+        self._derived = dict(derived or {})
+
+
+class GraphStore:
+    """LRU of ``GraphEntry`` objects keyed by their generation parameters.
+
+    Keys are tuples such as ``(vertices, edges, seed, model)``; generating with
+    a key that is already stored returns the existing entry unchanged.
+    """
+
+    def __init__(self, max_entries: int = HISTORY_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.current_key = None
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_create(self, key, generate) -> GraphEntry:
+        """Return the entry for ``key``, building it with ``generate()`` on a miss.
+
+        ``generate`` must return ``(src, dst, num_vertices)``.  The entry
+        becomes the current graph.
+        """
+        if key not in self._entries:
+            src, dst, num_vertices = generate()
+            self._entries[key] = GraphEntry(key, src, dst, num_vertices)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return self.select(key)
+
+    def get(self, key) -> GraphEntry | None:
+        """Stored entry for ``key`` without changing the current graph or the LRU order."""
+        return self._entries.get(key)
+
+    def select(self, key) -> GraphEntry:
+        """Make a stored graph the current one and mark it most recently used."""
+        self._entries.move_to_end(key)
+        self.current_key = key
+        return self._entries[key]
+
+    @property
+    def current(self) -> GraphEntry | None:
+        return self._entries.get(self.current_key)
+
+    def history(self) -> list:
+        """Stored keys, most recently used first."""
+        return list(reversed(self._entries))
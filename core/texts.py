@@ -0,0 +1,505 @@
+"""Translation tables and theme palettes shared by the pages.
+
+Kept out of the page scripts so the dictionaries are built once per process
+instead of on every Streamlit rerun.
+"""
+
+# Background colours offered on the home page.
+SOLID_THEMES = {
+    "Light Blue": "#E3F2FD",
+    "Soft Green": "#E8F5E9",
+    "Warm Beige": "#FFF3E0",
+    "Ice Gray": "#ECEFF1",
+    "Soft Pink": "#FCE4EC",
+}
+
+GRADIENT_THEMES = {
+    "Sky Blue": "linear-gradient(135deg, #c9e9ff, #81c4ff)",
+    "Purple Sunset": "linear-gradient(135deg, #e3a7ff, #9b51e0)",
+    "Aqua Fresh": "linear-gradient(135deg, #d5fff7, #68e2c6)",
+    "Warm Flame": "linear-gradient(135deg, #ffd6a5, #ff8fab)",
+}
+
+# Home page copy, keyed by language name.
+HOME_CONTENT = {
+    "English": {
+        "badge": "Graph Theory",
+        "title": "Introduction to Graph Theory",
+        "p1": """Graph theory is a branch of mathematics that studies structures made of
+                 <strong>vertices (nodes)</strong> and <strong>edges (connections)</strong>.
+                 It provides a powerful framework for analyzing and modeling networks in real-world systems.""",
+        "p2": """Examples include social networks, computer networks, transportation routes,
+                 biological networks, and many more.""",
+        "basic_title": "Basic Concepts",
+        "basic_list": [
+            "<strong>Vertex (Node):</strong> The basic unit in a graph.",
+            "<strong>Edge:</strong> A connection between two vertices.",
+            "<strong>Degree:</strong> Number of edges connected to a vertex.",
+            "<strong>Path:</strong> A sequence of connected vertices.",
+            "<strong>Cycle:</strong> A path that begins and ends at the same vertex.",
+            "<strong>Connected Graph:</strong> Every pair of vertices is reachable.",
+        ],
+        "app_title": "Applications of Graph Theory",
+        "app_list": [
+            "<strong>Social Networks:</strong> Modeling friendships and community structures.",
+            "<strong>Logistics & Routing:</strong> Shortest paths, delivery routes, and optimization.",
+            "<strong>Computer Networks:</strong> Understanding connections between servers and devices.",
+            "<strong>Machine Learning:</strong> Graph embeddings, clustering, and recommendation systems.",
+        ],
+    },
+    "Bahasa Indonesia": {
+        "badge": "Teori Graf",
+        "title": "Pengenalan Teori Graf",
+        "p1": """Teori graf adalah cabang matematika yang mempelajari struktur yang terdiri dari
+                 <strong>simpul (vertex/node)</strong> dan <strong>sisi (edge/hubungan)</strong>.
+                 Teori ini menjadi kerangka yang kuat untuk menganalisis dan memodelkan jaringan pada sistem nyata.""",
+        "p2": """Contohnya antara lain jejaring sosial, jaringan komputer, rute transportasi,
+                 jaringan biologis, dan masih banyak lagi.""",
+        "basic_title": "Konsep Dasar",
+        "basic_list": [
+            "<strong>Simpul (Vertex/Node):</strong> Unit dasar dalam graf.",
+            "<strong>Sisi (Edge):</strong> Hubungan yang menghubungkan dua simpul.",
+            "<strong>Derajat (Degree):</strong> Jumlah sisi yang terhubung ke sebuah simpul.",
+            "<strong>Lintasan (Path):</strong> Urutan simpul yang saling terhubung.",
+            "<strong>Siklus (Cycle):</strong> Lintasan yang berawal dan berakhir pada simpul yang sama.",
+            "<strong>Graf Terhubung (Connected Graph):</strong> Setiap pasangan simpul dapat dicapai.",
+        ],
+        "app_title": "Penerapan Teori Graf",
+        "app_list": [
+            "<strong>Jejaring Sosial:</strong> Memodelkan pertemanan dan struktur komunitas.",
+            "<strong>Logistik & Rute:</strong> Jalur terpendek, rute pengiriman, dan optimasi.",
+            "<strong>Jaringan Komputer:</strong> Memahami koneksi antar server dan perangkat.",
+            "<strong>Pembelajaran Mesin:</strong> Graph embedding, clustering, dan sistem rekomendasi.",
+        ],
+    },
+}
+
+# Group profile page copy.
+PROFILE_CONTENT = {
+    "English": {
+        "page_title": "👥 Group Members",
+        "subtitle": "Meet the team behind this project — the people planning, designing, and building it.",
+        "roles": {
+            "leader": "Project Leader",
+            "dev": "Developer",
+            "rd": "Research & Design",
+        }
+    },
+    "Bahasa Indonesia": {
+        "page_title": "👥 Anggota Kelompok",
+        "subtitle": "Kenali tim di balik proyek ini — orang-orang yang merencanakan, mendesain, dan membangunnya.",
+        "roles": {
+            "leader": "Ketua Proyek",
+            "dev": "Pengembang",
+            "rd": "Riset & Desain",
+        }
+    },
+}
+
+# Graph visualization page strings, keyed by language name.
+GRAPH_TEXTS = {
+    "English": {
+        "title": "Graph Visualization with Degree & Adjacency Matrix",
+        "vertices": "Input Number of Vertices:",
+        "edges": "Input Number of Edges:",
+        "button": "Generate Graph",
+        "error": "Number of edges exceeds the maximum:",
+        "degree_title": "📌 Degree of Each Node",
+        "adj_title": "📌 Adjacency Matrix",
+        "node": "Node",
+        "degree": "Degree",
+        "nodes": "Nodes",
+        "row_start": "First row",
+        "col_start": "First column",
+        "window_size": "Window size",
+        "window_caption": "Showing rows {r0}–{r1} and columns {c0}–{c1} of {n}",
+        "download_mtx": "Download Matrix Market (.mtx)",
+        "download_npz": "Download sparse NumPy (.npz)",
+        "download_csv": "Download CSV",
+        "deg_min": "Min degree",
+        "deg_max": "Max degree",
+        "deg_mean": "Mean degree",
+        "deg_var": "Variance",
+        "hist_title": "Degree distribution (log-binned)",
+        "top_title": "Highest-degree nodes",
+        "show_all": "Show degree of every node",
+        "page": "Page",
+        "layout": "Layout:",
+        "layout_names": {
+            "force": "Force-directed",
+            "spectral": "Spectral",
+            "circular": "Circular",
+            "random": "Random",
+        },
+        "conn_title": "📌 Connectivity",
+        "components": "Components",
+        "largest": "Largest component",
+        "bridges": "Bridges",
+        "cut_vertices": "Articulation points",
+        "comp_size": "Component size",
+        "comp_count": "Number of components",
+        "edge": "Edge",
+        "seed": "Random seed:",
+        "history": "Recent graphs",
+        "history_item": "{n} vertices, {m} edges, seed {seed}",
+        "render_mode": "Drawing detail:",
+        "render_names": {
+            "auto": "Automatic",
+            "labels": "Nodes with labels",
+            "vector": "Nodes and edges, no labels",
+            "raster": "Density image",
+        },
+        "source": "Graph source:",
+        "source_names": {
+            "random": "Random graph",
+            "upload": "Upload a file",
+            "path": "File on the server",
+        },
+        "upload": "Edge list (.csv, .tsv, .txt), Matrix Market (.mtx) or adjacency list (.adjlist), optionally .gz",
+        "path": "Path to the graph file, relative to the data folder:",
+        "path_outside": "Only files inside the {folder} folder can be imported.",
+        "import_format": "File format:",
+        "format_names": {
+            None: "Detect from the file name",
+            "edgelist": "Edge list (two ids per line)",
+            "mtx": "Matrix Market (coordinate)",
+            "adjlist": "Adjacency list (id and its neighbours per line)",
+        },
+        "import_button": "Import Graph",
+        "import_error": "Could not import the graph: {error}",
+        "import_summary": "Imported {n:,} vertices and {m:,} edges from {name} "
+                          "({loops:,} self-loops and {dups:,} repeated edges dropped).",
+        "history_import": "{name}: {n} vertices, {m} edges",
+        "model": "Random graph model:",
+        "model_names": {
+            "gnm": "G(n, m): fixed number of edges",
+            "gnp": "G(n, p): independent edges",
+            "ba": "Barabási–Albert",
+            "ws": "Watts–Strogatz",
+            "geometric": "Random geometric",
+            "sbm": "Stochastic block model",
+        },
+        "param_names": {
+            "p": "Edge probability p:",
+            "m": "Edges per new vertex m:",
+            "k": "Ring neighbours k:",
+            "radius": "Connection radius:",
+            "blocks": "Number of blocks:",
+            "p_in": "Probability within a block:",
+            "p_out": "Probability between blocks:",
+        },
+        "history_model": "{model} ({params}), {n} vertices, seed {seed}",
+        "render_cache": "Image cache: {hits} hits, {misses} misses, {entries} images, "
+                        "{bytes:,} of {max_bytes:,} bytes",
+        "edit_title": "✏️ Edit graph",
+        "edit_operation": "Change:",
+        "edit_names": {
+            "add_edge": "Add edge",
+            "remove_edge": "Remove edge",
+            "add_vertex": "Add vertex",
+            "remove_vertex": "Remove vertex",
+        },
+        "edit_vertex": "Vertex:",
+        "edit_other": "Other vertex:",
+        "edit_neighbors": "Connect to (comma-separated, optional):",
+        "edit_button": "Apply",
+        "edit_unknown": "There is no vertex named {name}.",
+        "edit_unchanged": "Nothing changed: the edge already exists, is missing or is a self-loop.",
+        "edit_last": "The last vertex cannot be removed.",
+        "edit_done": "Edit {version} applied in {ms:.1f} ms.",
+        "history_edit": "Edited: {base}",
+    },
+    "Bahasa Indonesia": {
+        "title": "Visualisasi Graf dengan Derajat & Matriks Ketetanggaan",
+        "vertices": "Masukkan Jumlah Simpul:",
+        "edges": "Masukkan Jumlah Sisi:",
+        "button": "Buat Graf",
+        "error": "Jumlah sisi melebihi maksimum:",
+        "degree_title": "📌 Derajat Setiap Simpul",
+        "adj_title": "📌 Matriks Ketetanggaan",
+        "node": "Simpul",
+        "degree": "Derajat",
+        "nodes": "Simpul",
+        "row_start": "Baris pertama",
+        "col_start": "Kolom pertama",
+        "window_size": "Ukuran jendela",
+        "window_caption": "Menampilkan baris {r0}–{r1} dan kolom {c0}–{c1} dari {n}",
+        "download_mtx": "Unduh Matrix Market (.mtx)",
+        "download_npz": "Unduh NumPy sparse (.npz)",
+        "download_csv": "Unduh CSV",
+        "deg_min": "Derajat minimum",
+        "deg_max": "Derajat maksimum",
+        "deg_mean": "Rata-rata derajat",
+        "deg_var": "Variansi",
+        "hist_title": "Distribusi derajat (bin logaritmik)",
+        "top_title": "Simpul dengan derajat tertinggi",
+        "show_all": "Tampilkan derajat setiap simpul",
+        "page": "Halaman",
+        "layout": "Tata letak:",
+        "layout_names": {
+            "force": "Berbasis gaya (force-directed)",
+            "spectral": "Spektral",
+            "circular": "Melingkar",
+            "random": "Acak",
+        },
+        "conn_title": "📌 Keterhubungan",
+        "components": "Komponen",
+        "largest": "Komponen terbesar",
+        "bridges": "Jembatan",
+        "cut_vertices": "Titik artikulasi",
+        "comp_size": "Ukuran komponen",
+        "comp_count": "Jumlah komponen",
+        "edge": "Sisi",
+        "seed": "Seed acak:",
+        "history": "Graf terakhir",
+        "history_item": "{n} simpul, {m} sisi, seed {seed}",
+        "render_mode": "Tingkat detail gambar:",
+        "render_names": {
+            "auto": "Otomatis",
+            "labels": "Simpul dengan label",
+            "vector": "Simpul dan sisi, tanpa label",
+            "raster": "Citra kepadatan",
+        },
+        "source": "Sumber graf:",
+        "source_names": {
+            "random": "Graf acak",
+            "upload": "Unggah berkas",
+            "path": "Berkas di server",
+        },
+        "upload": "Daftar sisi (.csv, .tsv, .txt), Matrix Market (.mtx) atau daftar ketetanggaan (.adjlist), boleh .gz",
+        "path": "Lokasi berkas graf, relatif terhadap folder data:",
+        "path_outside": "Hanya berkas di dalam folder {folder} yang dapat diimpor.",
+        "import_format": "Format berkas:",
+        "format_names": {
+            None: "Deteksi dari nama berkas",
+            "edgelist": "Daftar sisi (dua id per baris)",
+            "mtx": "Matrix Market (koordinat)",
+            "adjlist": "Daftar ketetanggaan (id dan tetangganya per baris)",
+        },
+        "import_button": "Impor Graf",
+        "import_error": "Graf tidak dapat diimpor: {error}",
+        "import_summary": "Berhasil mengimpor {n:,} simpul dan {m:,} sisi dari {name} "
+                          "({loops:,} loop dan {dups:,} sisi ganda dibuang).",
+        "history_import": "{name}: {n} simpul, {m} sisi",
+        "model": "Model graf acak:",
+        "model_names": {
+            "gnm": "G(n, m): jumlah sisi tetap",
+            "gnp": "G(n, p): sisi independen",
+            "ba": "Barabási–Albert",
+            "ws": "Watts–Strogatz",
+            "geometric": "Geometris acak",
+            "sbm": "Stochastic block model",
+        },
+        "param_names": {
+            "p": "Peluang sisi p:",
+            "m": "Sisi per simpul baru m:",
+            "k": "Tetangga pada cincin k:",
+            "radius": "Jari-jari keterhubungan:",
+            "blocks": "Jumlah blok:",
+            "p_in": "Peluang di dalam blok:",
+            "p_out": "Peluang antar blok:",
+        },
+        "history_model": "{model} ({params}), {n} simpul, seed {seed}",
+        "render_cache": "Cache gambar: {hits} hit, {misses} miss, {entries} gambar, "
+                        "{bytes:,} dari {max_bytes:,} byte",
+        "edit_title": "✏️ Ubah graf",
+        "edit_operation": "Perubahan:",
+        "edit_names": {
+            "add_edge": "Tambah sisi",
+            "remove_edge": "Hapus sisi",
+            "add_vertex": "Tambah simpul",
+            "remove_vertex": "Hapus simpul",
+        },
+        "edit_vertex": "Simpul:",
+        "edit_other": "Simpul lainnya:",
+        "edit_neighbors": "Hubungkan ke (pisahkan dengan koma, opsional):",
+        "edit_button": "Terapkan",
+        "edit_unknown": "Tidak ada simpul bernama {name}.",
+        "edit_unchanged": "Tidak ada perubahan: sisi sudah ada, tidak ada, atau berupa loop.",
+        "edit_last": "Simpul terakhir tidak dapat dihapus.",
+        "edit_done": "Perubahan ke-{version} diterapkan dalam {ms:.1f} ms.",
+        "history_edit": "Diubah: {base}",
+    }
+}
+
+# Map page strings, keyed by ``"en"``/``"id"``.
+MAP_LANG = {
+    "en": {
+        "page_title": "West Java Map",
+        "title": "🗺️ West Java Map with Distance Calculator",
+        "desc": "Interactive map showing all cities/regencies in West Java with distance calculation",
+        "about": "About",
+        "about_info": "This application displays cities and regencies in West Java province with distance calculation between any two selected locations.",
+        "features": "**Features:**",
+        "feat_1": "- Interactive map with all cities/regencies",
+        "feat_2": "- Connection lines between locations",
+        "feat_3": "- Distance calculator",
+        "feat_4": "- Route highlighting",
+        "feat_5": "- Multi-stop route planner",
+        "list_title": "City/Regency List",
+        "main_map": "West Java Province Map",
+        "show_connections": "Connection lines",
+        "connection_modes": {
+            None: "None",
+            "complete": "All pairs",
+            "mst": "Minimum spanning tree",
+            "delaunay": "Delaunay triangulation",
+            "knn": "{k} nearest neighbours",
+        },
+        "connections_too_many": "{m:,} lines are too many to draw; choose a sparser mode.",
+        "tooltip_click": "Click for {city} info",
+        "connection_tooltip": "{c1} - {c2}: {d:.1f} km",
+        "distance_calc": "📍 Distance Calculator",
+        "search_city": "Search by name:",
+        "search_help": "Lists up to {n} names starting with this text.",
+        "select_first": "Select first city:",
+        "select_second": "Select second city:",
+        "calc_btn": "Calculate Distance",
+        "warn_same": "Please select two different cities.",
+        "distance_between": "**Distance between {c1} and {c2}: {d:.2f} km**",
+        "route_title": "Route: {c1} → {c2}",
+        "start": "Start: {city}",
+        "dest": "Destination: {city}",
+        "route_tooltip": "Route: {d:.2f} km",
+        "route_via": "**Shortest road route ({k}-nearest-neighbour network): {path} — {d:.2f} km**",
+        "no_route": "No route found between {c1} and {c2}.",
+        "clicked_nearest": "Nearest city to the clicked point: **{city}** ({d:.1f} km)",
+        "clicked_within": "Cities within {r} km: {cities}",
+        "clicked_none": "No cities within {r} km.",
+        "tour_title": "🧭 Multi-stop Route Planner",
+        "tour_select": "Select stops (the first one is the starting point):",
+        "tour_hint": "Select at least two stops to plan a tour.",
+        "tour_total": "**Tour over {n} stops: {d:.2f} km** (returning to {city})",
+        "tour_tooltip": "Tour: {d:.2f} km",
+        "tour_columns": ["Stop", "City", "Leg (km)", "Total (km)"],
+        "dataset": "Dataset",
+        "dataset_info": "{n:,} locations",
+        "list_more": "... and {n:,} more",
+        "clustered": "{n:,} locations are grouped into clusters; zoom in to see individual locations.",
+        "cluster_tooltip": "{n:,} locations",
+        "connections_limited": "All-pairs lines are available for up to {n:,} locations.",
+        "map_features": "Map Features",
+        "how_to": "How to Use",
+        "mf": """
+- **Blue markers**: City/regency locations
+- **Red circles**: Highlighted city points
+- **Gray lines**: Connections between cities
+- **Blue route line**: Selected route between two cities
+- **Green marker**: Starting point
+- **Red marker**: Destination point
+""",
+        "htu": """
+1. View all cities on the main map
+2. Choose how cities are connected (all pairs, MST, Delaunay or nearest neighbours)
+3. Select two different cities
+4. Click 'Calculate Distance'
+5. View the route and distance
+""",
+        "footer": "West Java Cities and Regencies Map | Created with Streamlit and Folium",
+        "lang_label": "Language / Bahasa",
+        "lang_en": "English",
+        "lang_id": "Bahasa Indonesia",
+    },
+    "id": {
+        "page_title": "Peta Jawa Barat",
+        "title": "🗺️ Peta Jawa Barat dengan Kalkulator Jarak",
+        "desc": "Peta interaktif menampilkan seluruh kota/kabupaten di Jawa Barat serta perhitungan jarak",
+        "about": "Tentang",
+        "about_info": "Aplikasi ini menampilkan kota dan kabupaten di Provinsi Jawa Barat serta menghitung jarak antara dua lokasi yang dipilih.",
+        "features": "**Fitur:**",
+        "feat_1": "- Peta interaktif semua kota/kabupaten",
+        "feat_2": "- Garis penghubung antar lokasi",
+        "feat_3": "- Kalkulator jarak",
+        "feat_4": "- Penyorotan rute",
+        "feat_5": "- Perencana rute banyak perhentian",
+        "list_title": "Daftar Kota/Kabupaten",
+        "main_map": "Peta Provinsi Jawa Barat",
+        "show_connections": "Garis penghubung",
+        "connection_modes": {
+            None: "Tidak ada",
+            "complete": "Semua pasangan",
+            "mst": "Pohon rentang minimum",
+            "delaunay": "Triangulasi Delaunay",
+            "knn": "{k} tetangga terdekat",
+        },
+        "connections_too_many": "{m:,} garis terlalu banyak untuk digambar; pilih mode yang lebih jarang.",
+        "tooltip_click": "Klik untuk info {city}",
+        "connection_tooltip": "{c1} - {c2}: {d:.1f} km",
+        "distance_calc": "📍 Kalkulator Jarak",
+        "search_city": "Cari nama:",
+        "search_help": "Menampilkan paling banyak {n} nama yang diawali teks ini.",
+        "select_first": "Pilih kota pertama:",
+        "select_second": "Pilih kota kedua:",
+        "calc_btn": "Hitung Jarak",
+        "warn_same": "Silakan pilih dua kota yang berbeda.",
+        "distance_between": "**Jarak antara {c1} dan {c2}: {d:.2f} km**",
+        "route_title": "Rute: {c1} → {c2}",
+        "start": "Mulai: {city}",
+        "dest": "Tujuan: {city}",
+        "route_tooltip": "Rute: {d:.2f} km",
+        "route_via": "**Rute jalan terpendek (jaringan {k} tetangga terdekat): {path} — {d:.2f} km**",
+        "no_route": "Tidak ditemukan rute antara {c1} dan {c2}.",
+        "clicked_nearest": "Kota terdekat dari titik yang diklik: **{city}** ({d:.1f} km)",
+        "clicked_within": "Kota dalam radius {r} km: {cities}",
+        "clicked_none": "Tidak ada kota dalam radius {r} km.",
+        "tour_title": "🧭 Perencana Rute Banyak Perhentian",
+        "tour_select": "Pilih perhentian (yang pertama adalah titik awal):",
+        "tour_hint": "Pilih minimal dua perhentian untuk merencanakan rute.",
+        "tour_total": "**Rute melalui {n} perhentian: {d:.2f} km** (kembali ke {city})",
+        "tour_tooltip": "Rute: {d:.2f} km",
+        "tour_columns": ["Urutan", "Kota", "Jarak (km)", "Total (km)"],
+        "dataset": "Dataset",
+        "dataset_info": "{n:,} lokasi",
+        "list_more": "... dan {n:,} lainnya",
+        "clustered": "{n:,} lokasi dikelompokkan menjadi klaster; perbesar peta untuk melihat tiap lokasi.",
+        "cluster_tooltip": "{n:,} lokasi",
+        "connections_limited": "Garis semua pasangan tersedia untuk paling banyak {n:,} lokasi.",
+        "map_features": "Fitur Peta",
+        "how_to": "Cara Menggunakan",
+        "mf": """
+- **Marker biru**: Lokasi kota/kabupaten
+- **Lingkaran merah**: Penanda titik kota
+- **Garis abu-abu**: Koneksi antar kota
+- **Garis rute biru**: Rute terpilih antara dua kota
+- **Marker hijau**: Titik awal
+- **Marker merah**: Titik tujuan
+""",
+        "htu": """
+1. Lihat semua kota di peta utama
+2. Pilih jenis garis penghubung (semua pasangan, MST, Delaunay atau tetangga terdekat)
+3. Pilih dua kota yang berbeda
+4. Klik 'Hitung Jarak'
+5. Lihat rute dan jaraknya
+""",
+        "footer": "Peta Kota dan Kabupaten Jawa Barat | Dibuat dengan Streamlit dan Folium",
+        "lang_label": "Language / Bahasa",
+        "lang_en": "English",
+        "lang_id": "Bahasa Indonesia",
+    }
+}
+
+# Timing panel strings, keyed by ``"en"``/``"id"``; shared by every page.
+TRACE_TEXTS = {
+    "en": {
+        "toggle": "⏱️ Show timing breakdown",
+        "title": "⏱️ Timing of this rerun",
+        "total": "Rerun so far: {ms:.1f} ms in {n} spans",
+        "span": "Phase",
+        "ms": "ms",
+        "share": "% of rerun",
+        "bytes": "Bytes",
+        "json": "Download trace (JSON)",
+        "chrome": "Download Chrome trace",
+    },
+    "id": {
+        "toggle": "⏱️ Tampilkan rincian waktu",
+        "title": "⏱️ Waktu eksekusi ulang ini",
+        "total": "Eksekusi sejauh ini: {ms:.1f} ms dalam {n} tahap",
+        "span": "Tahap",
+        "ms": "ms",
+        "share": "% eksekusi",
+        "bytes": "Byte",
+        "json": "Unduh trace (JSON)",
+        "chrome": "Unduh Chrome trace",
+    },
+}
@@ -0,0 +1,115 @@
+"""Closed tours through many stops (travelling salesman heuristics).
+
+A nearest-neighbour construction is improved by 2-opt (reverse a segment)
+and Or-opt (move a run of up to three stops, possibly reversed) until no
+move helps or the time budget runs out.  Every move evaluation is
+vectorized: one NumPy expression scores a stop against all candidate
+positions at once, so a sweep costs O(n) array operations.
+"""
+
+import time
+
+import numpy as np
+
+TIME_BUDGET = 0.5
+OR_OPT_LENGTHS = (1, 2, 3)
+# Ignore gains below this to avoid cycling on floating-point noise.
+EPSILON = 1e-9
+
+
+def tour_length(dist: np.ndarray, tour) -> float:
+    """Length of the closed tour visiting ``tour`` in order."""
+    tour = np.asarray(tour)
+    if tour.size < 2:
+        return 0.0
+    return float(dist[tour, np.roll(tour, -1)].sum())
+
+
+def nearest_neighbour_tour(dist: np.ndarray, start: int = 0) -> np.ndarray:
+    """Greedy tour that always moves to the closest unvisited stop."""
+    n = dist.shape[0]
+    tour = np.empty(n, dtype=np.int64)
+    visited = np.zeros(n, dtype=bool)
+    current = start
+    for k in range(n):
+        tour[k] = current
+        visited[current] = True
+        if k < n - 1:
+            row = np.where(visited, np.inf, dist[current])
+            current = int(np.argmin(row))
+    return tour
+
+
+def two_opt(dist: np.ndarray, tour: np.ndarray, deadline: float) -> tuple[np.ndarray, bool]:
+    """One first-improvement 2-opt sweep; returns the tour and whether it changed."""
+    n = tour.size
+    improved = False
+    for i in range(n - 2):
+        if time.perf_counter() > deadline:
+            break
+        a, b = tour[i], tour[i + 1]
+        # Edge (i, i+1) against every non-adjacent edge (j, j+1).
+        j = np.arange(i + 2, n if i > 0 else n - 1)
+        if j.size == 0:
+            continue
+        c, e = tour[j], tour[(j + 1) % n]
+        delta = dist[a, c] + dist[b, e] - dist[a, b] - dist[c, e]
+        k = int(np.argmin(delta))
+        if delta[k] < -EPSILON:
+            tour[i + 1:j[k] + 1] = tour[i + 1:j[k] + 1][::-1].copy()
+            improved = True
+    return tour, improved
+
+
+def or_opt(dist: np.ndarray, tour: np.ndarray, deadline: float) -> tuple[np.ndarray, bool]:
+    """One Or-opt sweep moving runs of ``OR_OPT_LENGTHS`` stops elsewhere."""
+    n = tour.size
+    improved = False
+    for length in OR_OPT_LENGTHS:
+        if n < length + 3:
+            break
+        i = 0
+        while i + length <= n:
+            if time.perf_counter() > deadline:
+                return tour, improved
+            first, last = tour[i], tour[i + length - 1]
+            prev, after = tour[i - 1], tour[(i + length) % n]
+            removed = dist[prev, first] + dist[last, after] - dist[prev, after]
+
+            rest = np.concatenate([tour[i + length:], tour[:i]])
+            u, v = rest[:-1], rest[1:]
+            forward = dist[u, first] + dist[last, v]
+            backward = dist[u, last] + dist[first, v]
+            added = np.minimum(forward, backward) - dist[u, v]
+            k = int(np.argmin(added))
+            if added[k] - removed < -EPSILON:
+                segment = tour[i:i + length]
+                if backward[k] < forward[k]:
+                    segment = segment[::-1]
+                tour = np.concatenate([rest[:k + 1], segment, rest[k + 1:]])
+                improved = True
+            i += 1
+    return tour, improved
+
+
+def solve_tour(dist: np.ndarray, start: int = 0,
+               time_budget: float = TIME_BUDGET) -> tuple[np.ndarray, float]:
+    """Short closed tour over all stops of ``dist``, beginning at ``start``.
+
+    Returns ``(order, length)``; improvement stops after ``time_budget``
+    seconds even if 2-opt/Or-opt could still find gains.
+    """
+    dist = np.asarray(dist, dtype=float)
+    n = dist.shape[0]
+    if n == 0:
+        return np.empty(0, dtype=np.int64), 0.0
+    deadline = time.perf_counter() + time_budget
+    tour = nearest_neighbour_tour(dist, start)
+    if n > 3:
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            tour, improved = two_opt(dist, tour, deadline)
+            tour, moved = or_opt(dist, tour, deadline)
+            improved = improved or moved
+    tour = np.roll(tour, -int(np.flatnonzero(tour == start)[0]))
+    return tour, tour_length(dist, tour)
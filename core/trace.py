@@ -0,0 +1,157 @@
+"""Span timing for page reruns, exportable as JSON or Chrome trace events.
+
+A page makes one ``Tracer`` per rerun and wraps its phases in
+``tracer.span(name)``; a span may carry attributes such as the payload size
+sent to the browser.  A disabled tracer hands out one shared no-op span, so
+instrumented code costs a method call per phase when tracing is off.
+"""
+
+import json
+import os
+import threading
+import time
+
+
+class Span:
+    __slots__ = ("name", "depth", "start", "duration", "attrs")
+
+    def __init__(self, name: str, depth: int, start: float, attrs: dict):
+        self.name = name
+        self.depth = depth
+        self.start = start
+        self.duration = None
+        self.attrs = attrs
+
+    def set(self, **attrs):
+        """Attach attributes, e.g. ``span.set(bytes=len(payload))``."""
+        self.attrs.update(attrs)
+
+
+class _NullSpan:
+    """Stand-in span of a disabled tracer; records nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _ActiveSpan:
+    __slots__ = ("tracer", "span")
+
+    def __init__(self, tracer, span):
+        self.tracer = tracer
+        self.span = span
+
+    def __enter__(self):
+        self.tracer._depth += 1
+        self.span.start = time.perf_counter()
+        return self.span
+
+    def __exit__(self, *exc):
+        self.span.duration = time.perf_counter() - self.span.start
+        self.tracer._depth -= 1
+        return False
+
+
+class Tracer:
+    """Spans of one rerun, in start order, with their nesting depth."""
+
+    def __init__(self, name: str = "rerun", enabled: bool = False):
+        self.name = name
+        self.enabled = bool(enabled)
+        self.spans = []
+        self.origin = time.perf_counter()
+        self.wall_origin = time.time()
+        self._depth = 0
+
+    def span(self, name: str, **attrs):
+        """Context manager timing the ``with`` block as ``name``."""
+        if not self.enabled:
+            return NULL_SPAN
+        span = Span(name, self._depth, 0.0, attrs)
+        self.spans.append(span)
+        return _ActiveSpan(self, span)
+
+    def elapsed(self) -> float:
+        """Seconds since the tracer was created (the rerun so far)."""
+        return time.perf_counter() - self.origin
+
+    def rows(self) -> list:
+        """Finished spans as dicts with start offset and duration in ms."""
+        return [
+            {
+                "name": span.name,
+                "depth": span.depth,
+                "start_ms": (span.start - self.origin) * 1000,
+                "ms": span.duration * 1000,
+                **span.attrs,
+            }
+            for span in self.spans if span.duration is not None
+        ]
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "name": self.name,
+            "started": self.wall_origin,
+            "total_ms": self.elapsed() * 1000,
+            "spans": self.rows(),
+        }, indent=2, default=str)
+
+    def to_chrome_trace(self) -> str:
+        """Complete ("X") events for chrome://tracing and Perfetto."""
+        pid, tid = os.getpid(), threading.get_ident()
+        events = [
+            {
+                "name": row["name"],
+                "cat": self.name,
+                "ph": "X",
+                "ts": round(row["start_ms"] * 1000, 3),
+                "dur": round(row["ms"] * 1000, 3),
+                "pid": pid,
+                "tid": tid,
+                "args": {k: v for k, v in row.items()
+                         if k not in ("name", "depth", "start_ms", "ms")},
+            }
+            for row in self.rows()
+        ]
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, default=str)
+
+
+def show_trace(tracer: Tracer, texts: dict):
+    """Sidebar breakdown of ``tracer`` with JSON and Chrome trace downloads.
+
+    The only Streamlit code in ``core``; it is imported when the panel is drawn.
+    """
+    import streamlit as st
+
+    if not tracer.enabled:
+        return
+    total_ms = tracer.elapsed() * 1000
+    rows = tracer.rows()
+    with st.sidebar.expander(texts["title"], expanded=True):
+        st.caption(texts["total"].format(ms=total_ms, n=len(rows)))
+        st.dataframe(
+            {
+                texts["span"]: ["  " * row["depth"] + ("↳ " if row["depth"] else "") + row["name"]
+                                for row in rows],
+                texts["ms"]: [round(row["ms"], 2) for row in rows],
+                texts["share"]: [round(100 * row["ms"] / total_ms, 1) if total_ms else 0.0
+                                 for row in rows],
+                texts["bytes"]: [row.get("bytes") for row in rows],
+            },
+            hide_index=True,
+        )
+        st.download_button(texts["json"], tracer.to_json(), file_name=f"{tracer.name}-trace.json",
+                           mime="application/json")
+        st.download_button(texts["chrome"], tracer.to_chrome_trace(),
+                           file_name=f"{tracer.name}-chrome-trace.json", mime="application/json")
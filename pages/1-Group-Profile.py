@@ -1,7 +1,12 @@
+from pathlib import Path
+
 import streamlit as st
-from PIL import Image
-from io import BytesIO
-import base64
+
+from core.assets import ImageCache
+from core.texts import PROFILE_CONTENT as content, TRACE_TEXTS
+from core.trace import Tracer, show_trace
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
 
 # ---------------- PAGE CONFIG ----------------
 st.set_page_config(
@@ -13,28 +18,10 @@ st.set_page_config(
 # ---------------- SIDEBAR: LANGUAGE ----------------
 st.sidebar.title("⚙️ Settings")
 lang = st.sidebar.radio("Language / Bahasa:", ["English", "Bahasa Indonesia"], index=0)
+trace_texts = TRACE_TEXTS["en" if lang == "English" else "id"]
+tracer = Tracer("profile", st.sidebar.toggle(trace_texts["toggle"], key="trace_profile"))
 
 # ---------------- CONTENT (BILINGUAL) ----------------
-content = {
-    "English": {
-        "page_title": "👥 Group Members",
-        "subtitle": "Meet the team behind this project — the people planning, designing, and building it.",
-        "roles": {
-            "leader": "Project Leader",
-            "dev": "Developer",
-            "rd": "Research & Design",
-        }
-    },
-    "Bahasa Indonesia": {
-        "page_title": "👥 Anggota Kelompok",
-        "subtitle": "Kenali tim di balik proyek ini — orang-orang yang merencanakan, mendesain, dan membangunnya.",
-        "roles": {
-            "leader": "Ketua Proyek",
-            "dev": "Pengembang",
-            "rd": "Riset & Desain",
-        }
-    },
-}
 c = content[lang]
 
 # ---------------- GLOBAL CSS (PREMIUM THEME) ----------------
@@ -212,17 +199,17 @@ st.markdown(f"<div class='subtitle'>{c['subtitle']}</div>", unsafe_allow_html=Tr
 st.markdown("<hr>", unsafe_allow_html=True)
 
 # ---------------- LOAD IMAGES ----------------
-img1 = Image.open("assets/anggota1.jpg")
-img2 = Image.open("assets/anggota2.jpg")
-img3 = Image.open("assets/anggota3.jpg")
-
-# ---------------- IMAGE TO BASE64 FUNCTION ----------------
-def image_to_base64(pil_img):
-    if pil_img.mode == "RGBA":
-        pil_img = pil_img.convert("RGB")
-    buffer = BytesIO()
-    pil_img.save(buffer, format="JPEG")
-    return base64.b64encode(buffer.getvalue()).decode()
+# Thumbnails are encoded once (memory + .cache/assets); reruns only look them up.
+@st.cache_resource
+def get_image_cache():
+    return ImageCache()
+
+image_cache = get_image_cache()
+with tracer.span("photos") as span:
+    img1 = image_cache.get(ASSETS_DIR / "anggota1.jpg")
+    img2 = image_cache.get(ASSETS_DIR / "anggota2.jpg")
+    img3 = image_cache.get(ASSETS_DIR / "anggota3.jpg")
+    span.set(bytes=sum(len(img.data_uri) for img in (img1, img2, img3)))
 
 # ---------------- MEMBERS (NAMES FIXED, ROLES TRANSLATED) ----------------
 members = [
@@ -236,14 +223,13 @@ col1, col2, col3 = st.columns(3, gap="large")
 cols = [col1, col2, col3]
 
 def show_member(column, image, name, role, delay_class, accent_class):
-    encoded_img = image_to_base64(image)
     with column:
         st.markdown(
             f"""
             <div class="member-card fade-in {delay_class} {accent_class}">
                 <div class="photo-frame">
                     <div class="photo-glow"></div>
-                    <img src="data:image/jpeg;base64,{encoded_img}" class="member-photo" />
+                    <img src="{image.data_uri}" class="member-photo" />
                 </div>
                 <div class="member-meta">
                     <div class="member-name">{name}</div>
@@ -255,6 +241,9 @@ def show_member(column, image, name, role, delay_class, accent_class):
         )
 
 # ---------------- RENDER MEMBERS ----------------
-for col, m in zip(cols, members):
-    role_text = c["roles"][m["role_key"]]
-    show_member(col, m["img"], m["name"], role_text, m["delay"], m["accent"])
+with tracer.span("members"):
+    for col, m in zip(cols, members):
+        role_text = c["roles"][m["role_key"]]
+        show_member(col, m["img"], m["name"], role_text, m["delay"], m["accent"])
+
+show_trace(tracer, trace_texts)
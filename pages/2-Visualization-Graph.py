@@ -1,122 +1,541 @@
+from pathlib import Path
+
 import streamlit as st
-import networkx as nx
-import matplotlib.pyplot as plt
-import random
-import pandas as pd
 import numpy as np
 
+from core.adjacency import adjacency_window, build_csr, iter_csv, iter_matrix_market, npz_bytes
+from core.connectivity import analyze_connectivity
+from core.dataset import cache_key
+from core.editing import EDIT_OPERATIONS, GraphEditor
+from core.degree import (
+    PAGE_SIZE, degree_page, degree_summary, degrees_from_edges, log_binned_histogram, top_k
+)
+from core.generators import MODELS, expected_edges, generate
+from core.graph_io import FORMATS as GRAPH_FORMATS, SUFFIXES as GRAPH_SUFFIXES, load_graph
+from core.layout import LAYOUTS, LayoutCache, graph_hash
+from core.render import RENDER_MODES, RenderCache, encode_figure, render_graph, render_key
+from core.sampling import max_edges as count_max_edges, sample_gnm_edges
+from core.store import GraphStore
+from core.texts import GRAPH_TEXTS as texts, TRACE_TEXTS
+from core.trace import Tracer, show_trace
+
+# Largest matrix block rendered at once, and the largest n offered as dense CSV.
+MAX_WINDOW = 100
+MAX_CSV_VERTICES = 5000
+# Largest random graph generated on the page, in vertices and expected edges.
+MAX_GENERATED_VERTICES = 1_000_000
+MAX_GENERATED_EDGES = 5_000_000
+# Where a graph comes from: sampled on the page, uploaded, or read from disk.
+GRAPH_SOURCES = ("random", "upload", "path")
+# Server-side imports are limited to files inside this folder.
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+# Parameters of each random model: (name, min, max, default).
+MODEL_PARAMS = {
+    "gnm": (("edges", 0, None, 4),),
+    "gnp": (("p", 0.0, 1.0, 0.4),),
+    "ba": (("m", 1, None, 2),),
+    "ws": (("k", 2, None, 4), ("p", 0.0, 1.0, 0.1)),
+    "geometric": (("radius", 0.0, 1.5, 0.5),),
+    "sbm": (("blocks", 1, None, 2), ("p_in", 0.0, 1.0, 0.8), ("p_out", 0.0, 1.0, 0.1)),
+}
+
 # ---------------- SIDEBAR: LANGUAGE OPTION ----------------
 language = st.sidebar.selectbox(
     "🌐 Language / Bahasa",
     ("English", "Bahasa Indonesia")
 )
 
-# ---------------- TEXT DICTIONARY ----------------
-texts = {
-    "English": {
-        "title": "Graph Visualization with Degree & Adjacency Matrix",
-        "vertices": "Input Number of Vertices:",
-        "edges": "Input Number of Edges:",
-        "button": "Generate Graph",
-        "error": "Number of edges exceeds the maximum:",
-        "degree_title": "📌 Degree of Each Node",
-        "adj_title": "📌 Adjacency Matrix",
-        "node": "Node",
-        "degree": "Degree",
-        "nodes": "Nodes"
-    },
-    "Bahasa Indonesia": {
-        "title": "Visualisasi Graf dengan Derajat & Matriks Ketetanggaan",
-        "vertices": "Masukkan Jumlah Simpul:",
-        "edges": "Masukkan Jumlah Sisi:",
-        "button": "Buat Graf",
-        "error": "Jumlah sisi melebihi maksimum:",
-        "degree_title": "📌 Derajat Setiap Simpul",
-        "adj_title": "📌 Matriks Ketetanggaan",
-        "node": "Simpul",
-        "degree": "Derajat",
-        "nodes": "Simpul"
-    }
-}
-
 t = texts[language]
+trace_texts = TRACE_TEXTS["en" if language == "English" else "id"]
+
+# Per-rerun timing of the phases below; a no-op unless the toggle is on
+tracer = Tracer("graph", st.sidebar.toggle(trace_texts["toggle"], key="trace_graph"))
+
+
+@st.cache_resource
+def get_layout_cache():
+    """Layout cache shared by every session of this server process."""
+    return LayoutCache()
+
+
+@st.cache_resource
+def get_render_cache():
+    """Encoded graph images shared by every session of this server process."""
+    return RenderCache()
+
+
+def node_names(index, labels):
+    """Display names of vertices: original ids for an imported graph, else 1..n."""
+    return index + 1 if labels is None else labels[index]
+
+
+# ---------------- DEGREE VIEW ----------------
+@st.fragment
+def show_degrees(degrees, t, labels=None):
+    """Render degree statistics, a log-binned histogram and a top-k table.
+
+    The full per-node table is only built, one page at a time, on request.
+    """
+    import pandas as pd
+
+    summary = degree_summary(degrees)
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric(t["deg_min"], summary["min"])
+    m2.metric(t["deg_max"], summary["max"])
+    m3.metric(t["deg_mean"], f"{summary['mean']:.2f}")
+    m4.metric(t["deg_var"], f"{summary['variance']:.2f}")
+
+    h_col, k_col = st.columns([2, 1])
+    with h_col:
+        st.caption(t["hist_title"])
+        lower, upper, counts = log_binned_histogram(degrees)
+        bins = [
+            str(lo) if hi - lo == 1 else f"{lo}–{hi - 1}"
+            for lo, hi in zip(lower.tolist(), upper.tolist())
+        ]
+        hist_df = pd.DataFrame({t["degree"]: bins, t["nodes"]: counts})
+        st.bar_chart(hist_df, x=t["degree"], y=t["nodes"], sort=False)
+
+    with k_col:
+        st.caption(t["top_title"])
+        index, values = top_k(degrees)
+        st.dataframe(
+            pd.DataFrame({t["node"]: node_names(index, labels), t["degree"]: values}),
+            hide_index=True,
+        )
+
+    if st.toggle(t["show_all"]):
+        pages = max((degrees.size + PAGE_SIZE - 1) // PAGE_SIZE, 1)
+        page = st.number_input(t["page"], min_value=1, max_value=pages, value=1)
+        index, values = degree_page(degrees, page)
+        st.dataframe(
+            pd.DataFrame({t["node"]: node_names(index, labels), t["degree"]: values}),
+            hide_index=True,
+        )
+
+
+# ---------------- CONNECTIVITY VIEW ----------------
+def show_connectivity(report, src, dst, t, limit=100, labels=None):
+    """Render component, bridge and articulation point summaries.
+
+    Bridge and articulation point lists are cut to the first ``limit`` items.
+    """
+    import pandas as pd
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric(t["components"], report["num_components"])
+    c2.metric(t["largest"], report["largest_component"])
+    c3.metric(t["bridges"], len(report["bridges"]))
+    c4.metric(t["cut_vertices"], len(report["articulation_points"]))
+
+    sizes, counts = np.unique(report["sizes"], return_counts=True)
+    b_col, s_col, a_col = st.columns(3)
+    with s_col:
+        st.caption(t["comp_size"])
+        st.dataframe(
+            pd.DataFrame({t["comp_size"]: sizes[::-1], t["comp_count"]: counts[::-1]}),
+            hide_index=True,
+        )
+    with b_col:
+        st.caption(t["bridges"])
+        bridges = report["bridges"][:limit]
+        edges = [f"{u} – {v}" for u, v in zip(node_names(src[bridges], labels),
+                                               node_names(dst[bridges], labels))]
+        st.dataframe(pd.DataFrame({t["edge"]: edges}), hide_index=True)
+    with a_col:
+        st.caption(t["cut_vertices"])
+        st.dataframe(
+            pd.DataFrame({t["node"]: node_names(report["articulation_points"][:limit], labels)}),
+            hide_index=True,
+        )
+
+
+# ---------------- ADJACENCY VIEWER ----------------
+@st.fragment
+def show_adjacency(A, t, labels=None):
+    """Render one block of the sparse adjacency matrix plus export buttons.
+
+    Runs as a fragment so paging through the matrix does not rerun the page.
+    """
+    import pandas as pd
+
+    n = A.shape[0]
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        row_start = st.number_input(t["row_start"], min_value=1, max_value=n, value=1)
+    with c2:
+        col_start = st.number_input(t["col_start"], min_value=1, max_value=n, value=1)
+    with c3:
+        size = st.number_input(t["window_size"], min_value=1, max_value=MAX_WINDOW,
+                               value=min(n, 20))
+
+    block = adjacency_window(A, row_start - 1, col_start - 1, size, size)
+    rows = np.arange(row_start, row_start + block.shape[0])
+    cols = np.arange(col_start, col_start + block.shape[1])
+
+    df_matrix = pd.DataFrame(block, index=node_names(rows - 1, labels),
+                             columns=node_names(cols - 1, labels))
+    df_matrix.index.name = t["nodes"]
+    df_matrix.columns.name = t["nodes"]
+
+    st.dataframe(df_matrix)
+    st.caption(t["window_caption"].format(
+        r0=rows[0], r1=rows[-1], c0=cols[0], c1=cols[-1], n=n
+    ))
+
+    d1, d2, d3 = st.columns(3)
+    with d1:
+        st.download_button(
+            t["download_mtx"],
+            data=lambda: b"".join(iter_matrix_market(A)),
+            file_name="adjacency.mtx",
+            on_click="ignore",
+        )
+    with d2:
+        st.download_button(
+            t["download_npz"],
+            data=lambda: npz_bytes(A),
+            file_name="adjacency.npz",
+            on_click="ignore",
+        )
+    if n <= MAX_CSV_VERTICES:
+        with d3:
+            st.download_button(
+                t["download_csv"],
+                data=lambda: b"".join(iter_csv(A, labels)),
+                file_name="adjacency.csv",
+                mime="text/csv",
+                on_click="ignore",
+            )
+
 
 # ---------------- MAIN TITLE ----------------
 st.title(t["title"])
 
 # ---------------- INPUT ----------------
-num_vertices = st.number_input(
-    t["vertices"],
-    min_value=1,
-    value=5
+source = st.radio(
+    t["source"],
+    GRAPH_SOURCES,
+    format_func=lambda key: t["source_names"][key],
+    horizontal=True
 )
 
-num_edges = st.number_input(
-    t["edges"],
+if source == "random":
+    model = st.selectbox(
+        t["model"],
+        MODELS,
+        format_func=lambda key: t["model_names"][key]
+    )
+
+    num_vertices = st.number_input(
+        t["vertices"],
+        min_value=1,
+        max_value=MAX_GENERATED_VERTICES,
+        value=5
+    )
+
+    params = {}
+    for name, low, high, default in MODEL_PARAMS[model]:
+        params[name] = st.number_input(
+            t["edges"] if name == "edges" else t["param_names"][name],
+            min_value=low,
+            max_value=high,
+            value=default,
+            format=None if isinstance(default, int) else "%g",
+            step=None if isinstance(default, int) else 0.01,
+            key=f"{model}_{name}"
+        )
+    num_edges = params.get("edges")
+else:
+    if source == "upload":
+        graph_file = st.file_uploader(
+            t["upload"],
+            type=[suffix.lstrip(".") for suffix in GRAPH_SUFFIXES] + ["gz"]
+        )
+    else:
+        graph_path = st.text_input(t["path"]).strip()
+
+    import_format = st.selectbox(
+        t["import_format"],
+        (None, *GRAPH_FORMATS),
+        format_func=lambda key: t["format_names"][key]
+    )
+
+seed = st.number_input(
+    t["seed"],
     min_value=0,
-    value=4
+    value=42
 )
 
-# ---------------- BUTTON ACTION ----------------
-if st.button(t["button"]):
-    G = nx.Graph()
-    G.add_nodes_from(range(1, num_vertices + 1))
+layout_name = st.selectbox(
+    t["layout"],
+    LAYOUTS,
+    format_func=lambda key: t["layout_names"][key]
+)
 
-    possible_edges = [
-        (i, j)
-        for i in range(1, num_vertices + 1)
-        for j in range(i + 1, num_vertices + 1)
-    ]
+render_mode = st.selectbox(
+    t["render_mode"],
+    RENDER_MODES,
+    format_func=lambda key: t["render_names"][key]
+)
+
+# ---------------- BUTTON ACTION ----------------
+store = st.session_state.setdefault("graph_store", GraphStore())
 
-    max_edges = len(possible_edges)
+if source == "random" and st.button(t["button"]):
+    # Every model is checked before anything is allocated; G(n, p) with
+    # n = 1e5 would otherwise ask for billions of edges.
+    max_edges = min(count_max_edges(num_vertices), MAX_GENERATED_EDGES)
 
-    if num_edges > max_edges:
+    if expected_edges(model, num_vertices, **params) > max_edges:
         st.error(f"{t['error']} {max_edges}")
+    elif model != "gnm":
+        key = (num_vertices, tuple(params.items()), seed, model)
+        with tracer.span("generate", model=model):
+            store.get_or_create(
+                key,
+                lambda: (*generate(model, num_vertices, seed=seed, **params), num_vertices)
+            )
+    else:
+        key = (num_vertices, num_edges, seed, "gnm")
+        with tracer.span("sample_gnm_edges", edges=num_edges):
+            store.get_or_create(
+                key,
+                lambda: (*sample_gnm_edges(num_vertices, num_edges, seed=seed), num_vertices)
+            )
+
+def data_path(text):
+    """``text`` resolved against ``DATA_DIR``; ``None`` when it points outside it."""
+    root = DATA_DIR.resolve()
+    path = (root / text).resolve()
+    return path if path.is_relative_to(root) else None
+
+
+if source != "random" and st.button(t["import_button"]):
+    if source == "upload":
+        graph_source = graph_file
+        name, source_id = (graph_file.name, graph_file.file_id) if graph_file else (None, None)
+    else:
+        graph_source = data_path(graph_path) if graph_path else None
+        name = Path(graph_path).name
+        source_id = None
+        if graph_path and graph_source is None:
+            st.error(t["path_outside"].format(folder=DATA_DIR.name))
+
+    if graph_source is not None:
+        try:
+            with tracer.span("load_graph") as span:
+                graph = load_graph(graph_source, import_format, name=name)
+                span.set(bytes=graph.src.nbytes + graph.dst.nbytes)
+            if source == "path":
+                source_id = cache_key(graph_source)
+        except (OSError, ValueError) as exc:
+            st.error(t["import_error"].format(error=exc))
+        else:
+            key = (graph.num_vertices, len(graph.src), seed, "import", name, source_id)
+            entry = store.get_or_create(key, lambda: (graph.src, graph.dst, graph.num_vertices))
+            entry.derived("labels", lambda: graph.labels)
+            st.success(t["import_summary"].format(
+                n=graph.num_vertices, m=len(graph.src), name=name,
+                loops=graph.stats["self_loops"], dups=graph.stats["duplicates"]
+            ))
+
+
+def entry_layout(entry):
+    """Positions for the selected layout; an edited graph warm-starts from its original."""
+    parent = store.get(entry.key[4]) if entry.key[3] == "edit" else None
+    parent_key = parent and parent.derived(
+        "graph_hash", lambda: graph_hash(parent.src, parent.dst, parent.num_vertices)
+    )
+    return get_layout_cache().get(layout_name, entry.src, entry.dst, entry.num_vertices,
+                                  seed=entry.key[2], parent_key=parent_key)
+
+
+# ---------------- EDIT ----------------
+def new_editor(entry):
+    """Editor starting from ``entry``, reusing the metrics the page already computed."""
+    src, dst, n = entry.src, entry.dst, entry.num_vertices
+    return GraphEditor(
+        src, dst, n,
+        degrees=entry.derived("degrees", lambda: degrees_from_edges(src, dst, n)),
+        components=entry.derived(
+            "connectivity", lambda: analyze_connectivity(src, dst, n)
+        )["labels"],
+        positions=entry.derived(
+            ("layout", layout_name),
+            lambda: entry_layout(entry)
+        ),
+        labels=entry.derived("labels", lambda: None),
+        layout=layout_name,
+        seed=entry.key[2],
+    )
+
+
+def apply_edit(operation, first, second):
+    """Apply one edit to the current graph; the first edit forks it into a new history item."""
+    entry = store.current
+    if entry.key[3] == "edit":
+        key = entry.key
     else:
-        selected_edges = random.sample(possible_edges, num_edges)
-        G.add_edges_from(selected_edges)
-
-        # ---------------- GRAPH VISUALIZATION ----------------
-        fig, ax = plt.subplots()
-        nx.draw(
-            G,
-            with_labels=True,
-            node_color="lightblue",
-            node_size=800,
-            font_size=12
+        key = (entry.num_vertices, entry.num_edges, entry.key[2], "edit", entry.key)
+        # Later edits of the original graph continue its edited copy.
+        entry = store.get(key) or entry
+    editor = entry.derived("editor", lambda: None) or new_editor(entry)
+
+    names = [first] if operation != "add_vertex" else first.split(",")
+    if operation in ("add_edge", "remove_edge"):
+        names.append(second)
+    vertices = []
+    for name in (name.strip() for name in names):
+        if not name and operation == "add_vertex":
+            continue
+        vertex = editor.find(name)
+        if vertex is None:
+            st.error(t["edit_unknown"].format(name=name))
+            return
+        vertices.append(vertex)
+
+    start = tracer.elapsed()
+    with tracer.span(f"edit ({operation})"):
+        if operation == "add_edge":
+            changed = editor.add_edge(*vertices)
+        elif operation == "remove_edge":
+            changed = editor.remove_edge(*vertices)
+        elif operation == "add_vertex":
+            editor.add_vertex(vertices)
+            changed = True
+        elif editor.num_vertices == 1:
+            st.error(t["edit_last"])
+            return
+        else:
+            editor.remove_vertex(vertices[0])
+            changed = True
+    if not changed:
+        st.warning(t["edit_unchanged"])
+        return
+    st.success(t["edit_done"].format(version=editor.version, ms=(tracer.elapsed() - start) * 1000))
+
+    with tracer.span("edit snapshot"):
+        snap = editor.snapshot()
+    edited = store.get_or_create(key, lambda: (snap.src, snap.dst, snap.num_vertices))
+    # Only the incrementally maintained values carry over; the rest is derived again.
+    edited.update(snap.src, snap.dst, snap.num_vertices, {
+        "editor": editor,
+        "labels": snap.labels,
+        "degrees": snap.degrees,
+        ("layout", editor.layout): snap.positions,
+    })
+
+
+if store.current is not None:
+    with st.expander(t["edit_title"]):
+        operation = st.radio(
+            t["edit_operation"],
+            EDIT_OPERATIONS,
+            format_func=lambda key: t["edit_names"][key],
+            horizontal=True
         )
-        st.pyplot(fig)
+        first = st.text_input(
+            t["edit_neighbors"] if operation == "add_vertex" else t["edit_vertex"]
+        )
+        second = st.text_input(t["edit_other"]) if operation in ("add_edge", "remove_edge") else ""
+        edit_clicked = st.button(t["edit_button"])
+    if edit_clicked:
+        apply_edit(operation, first, second)
+
+
+# ---------------- HISTORY ----------------
+def select_history():
+    store.select(st.session_state["graph_history"])
+
+
+def history_label(key):
+    if key[3] == "edit":
+        return t["history_edit"].format(base=history_label(key[4]))
+    if key[3] == "import":
+        return t["history_import"].format(name=key[4], n=key[0], m=key[1])
+    if key[3] != "gnm":
+        params = ", ".join(f"{name} {value:g}" for name, value in key[1])
+        return t["history_model"].format(model=t["model_names"][key[3]], params=params,
+                                         n=key[0], seed=key[2])
+    return t["history_item"].format(n=key[0], m=key[1], seed=key[2])
 
-        st.markdown("---")
 
-        # ---------------- DEGREE ----------------
-        st.subheader(t["degree_title"])
-        degrees = dict(G.degree())
+if len(store):
+    st.session_state["graph_history"] = store.current_key
+    st.sidebar.selectbox(
+        t["history"],
+        store.history(),
+        format_func=history_label,
+        key="graph_history",
+        on_change=select_history,
+    )
 
-        degree_df = pd.DataFrame({
-            t["node"]: list(degrees.keys()),
-            t["degree"]: list(degrees.values())
-        })
+entry = store.current
 
-        st.table(degree_df.style.hide(axis="index"))
+if entry is not None:
+    src, dst, n = entry.src, entry.dst, entry.num_vertices
+    labels = entry.derived("labels", lambda: None)
 
-        st.markdown("---")
+    # ---------------- GRAPH VISUALIZATION ----------------
+    with tracer.span(f"layout ({layout_name})"):
+        positions = entry.derived(
+            ("layout", layout_name),
+            lambda: entry_layout(entry)
+        )
+    # Same PNG settings as st.pyplot, cached by content across reruns and sessions
+    render_cache = get_render_cache()
+    with tracer.span("render_key"):
+        image_key = entry.derived(
+            ("render_key", layout_name, render_mode),
+            lambda: render_key(positions, src, dst, labels=labels, mode=render_mode)
+        )
+    png = render_cache.get(image_key)
+    if png is None:
+        with tracer.span(f"render_graph ({render_mode})"):
+            fig = render_graph(positions, src, dst, labels=labels, mode=render_mode)
+        with tracer.span("savefig") as span:
+            png = encode_figure(fig)
+            span.set(bytes=len(png))
+        render_cache.put(image_key, png)
+    with tracer.span("st.image", bytes=len(png)):
+        st.image(png, width="stretch")
+    if tracer.enabled:
+        st.sidebar.caption(t["render_cache"].format(**render_cache.stats()))
+
+    st.markdown("---")
 
-        # ---------------- ADJACENCY MATRIX ----------------
-        st.subheader(t["adj_title"])
+    # ---------------- DEGREE ----------------
+    st.subheader(t["degree_title"])
+    with tracer.span("degrees"):
+        degrees = entry.derived("degrees", lambda: degrees_from_edges(src, dst, n))
+    with tracer.span("show_degrees"):
+        show_degrees(degrees, t, labels)
 
-        adj_matrix = nx.to_numpy_array(G, nodelist=sorted(G.nodes()))
-        adj_matrix = adj_matrix.astype(int)
+    st.markdown("---")
 
-        df_matrix = pd.DataFrame(
-            adj_matrix,
-            index=sorted(G.nodes()),
-            columns=sorted(G.nodes())
+    # ---------------- CONNECTIVITY ----------------
+    st.subheader(t["conn_title"])
+    with tracer.span("connectivity"):
+        editor = entry.derived("editor", lambda: None)
+        report = entry.derived(
+            "connectivity",
+            lambda: editor.connectivity() if editor else analyze_connectivity(src, dst, n)
         )
+    with tracer.span("show_connectivity"):
+        show_connectivity(report, src, dst, t, labels=labels)
+
+    st.markdown("---")
+
+    # ---------------- ADJACENCY MATRIX ----------------
+    st.subheader(t["adj_title"])
 
-        df_matrix.index.name = t["nodes"]
-        df_matrix.columns.name = t["nodes"]
+    with tracer.span("build_csr") as span:
+        A = entry.derived("adjacency", lambda: build_csr(src, dst, n))
+        span.set(bytes=A.data.nbytes + A.indices.nbytes + A.indptr.nbytes)
+    with tracer.span("show_adjacency"):
+        show_adjacency(A, t, labels)
 
-        st.dataframe(df_matrix)
+    st.markdown("---")
 
-        st.markdown("---")
+show_trace(tracer, trace_texts)
@@ -1,132 +1,196 @@
+import threading
+from pathlib import Path
+
 import streamlit as st
 import folium
 from streamlit_folium import st_folium
-from geopy.distance import geodesic
-import pandas as pd
-
-# Data koordinat kabupaten/kota di Jawa Barat
-CITY_DATA = {
-    "Bandung": (-6.914744, 107.609810),
-    "Bogor": (-6.597147, 106.806038),
-    "Bekasi": (-6.238270, 106.975571),
-    "Cirebon": (-6.732023, 108.552316),
-    "Garut": (-7.227906, 107.908699),
-    "Tasikmalaya": (-7.350580, 108.217163),
-    "Ciamis": (-7.332000, 108.349000),
-    "Sumedang": (-6.858000, 107.919000),
-    "Indramayu": (-6.337000, 108.325000),
-    "Majalengka": (-6.836000, 108.227000),
-    "Kuningan": (-6.976000, 108.483000),
-    "Cianjur": (-6.818000, 107.140000),
-    "Sukabumi": (-6.924000, 106.930000),
-    "Purwakarta": (-6.539000, 107.443000),
-    "Karawang": (-6.304000, 107.305000),
-    "Subang": (-6.570000, 107.763000),
-    "Pangandaran": (-7.667000, 108.650000),
-    "Depok": (-6.402484, 106.794243),
-    "Cimahi": (-6.884082, 107.541307),
-    "Banjar": (-7.369722, 108.534722)
-}
+import numpy as np
+
+from core.cluster import ClusterIndex
+from core.connections import MODES, connection_edges
+from core.dataset import FORMATS, cache_key, load_dataset
+from core.distance import distance_matrix, pairwise
+from core.geojson import line_collection, point_collection, select_pairs
+from core.maps import build_base_map, cluster_overlay, detach, fit_zoom, route_overlay, tour_overlay
+from core.routing import RoadNetwork
+from core.spatial import SpatialIndex
+from core.texts import MAP_LANG as LANG, TRACE_TEXTS
+from core.tour import solve_tour
+from core.trace import Tracer, show_trace
+
+# Batas jumlah garis penghubung agar peta tetap responsif
+MAX_CONNECTIONS = 2000
+# Batas jumlah garis untuk mode jaringan jarang (MST, Delaunay, k-NN)
+MAX_LINES = 20000
+# Jumlah tetangga terdekat per kota pada graf jalan
+ROAD_NEIGHBOURS = 3
+# Radius (km) untuk daftar kota di sekitar titik yang diklik
+NEARBY_RADIUS_KM = 50
+# Batas jumlah perhentian dan waktu optimasi (detik) perencana rute
+MAX_STOPS = 2000
+TOUR_TIME_BUDGET = 0.5
+
+# Batas jumlah lokasi untuk matriks jarak penuh dan garis penghubung
+DENSE_LIMIT = 2000
+# Di atas jumlah ini peta utama menampilkan klaster, bukan marker per kota
+MAX_MARKERS = 500
+# Area klaster diperlebar sebesar fraksi ini agar pergeseran kecil tetap terisi
+VIEW_PADDING = 0.25
+# Batas jumlah lokasi yang ditampilkan di daftar sidebar
+LIST_LIMIT = 100
+# Batas jumlah hasil pencarian kota yang dikirim sebagai pilihan widget
+SEARCH_LIMIT = 50
+
+# Folder dataset lokasi (CSV, Parquet atau GeoJSON)
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+DEFAULT_DATASET = "jawa_barat.csv"
+
+
+@st.cache_resource
+def get_dataset(path, key):
+    """Memory-mapped dataset; ``key`` changes when the file does."""
+    return load_dataset(path)
+
+
+@st.cache_resource
+def get_distance_matrix(key, _dataset):
+    """Geodesic (WGS-84) distance matrix in km, computed once per dataset.
+
+    Shared without copying, so it is read-only.
+    """
+    dist = distance_matrix(_dataset.lat, _dataset.lon, method="vincenty")
+    dist.setflags(write=False)
+    return dist
+
+
+@st.cache_resource
+def get_road_network(key, _dataset, k):
+    """k-nearest-neighbour road graph with precomputed shortest paths."""
+    if len(_dataset) <= DENSE_LIMIT:
+        return RoadNetwork.from_knn(_dataset.lat, _dataset.lon,
+                                    get_distance_matrix(key, _dataset), k=k)
+    return RoadNetwork.from_index(get_spatial_index(key, _dataset), k=k)
+
+
+@st.cache_resource
+def get_spatial_index(key, _dataset):
+    """KD-tree over the dataset for nearest-city and radius lookups."""
+    return SpatialIndex(_dataset.lat, _dataset.lon)
+
+
+@st.cache_resource
+def get_cluster_index(key, _dataset):
+    """Grid clusters for every zoom level, built once per dataset."""
+    return ClusterIndex(_dataset.lat, _dataset.lon)
+
+
+@st.cache_data
+def get_connections(key, _dataset, mode):
+    """Connection lines ``(i, j, km)`` for one mode, computed once per dataset."""
+    if mode == "complete":
+        dist = get_distance_matrix(key, _dataset)
+        i, j = select_pairs(dist, max_edges=MAX_CONNECTIONS)
+        return i, j, dist[i, j]
+    lat, lon = _dataset.lat, _dataset.lon
+    i, j = connection_edges(mode, lat, lon, k=ROAD_NEIGHBOURS)
+    return i, j, pairwise(lat[i], lon[i], lat[j], lon[j], method="vincenty")
+
+
+@st.cache_resource
+def get_base_map(key, _dataset, lang_key, connection_mode):
+    """Main map (markers and connection layer) per dataset and language.
+
+    Shared by all sessions; the lock serializes st_folium renders of it.
+    """
+    texts = LANG[lang_key]
+    names = np.array(_dataset.names())
+    lat, lon = _dataset.lat, _dataset.lon
+    # Dataset besar digambar sebagai klaster (lihat cluster_layer)
+    markers = len(_dataset) <= MAX_MARKERS
+    coords = np.column_stack([lat, lon]).tolist() if markers else []
+
+    connections = None
+    if connection_mode is not None:
+        i, j, dist = get_connections(key, _dataset, connection_mode)
+        labels = [
+            texts["connection_tooltip"].format(c1=a, c2=b, d=d)
+            for a, b, d in zip(names[i], names[j], dist)
+        ]
+        connections = line_collection(lat, lon, i, j, {"label": labels})
+
+    m = build_base_map(names if markers else [], coords, _dataset.center(),
+                       fit_zoom(lat, lon), texts["tooltip_click"], connections)
+    return m, threading.Lock()
+
+
+@st.cache_resource
+def get_stop_distances(key, _dataset, stops):
+    """Distance matrix between the selected stops (rows of the dataset).
+
+    Shared without copying, so it is read-only.
+    """
+    stops = np.asarray(stops)
+    if len(_dataset) <= DENSE_LIMIT:
+        dist = get_distance_matrix(key, _dataset)[np.ix_(stops, stops)]
+    else:
+        dist = distance_matrix(_dataset.lat[stops], _dataset.lon[stops], method="vincenty")
+    dist.setflags(write=False)
+    return dist
+
+
+@st.cache_data
+def get_tour(key, _dataset, stops, time_budget):
+    """Stop order (dataset rows) and length of a short closed tour from ``stops[0]``."""
+    order, length = solve_tour(get_stop_distances(key, _dataset, stops), time_budget=time_budget)
+    return np.asarray(stops)[order], length
+
+
+@st.cache_resource
+def get_route_base_map(center):
+    """Empty map the route overlay is drawn on; only the overlay changes."""
+    return folium.Map(location=list(center), zoom_start=9), threading.Lock()
+
+
+def cluster_layer(key, dataset, view, texts):
+    """Clusters for the zoom and bounds st_folium last reported for the map."""
+    index = get_cluster_index(key, dataset)
+    zoom = view.get("zoom") or fit_zoom(dataset.lat, dataset.lon)
+    bounds = view.get("bounds") or {}
+    south_west = bounds.get("_southWest") or {}
+    north_east = bounds.get("_northEast") or {}
+    box = None
+    if south_west.get("lat") is not None and north_east.get("lat") is not None:
+        pad_lat = (north_east["lat"] - south_west["lat"]) * VIEW_PADDING
+        pad_lon = (north_east["lng"] - south_west["lng"]) * VIEW_PADDING
+        box = ((south_west["lat"] - pad_lat, south_west["lng"] - pad_lon),
+               (north_east["lat"] + pad_lat, north_east["lng"] + pad_lon))
+
+    lat, lon, count, point = index.clusters(zoom, box)
+    names = dataset.names()
+    labels = [
+        names[p] if p >= 0 else texts["cluster_tooltip"].format(n=c)
+        for c, p in zip(count.tolist(), point.tolist())
+    ]
+    radius = 6 + 3 * np.log2(count)
+    return cluster_overlay(point_collection(lat, lon, {"label": labels, "radius": radius}))
+
+
+def show_map(base, lock, overlay=None, **kwargs):
+    """Render a cached map with an optional overlay, leaving the cache untouched."""
+    key = kwargs.get("key")
+    with lock:
+        try:
+            with tracer.span(f"st_folium ({key})"):
+                state = st_folium(base, feature_group_to_add=overlay, **kwargs)
+            if tracer.enabled:
+                # Ukuran HTML peta (dengan overlay) hanya dihitung saat rincian waktu aktif
+                with tracer.span(f"map html ({key})") as span:
+                    span.set(bytes=len(base.get_root().render().encode()))
+            return state
+        finally:
+            if overlay is not None:
+                detach(base, overlay)
 
-# =========================
-# i18n Dictionary
-# =========================
-LANG = {
-    "en": {
-        "page_title": "West Java Map",
-        "title": "🗺️ West Java Map with Distance Calculator",
-        "desc": "Interactive map showing all cities/regencies in West Java with distance calculation",
-        "about": "About",
-        "about_info": "This application displays cities and regencies in West Java province with distance calculation between any two selected locations.",
-        "features": "**Features:**",
-        "feat_1": "- Interactive map with all cities/regencies",
-        "feat_2": "- Connection lines between locations",
-        "feat_3": "- Distance calculator",
-        "feat_4": "- Route highlighting",
-        "list_title": "City/Regency List",
-        "main_map": "West Java Province Map",
-        "show_connections": "Show connection lines between all cities",
-        "tooltip_click": "Click for {city} info",
-        "distance_calc": "📍 Distance Calculator",
-        "select_first": "Select first city:",
-        "select_second": "Select second city:",
-        "calc_btn": "Calculate Distance",
-        "warn_same": "Please select two different cities.",
-        "distance_between": "**Distance between {c1} and {c2}: {d:.2f} km**",
-        "route_title": "Route: {c1} → {c2}",
-        "start": "Start: {city}",
-        "dest": "Destination: {city}",
-        "route_tooltip": "Route: {d:.2f} km",
-        "map_features": "Map Features",
-        "how_to": "How to Use",
-        "mf": """
-- **Blue markers**: City/regency locations
-- **Red circles**: Highlighted city points
-- **Gray lines**: Connections between cities
-- **Blue route line**: Selected route between two cities
-- **Green marker**: Starting point
-- **Red marker**: Destination point
-""",
-        "htu": """
-1. View all cities on the main map
-2. Toggle connection lines on/off
-3. Select two different cities
-4. Click 'Calculate Distance'
-5. View the route and distance
-""",
-        "footer": "West Java Cities and Regencies Map | Created with Streamlit and Folium",
-        "lang_label": "Language / Bahasa",
-        "lang_en": "English",
-        "lang_id": "Bahasa Indonesia",
-    },
-    "id": {
-        "page_title": "Peta Jawa Barat",
-        "title": "🗺️ Peta Jawa Barat dengan Kalkulator Jarak",
-        "desc": "Peta interaktif menampilkan seluruh kota/kabupaten di Jawa Barat serta perhitungan jarak",
-        "about": "Tentang",
-        "about_info": "Aplikasi ini menampilkan kota dan kabupaten di Provinsi Jawa Barat serta menghitung jarak antara dua lokasi yang dipilih.",
-        "features": "**Fitur:**",
-        "feat_1": "- Peta interaktif semua kota/kabupaten",
-        "feat_2": "- Garis penghubung antar lokasi",
-        "feat_3": "- Kalkulator jarak",
-        "feat_4": "- Penyorotan rute",
-        "list_title": "Daftar Kota/Kabupaten",
-        "main_map": "Peta Provinsi Jawa Barat",
-        "show_connections": "Tampilkan garis penghubung antar semua kota",
-        "tooltip_click": "Klik untuk info {city}",
-        "distance_calc": "📍 Kalkulator Jarak",
-        "select_first": "Pilih kota pertama:",
-        "select_second": "Pilih kota kedua:",
-        "calc_btn": "Hitung Jarak",
-        "warn_same": "Silakan pilih dua kota yang berbeda.",
-        "distance_between": "**Jarak antara {c1} dan {c2}: {d:.2f} km**",
-        "route_title": "Rute: {c1} → {c2}",
-        "start": "Mulai: {city}",
-        "dest": "Tujuan: {city}",
-        "route_tooltip": "Rute: {d:.2f} km",
-        "map_features": "Fitur Peta",
-        "how_to": "Cara Menggunakan",
-        "mf": """
-- **Marker biru**: Lokasi kota/kabupaten
-- **Lingkaran merah**: Penanda titik kota
-- **Garis abu-abu**: Koneksi antar kota
-- **Garis rute biru**: Rute terpilih antara dua kota
-- **Marker hijau**: Titik awal
-- **Marker merah**: Titik tujuan
-""",
-        "htu": """
-1. Lihat semua kota di peta utama
-2. Aktif/nonaktifkan garis koneksi
-3. Pilih dua kota yang berbeda
-4. Klik 'Hitung Jarak'
-5. Lihat rute dan jaraknya
-""",
-        "footer": "Peta Kota dan Kabupaten Jawa Barat | Dibuat dengan Streamlit dan Folium",
-        "lang_label": "Language / Bahasa",
-        "lang_en": "English",
-        "lang_id": "Bahasa Indonesia",
-    }
-}
 
 # =========================
 # Language selector (Sidebar)
@@ -140,6 +204,26 @@ with st.sidebar:
 lang_key = "en" if language == LANG["en"]["lang_en"] else "id"
 T = LANG[lang_key]
 
+# Rincian waktu per rerun; tanpa biaya berarti bila toggle mati
+with st.sidebar:
+    tracer = Tracer("map", st.toggle(TRACE_TEXTS[lang_key]["toggle"], key="trace_map"))
+
+# =========================
+# Dataset selector (Sidebar)
+# =========================
+dataset_files = sorted(p.name for p in DATA_DIR.iterdir() if p.suffix.lower() in FORMATS)
+with st.sidebar:
+    dataset_file = st.selectbox(
+        T["dataset"],
+        options=dataset_files,
+        index=dataset_files.index(DEFAULT_DATASET) if DEFAULT_DATASET in dataset_files else 0,
+    )
+dataset_path = DATA_DIR / dataset_file
+with tracer.span("get_dataset"):
+    dataset = get_dataset(str(dataset_path), cache_key(dataset_path))
+DATASET_KEY = dataset.key
+city_names = dataset.names()
+
 # Konfigurasi halaman Streamlit
 st.set_page_config(layout="wide", page_title=T["page_title"])
 st.title(T["title"])
@@ -154,55 +238,94 @@ with st.sidebar:
     st.markdown(T["feat_2"])
     st.markdown(T["feat_3"])
     st.markdown(T["feat_4"])
+    st.markdown(T["feat_5"])
 
     st.header(T["list_title"])
-    for i, city in enumerate(CITY_DATA.keys(), 1):
+    st.caption(T["dataset_info"].format(n=len(dataset)))
+    for i, city in enumerate(city_names[:LIST_LIMIT], 1):
         st.write(f"{i}. {city}")
+    if len(dataset) > LIST_LIMIT:
+        st.write(T["list_more"].format(n=len(dataset) - LIST_LIMIT))
 
 # Buat peta Jawa Barat utama
 st.subheader(T["main_map"])
 
-# Pilihan untuk menampilkan garis penghubung
-show_connections = st.checkbox(T["show_connections"], value=True)
-
-# Buat peta
-m = folium.Map(location=[-6.914744, 107.609810], zoom_start=8)
-
-# Tambahkan marker untuk setiap kota
-for city, coords in CITY_DATA.items():
-    folium.Marker(
-        location=coords,
-        popup=f"<b>{city}</b>",
-        tooltip=T["tooltip_click"].format(city=city),
-        icon=folium.Icon(color='blue', icon='info-sign')
-    ).add_to(m)
-
-    folium.CircleMarker(
-        location=coords,
-        radius=8,
-        popup=city,
-        color='red',
-        fill=True,
-        fill_color='red',
-        fill_opacity=0.6,
-        weight=2
-    ).add_to(m)
-
-# Tambahkan garis penghubung antar kota jika checkbox dicentang
-if show_connections:
-    cities_list = list(CITY_DATA.items())
-    for i in range(len(cities_list)):
-        for j in range(i + 1, len(cities_list)):
-            folium.PolyLine(
-                locations=[cities_list[i][1], cities_list[j][1]],
-                color="gray",
-                weight=1,
-                opacity=0.3,
-                tooltip=f"{cities_list[i][0]} - {cities_list[j][0]}"
-            ).add_to(m)
-
-# Tampilkan peta utama
-st_folium(m, width=1200, height=500)
+# Pilihan jenis garis penghubung (graf lengkap atau jaringan jarang)
+connection_mode = st.selectbox(
+    T["show_connections"],
+    options=[None, *MODES],
+    index=1,
+    format_func=lambda mode: T["connection_modes"][mode].format(k=ROAD_NEIGHBOURS),
+)
+
+if connection_mode == "complete" and len(dataset) > DENSE_LIMIT:
+    st.caption(T["connections_limited"].format(n=DENSE_LIMIT))
+    connection_mode = None
+elif connection_mode is not None:
+    with tracer.span(f"get_connections ({connection_mode})"):
+        num_lines = get_connections(DATASET_KEY, dataset, connection_mode)[0].size
+    if num_lines > MAX_LINES:
+        st.caption(T["connections_too_many"].format(m=num_lines))
+        connection_mode = None
+if len(dataset) > MAX_MARKERS:
+    st.caption(T["clustered"].format(n=len(dataset)))
+
+# Matriks jarak semua pasangan kota (dihitung sekali per dataset, jika cukup kecil)
+with tracer.span("get_distance_matrix"):
+    DIST = get_distance_matrix(DATASET_KEY, dataset) if len(dataset) <= DENSE_LIMIT else None
+
+# Peta dasar (marker + garis penghubung) di-cache per dataset dan bahasa
+with tracer.span("get_base_map"):
+    m, m_lock = get_base_map(DATASET_KEY, dataset, lang_key, connection_mode)
+
+# Dataset besar: hanya klaster untuk zoom dan area terakhir yang dikirim ke peta
+clusters = None
+returned_objects = ["last_clicked"]
+if len(dataset) > MAX_MARKERS:
+    with tracer.span("cluster_layer"):
+        clusters = cluster_layer(DATASET_KEY, dataset, st.session_state.get("main_map") or {}, T)
+    returned_objects += ["bounds", "zoom"]
+
+# Tampilkan peta utama; hanya klik (dan geser/zoom untuk klaster) yang memicu rerun
+map_state = show_map(m, m_lock, overlay=clusters, width=1200, height=500,
+                     returned_objects=returned_objects, key="main_map")
+
+# Klik pada peta memilih kota terdekat sebagai kota pertama
+clicked = (map_state or {}).get("last_clicked")
+if clicked:
+    index = get_spatial_index(DATASET_KEY, dataset)
+    nearest, nearest_km = index.nearest(clicked["lat"], clicked["lng"])
+    nearby, nearby_km = index.within(clicked["lat"], clicked["lng"], NEARBY_RADIUS_KM)
+    nearest_city = city_names[nearest[0]]
+
+    if clicked != st.session_state.get("handled_click"):
+        st.session_state["handled_click"] = clicked
+        st.session_state["city1"] = nearest_city
+
+    st.info(T["clicked_nearest"].format(city=nearest_city, d=nearest_km[0]))
+    if nearby.size:
+        st.caption(T["clicked_within"].format(r=NEARBY_RADIUS_KM, cities=", ".join(
+            f"{city_names[i]} ({d:.1f} km)" for i, d in zip(nearby, nearby_km)
+        )))
+    else:
+        st.caption(T["clicked_none"].format(r=NEARBY_RADIUS_KM))
+
+
+def city_options(query, keep=()):
+    """Names in ``keep`` followed by up to ``SEARCH_LIMIT`` names starting with ``query``.
+
+    Widgets get this bounded list instead of every name in the dataset.  Kept
+    names from another dataset are dropped so their widgets reset.
+    """
+    keep = [name for name in keep if name and dataset.find(name) is not None]
+    found = (dataset.name(i) for i in dataset.search(query, SEARCH_LIMIT))
+    return list(dict.fromkeys([*keep, *found]))
+
+
+def city_search(key):
+    return st.text_input(T["search_city"], key=key,
+                         help=T["search_help"].format(n=SEARCH_LIMIT)).strip()
+
 
 # Section untuk kalkulator jarak
 st.subheader(T["distance_calc"])
@@ -210,15 +333,18 @@ st.subheader(T["distance_calc"])
 col1, col2, col3 = st.columns([1, 1, 1])
 
 with col1:
+    query1 = city_search("city1_search")
     city1 = st.selectbox(
         T["select_first"],
-        options=list(CITY_DATA.keys()),
+        options=city_options(query1, [st.session_state.get("city1")]),
         index=0,
         key="city1"
     )
 
 with col2:
-    city2_options = [city for city in CITY_DATA.keys() if city != city1]
+    query2 = city_search("city2_search")
+    city2_options = [city for city in city_options(query2, [st.session_state.get("city2")])
+                     if city != city1]
     city2 = st.selectbox(
         T["select_second"],
         options=city2_options,
@@ -231,67 +357,88 @@ with col3:
     st.write("")
     calculate_btn = st.button(T["calc_btn"], type="primary")
 
-if calculate_btn or (city1 and city2):
+# Pencarian tanpa hasil membuat pilihan kosong (None)
+if city1 and city2:
     if city1 == city2:
         st.warning(T["warn_same"])
     else:
-        distance = geodesic(CITY_DATA[city1], CITY_DATA[city2]).kilometers
+        i1, i2 = dataset.find(city1), dataset.find(city2)
+        lat1, lon1 = dataset.coords(i1)
+        lat2, lon2 = dataset.coords(i2)
+        if DIST is not None:
+            distance = DIST[i1, i2]
+        else:
+            distance = float(pairwise(lat1, lon1, lat2, lon2, method="vincenty"))
         st.success(T["distance_between"].format(c1=city1, c2=city2, d=distance))
 
+        # Rute terpendek pada graf jalan (lookup dari jalur yang sudah dihitung)
+        with tracer.span("road route"):
+            network = get_road_network(DATASET_KEY, dataset, ROAD_NEIGHBOURS)
+            path, route_km = network.route(i1, i2)
+        if path:
+            st.info(T["route_via"].format(
+                k=ROAD_NEIGHBOURS, path=" → ".join(city_names[i] for i in path), d=route_km
+            ))
+        else:
+            st.warning(T["no_route"].format(c1=city1, c2=city2))
+
         st.subheader(T["route_title"].format(c1=city1, c2=city2))
 
-        lat1, lon1 = CITY_DATA[city1]
-        lat2, lon2 = CITY_DATA[city2]
         center_lat = (lat1 + lat2) / 2
         center_lon = (lon1 + lon2) / 2
 
-        m2 = folium.Map(location=[center_lat, center_lon], zoom_start=9)
-
-        folium.Marker(
-            location=CITY_DATA[city1],
-            popup=f"<b>{T['start'].format(city=city1)}</b>",
-            tooltip=T["start"].format(city=city1),
-            icon=folium.Icon(color='green', icon='play', prefix='fa')
-        ).add_to(m2)
-
-        folium.Marker(
-            location=CITY_DATA[city2],
-            popup=f"<b>{T['dest'].format(city=city2)}</b>",
-            tooltip=T["dest"].format(city=city2),
-            icon=folium.Icon(color='red', icon='stop', prefix='fa')
-        ).add_to(m2)
-
-        folium.PolyLine(
-            locations=[CITY_DATA[city1], CITY_DATA[city2]],
-            color="blue",
-            weight=4,
-            opacity=0.8,
-            tooltip=T["route_tooltip"].format(d=distance)
-        ).add_to(m2)
-
-        folium.CircleMarker(
-            location=CITY_DATA[city1],
-            radius=10,
-            popup=city1,
-            color='green',
-            fill=True,
-            fill_color='green',
-            fill_opacity=0.7,
-            weight=3
-        ).add_to(m2)
-
-        folium.CircleMarker(
-            location=CITY_DATA[city2],
-            radius=10,
-            popup=city2,
-            color='red',
-            fill=True,
-            fill_color='red',
-            fill_opacity=0.7,
-            weight=3
-        ).add_to(m2)
-
-        st_folium(m2, width=1200, height=400)
+        # Hanya overlay rute yang dibuat ulang saat pasangan kota berubah
+        with tracer.span("route_overlay"):
+            route = route_overlay(
+                (lat1, lon1),
+                (lat2, lon2),
+                T["start"].format(city=city1),
+                T["dest"].format(city=city2),
+                T["route_tooltip"].format(d=route_km if path else distance),
+                path=[dataset.coords(i) for i in path] if path else None,
+            )
+        m2, m2_lock = get_route_base_map(dataset.center())
+        show_map(m2, m2_lock, overlay=route, center=(center_lat, center_lon), zoom=9,
+                 width=1200, height=400, key="route_map")
+
+# Section untuk perencana rute banyak perhentian
+st.subheader(T["tour_title"])
+
+tour_query = city_search("tour_search")
+stop_names = st.multiselect(T["tour_select"],
+                            options=city_options(tour_query, st.session_state.get("tour_stops", [])),
+                            max_selections=MAX_STOPS, key="tour_stops")
+
+if len(stop_names) < 2:
+    st.caption(T["tour_hint"])
+else:
+    stops = tuple(dataset.find(city) for city in stop_names)
+    with tracer.span("get_tour", stops=len(stops)):
+        tour, tour_km = get_tour(DATASET_KEY, dataset, stops, TOUR_TIME_BUDGET)
+    st.success(T["tour_total"].format(n=len(tour), d=tour_km, city=stop_names[0]))
+
+    # Jarak tiap ruas, termasuk ruas kembali ke titik awal
+    legs = pairwise(dataset.lat[tour], dataset.lon[tour],
+                    dataset.lat[np.roll(tour, -1)], dataset.lon[np.roll(tour, -1)],
+                    method="vincenty")
+
+    # pandas hanya dimuat bila tabel rute ditampilkan
+    import pandas as pd
+    st.dataframe(pd.DataFrame(dict(zip(T["tour_columns"], [
+        np.arange(1, len(tour) + 1),
+        [city_names[i] for i in tour],
+        legs.round(2),
+        np.cumsum(legs).round(2),
+    ]))), hide_index=True)
+
+    tour_lat, tour_lon = dataset.lat[tour], dataset.lon[tour]
+    with tracer.span("tour_overlay"):
+        overlay = tour_overlay(np.column_stack([tour_lat, tour_lon]).tolist(),
+                               [city_names[i] for i in tour], T["tour_tooltip"].format(d=tour_km))
+    m3, m3_lock = get_route_base_map(dataset.center())
+    show_map(m3, m3_lock, overlay=overlay,
+             center=(float(tour_lat.mean()), float(tour_lon.mean())),
+             zoom=fit_zoom(tour_lat, tour_lon), width=1200, height=400, key="tour_map")
 
 # Informasi tambahan
 st.markdown("---")
@@ -308,3 +455,5 @@ with col_info2:
 # Footer
 st.markdown("---")
 st.caption(T["footer"])
+
+show_trace(tracer, TRACE_TEXTS[lang_key])
@@ -0,0 +1,44 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from core.connections import delaunay_edges, spanning_tree_edges
+from core.distance import pairwise
+
+
+def edge_graph(src, dst, n):
+    graph = nx.Graph()
+    graph.add_nodes_from(range(n))
+    graph.add_edges_from(zip(src.tolist(), dst.tolist()))
+    return graph
+
+
+def tree_length(lat, lon, src, dst):
+    return pairwise(lat[src], lon[src], lat[dst], lon[dst]).sum()
+
+
+def test_repeated_coordinates_are_connected():
+    lat = np.array([0, 0, 1, 1, 0.5, 0.5])
+    lon = np.array([0, 1, 0, 1, 0.5, 0.5])
+    src, dst = delaunay_edges(lat, lon)
+    assert (4, 5) in set(zip(src.tolist(), dst.tolist()))
+    src, dst = spanning_tree_edges(lat, lon)
+    assert nx.is_tree(edge_graph(src, dst, lat.size))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_spanning_tree_is_minimum(seed):
+    rng = np.random.default_rng(seed)
+    n = 40
+    lat, lon = rng.uniform(-10, 10, n), rng.uniform(95, 140, n)
+    # A few exact repeats, which Qhull alone would drop.
+    lat[:5], lon[:5] = lat[5:10], lon[5:10]
+    src, dst = spanning_tree_edges(lat, lon, method="haversine")
+    assert nx.is_tree(edge_graph(src, dst, n))
+
+    i, j = np.triu_indices(n, k=1)
+    complete = nx.Graph()
+    complete.add_weighted_edges_from(
+        zip(i.tolist(), j.tolist(), pairwise(lat[i], lon[i], lat[j], lon[j])))
+    best = nx.minimum_spanning_tree(complete).size(weight="weight")
+    assert tree_length(lat, lon, src, dst) == pytest.approx(best, rel=1e-9)
@@ -0,0 +1,51 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from core.connectivity import analyze_connectivity
+from core.sampling import sample_gnm_edges
+
+
+def networkx_graph(src, dst, n):
+    graph = nx.Graph()
+    graph.add_nodes_from(range(n))
+    graph.add_edges_from(zip(src.tolist(), dst.tolist()))
+    return graph
+
+
+def check_against_networkx(src, dst, n):
+    result = analyze_connectivity(src, dst, n)
+    graph = networkx_graph(src, dst, n)
+    components = sorted(sorted(c) for c in nx.connected_components(graph))
+    labels = result["labels"]
+    found = [np.flatnonzero(labels == k).tolist() for k in range(result["num_components"])]
+    assert found == components
+    assert result["largest_component"] == max(map(len, components), default=0)
+    bridges = {tuple(sorted(edge)) for edge in nx.bridges(graph)}
+    assert {(int(src[e]), int(dst[e])) for e in result["bridges"]} == bridges
+    assert set(result["articulation_points"].tolist()) == set(nx.articulation_points(graph))
+
+
+@pytest.mark.parametrize("n, m", [(1, 0), (2, 1), (30, 20), (60, 60), (200, 180), (200, 600)])
+@pytest.mark.parametrize("seed", range(5))
+def test_random_graphs_match_networkx(n, m, seed):
+    src, dst = sample_gnm_edges(n, m, seed=seed)
+    check_against_networkx(src, dst, n)
+
+
+def test_deep_path_has_no_recursion_limit():
+    n = 50_000
+    src, dst = np.arange(n - 1), np.arange(1, n)
+    result = analyze_connectivity(src, dst, n)
+    assert result["num_components"] == 1
+    assert result["bridges"].size == n - 1
+    np.testing.assert_array_equal(result["articulation_points"], np.arange(1, n - 1))
+
+
+def test_parallel_edge_is_not_a_bridge():
+    # A triangle with a pendant edge 2-3, which is doubled.
+    src = np.array([0, 1, 0, 2, 2])
+    dst = np.array([1, 2, 2, 3, 3])
+    result = analyze_connectivity(src, dst, 4)
+    assert result["bridges"].size == 0
+    np.testing.assert_array_equal(result["articulation_points"], [2])
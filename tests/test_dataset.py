@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from core.dataset import LocationDataset
+
+
+@pytest.fixture
+def dataset():
+    rng = np.random.default_rng(0)
+    names = ["".join(rng.choice(list("abc"), size=rng.integers(1, 5))) for _ in range(300)]
+    return names, LocationDataset.from_arrays(names, rng.random(300), rng.random(300))
+
+
+@pytest.mark.parametrize("prefix", ["", "a", "ab", "cab", "ccc", "b", "x"])
+@pytest.mark.parametrize("limit", [1, 5, 1000])
+def test_search_matches_brute_force(dataset, prefix, limit):
+    names, data = dataset
+    rows = data.search(prefix, limit)
+    expected = sorted(name for name in names if name.startswith(prefix))[:limit]
+    assert [data.name(row) for row in rows] == expected
+    assert len(set(rows)) == len(rows)
+
+
+def test_find(dataset):
+    names, data = dataset
+    for name in set(names):
+        assert data.name(data.find(name)) == name
+    assert data.find("zzz") is None
@@ -0,0 +1,84 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from core.editing import GraphEditor
+from core.sampling import sample_gnm_edges
+
+
+def check_against_networkx(editor, graph):
+    snap = editor.snapshot()
+    labels = snap.labels.tolist()
+    assert snap.num_vertices == editor.num_vertices == graph.number_of_nodes()
+    assert sorted(labels) == sorted(graph.nodes())
+    edges = {frozenset((labels[u], labels[v])) for u, v in zip(snap.src.tolist(), snap.dst.tolist())}
+    assert edges == {frozenset(edge) for edge in graph.edges()}
+    assert editor.num_edges == graph.number_of_edges()
+    assert dict(zip(labels, snap.degrees.tolist())) == dict(graph.degree())
+    members = {}
+    for position, component in enumerate(snap.components.tolist()):
+        members.setdefault(component, set()).add(labels[position])
+    assert sorted(map(sorted, members.values())) == sorted(map(sorted, nx.connected_components(graph)))
+    # Components are numbered 0 .. k-1 by their smallest vertex, as component_labels does.
+    components, first = np.unique(snap.components, return_index=True)
+    np.testing.assert_array_equal(components, np.arange(len(members)))
+    assert np.all(np.diff(first) > 0)
+    report = editor.connectivity()
+    bridges = {frozenset((labels[snap.src[e]], labels[snap.dst[e]])) for e in report["bridges"]}
+    assert bridges == {frozenset(edge) for edge in nx.bridges(graph)}
+    assert {labels[v] for v in report["articulation_points"]} == set(nx.articulation_points(graph))
+    assert np.isfinite(snap.positions).all()
+
+
+@pytest.mark.parametrize("n, m", [(30, 25), (40, 80), (60, 40)])
+@pytest.mark.parametrize("seed", range(4))
+def test_random_edits_match_networkx(n, m, seed):
+    src, dst = sample_gnm_edges(n, m, seed=seed)
+    editor = GraphEditor(src, dst, n, seed=seed)
+    # Default labels are 1 .. n.
+    graph = nx.Graph()
+    graph.add_nodes_from(range(1, n + 1))
+    graph.add_edges_from(zip((src + 1).tolist(), (dst + 1).tolist()))
+    check_against_networkx(editor, graph)
+
+    rng = np.random.default_rng(seed)
+    for _ in range(120):
+        labels = editor.snapshot().labels
+        size = editor.num_vertices
+        operation = rng.choice(["add_edge", "remove_edge", "add_vertex", "remove_vertex"],
+                               p=[0.35, 0.35, 0.15, 0.15])
+        if operation == "add_edge":
+            u, v = rng.integers(0, size, 2)
+            changed = editor.add_edge(u, v)
+            assert changed == (u != v and not graph.has_edge(labels[u], labels[v]))
+            if changed:
+                graph.add_edge(labels[u], labels[v])
+        elif operation == "remove_edge":
+            snap = editor.snapshot()
+            if not snap.src.size:
+                continue
+            e = rng.integers(0, snap.src.size)
+            u, v = snap.src[e], snap.dst[e]
+            assert editor.remove_edge(u, v)
+            assert not editor.remove_edge(u, v)
+            graph.remove_edge(labels[u], labels[v])
+        elif operation == "add_vertex":
+            neighbours = rng.choice(size, size=min(size, rng.integers(0, 4)), replace=False)
+            position = editor.add_vertex(neighbours)
+            label = editor.snapshot().labels[position]
+            assert label not in graph
+            graph.add_node(label)
+            graph.add_edges_from((label, labels[u]) for u in neighbours)
+        elif size > 1:
+            u = rng.integers(0, size)
+            editor.remove_vertex(u)
+            graph.remove_node(labels[u])
+        check_against_networkx(editor, graph)
+
+
+def test_edits_reject_unknown_vertices():
+    editor = GraphEditor(np.array([0]), np.array([1]), 2)
+    with pytest.raises(IndexError):
+        editor.add_edge(0, 2)
+    assert not editor.add_edge(1, 1)
+    assert not editor.add_edge(1, 0)
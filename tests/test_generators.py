@@ -0,0 +1,48 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from core.generators import barabasi_albert_edges, expected_edges, generate, random_geometric_edges
+
+
+def brute_force_edges(pos, radius):
+    diff = pos[:, None, :] - pos[None, :, :]
+    close = np.einsum("ijk,ijk->ij", diff, diff) < radius * radius
+    src, dst = np.nonzero(np.triu(close, k=1))
+    return set(zip(src.tolist(), dst.tolist()))
+
+
+@pytest.mark.parametrize("radius", [0.01, 0.05, 0.07, 0.1, 0.33, 0.5, 0.9, 1.5])
+@pytest.mark.parametrize("seed", [0, 3, 7])
+def test_random_geometric_matches_brute_force(radius, seed):
+    src, dst, pos = random_geometric_edges(800, radius, seed=seed, return_positions=True)
+    assert np.all(src < dst)
+    assert set(zip(src.tolist(), dst.tolist())) == brute_force_edges(pos, radius)
+
+
+@pytest.mark.parametrize("m", [1, 2, 3])
+@pytest.mark.parametrize("seed", range(20))
+def test_barabasi_albert_is_connected(m, seed):
+    n = 100
+    src, dst = barabasi_albert_edges(n, m, seed=seed)
+    graph = nx.Graph()
+    graph.add_nodes_from(range(n))
+    graph.add_edges_from(zip(src.tolist(), dst.tolist()))
+    assert np.all(src < dst)
+    assert graph.number_of_edges() == src.size == m * (n - m)
+    assert nx.is_connected(graph)
+    if m == 1:
+        assert nx.is_tree(graph)
+
+
+@pytest.mark.parametrize("model, params", [
+    ("gnp", {"p": 0.05}),
+    ("ba", {"m": 3}),
+    ("ws", {"k": 6, "p": 0.2}),
+    ("geometric", {"radius": 0.05}),
+    ("sbm", {"blocks": 3, "p_in": 0.1, "p_out": 0.01}),
+])
+def test_expected_edges_matches_generated(model, params):
+    counts = [generate(model, 1000, seed=seed, **params)[0].size for seed in range(5)]
+    # The geometric estimate ignores the border and runs a little high.
+    assert np.mean(counts) == pytest.approx(expected_edges(model, 1000, **params), rel=0.1)
@@ -0,0 +1,129 @@
+import gzip
+import io
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+import pytest
+from scipy.io import mmwrite
+from scipy.sparse import coo_matrix
+
+from core.graph_io import detect_format, load_graph
+from core.sampling import sample_gnm_edges
+
+PAGE = Path(__file__).resolve().parent.parent / "pages" / "2-Visualization-Graph.py"
+
+
+def edge_set(graph, labels=None):
+    """Imported edges as a set of frozensets of original ids."""
+    labels = graph.labels if labels is None else labels
+    return {frozenset((labels[u], labels[v])) for u, v in zip(graph.src.tolist(), graph.dst.tolist())}
+
+
+def reference_graph(n=40, m=90, seed=5):
+    src, dst = sample_gnm_edges(n, m, seed=seed)
+    graph = nx.Graph()
+    graph.add_edges_from(zip(src.tolist(), dst.tolist()))
+    return graph
+
+
+def nx_edges(graph):
+    return {frozenset(edge) for edge in graph.edges()}
+
+
+@pytest.mark.parametrize("header", ["", "source,target\n", "# comment\nfrom,to\n"])
+def test_edgelist_with_and_without_header(tmp_path, header):
+    graph = reference_graph()
+    path = tmp_path / "graph.csv"
+    path.write_text(header + "".join(f"{u},{v}\n" for u, v in graph.edges()))
+    imported = load_graph(path)
+    assert imported.num_vertices == graph.number_of_nodes()
+    assert edge_set(imported) == nx_edges(graph)
+
+
+def test_gzip_matches_plain(tmp_path):
+    graph = reference_graph()
+    text = "".join(f"{u} {v}\n" for u, v in graph.edges()).encode()
+    path = tmp_path / "graph.txt.gz"
+    path.write_bytes(gzip.compress(text))
+    assert detect_format(path) == "edgelist"
+    assert edge_set(load_graph(path)) == nx_edges(graph)
+    upload = io.BytesIO(gzip.compress(text))
+    assert edge_set(load_graph(upload, name="graph.txt.gz")) == nx_edges(graph)
+
+
+def test_text_ids_are_relabelled(tmp_path):
+    path = tmp_path / "graph.tsv"
+    path.write_text("a\tb\nb\tc\nc\ta\nc\tc\nb\ta\nd\te\n")
+    imported = load_graph(path)
+    assert sorted(imported.labels.tolist()) == ["a", "b", "c", "d", "e"]
+    assert edge_set(imported) == nx_edges(nx.Graph([("a", "b"), ("b", "c"), ("c", "a"), ("d", "e")]))
+    assert imported.stats == {"edges_read": 6, "self_loops": 1, "duplicates": 1}
+
+
+def test_mixed_ids_fall_back_to_text(tmp_path):
+    path = tmp_path / "graph.txt"
+    path.write_text("1 2\n2 x\n")
+    imported = load_graph(path)
+    assert edge_set(imported) == {frozenset(("1", "2")), frozenset(("2", "x"))}
+
+
+def test_matrix_market_matches_scipy(tmp_path):
+    graph = reference_graph()
+    n = 45  # Vertices 40..44 have no edges but are declared.
+    src, dst = zip(*graph.edges())
+    path = tmp_path / "graph.mtx"
+    mmwrite(path, coo_matrix((np.ones(len(src)), (src, dst)), shape=(n, n)))
+    imported = load_graph(path)
+    assert imported.num_vertices == n
+    # Matrix Market ids are 1-based.
+    assert edge_set(imported, np.arange(n)) == nx_edges(graph)
+
+
+def test_matrix_market_rejects_out_of_range(tmp_path):
+    path = tmp_path / "graph.mtx"
+    path.write_text("%%MatrixMarket matrix coordinate pattern general\n3 3 1\n1 4\n")
+    with pytest.raises(ValueError):
+        load_graph(path)
+
+
+def test_adjlist_matches_networkx(tmp_path):
+    graph = reference_graph()
+    graph.add_node(99)
+    path = tmp_path / "graph.adjlist"
+    nx.write_adjlist(graph, path)
+    imported = load_graph(path)
+    assert imported.num_vertices == graph.number_of_nodes()
+    assert set(imported.labels.tolist()) == set(graph.nodes())
+    assert edge_set(imported) == nx_edges(graph)
+
+
+def test_unknown_suffix_is_rejected():
+    with pytest.raises(ValueError):
+        detect_format("graph.json")
+
+
+def import_from_path(path):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(PAGE), default_timeout=60)
+    at.run()
+    at.radio[0].set_value("path").run()
+    at.text_input[0].set_value(path)
+    at.button[0].click().run()
+    assert not at.exception
+    return at
+
+
+@pytest.mark.parametrize("path", ["../requests.jsonl", "/etc/hostname", "sub/../../Home.py"])
+def test_page_rejects_paths_outside_data(path):
+    at = import_from_path(path)
+    assert [error.value for error in at.error] == [
+        "Only files inside the data folder can be imported."]
+    assert not at.success
+
+
+def test_page_imports_paths_inside_data():
+    at = import_from_path("jawa_barat.csv")
+    assert not at.error
+    assert len(at.success) == 1
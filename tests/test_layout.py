@@ -0,0 +1,32 @@
+import numpy as np
+
+from core.generators import gnp_edges
+from core.layout import LayoutCache, graph_hash
+
+
+def _graphs():
+    src, dst = gnp_edges(60, 0.08, seed=3)
+    # Drop one edge: the edited graph stays similar enough to warm-start.
+    return (src, dst), (src[1:], dst[1:])
+
+
+def test_layout_ignores_other_graphs_history():
+    (src, dst), (esrc, edst) = _graphs()
+    fresh = LayoutCache().get("force", esrc, edst, 60, seed=1)
+    busy = LayoutCache()
+    busy.get("force", src, dst, 60, seed=1)
+    # Without a parent key the layout is the cold start, whatever was cached.
+    np.testing.assert_array_equal(busy.get("force", esrc, edst, 60, seed=1), fresh)
+
+
+def test_edited_graph_warm_starts_from_parent():
+    (src, dst), (esrc, edst) = _graphs()
+    parent_key = graph_hash(src, dst, 60)
+    layouts = []
+    for _ in range(2):
+        cache = LayoutCache()
+        cache.get("force", src, dst, 60, seed=1)
+        layouts.append(cache.get("force", esrc, edst, 60, seed=1, parent_key=parent_key))
+    np.testing.assert_array_equal(layouts[0], layouts[1])
+    cold = LayoutCache().get("force", esrc, edst, 60, seed=1, parent_key=parent_key)
+    assert not np.array_equal(layouts[0], cold)
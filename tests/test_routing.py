@@ -0,0 +1,22 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from core.routing import RoadNetwork
+from core.spatial import SpatialIndex
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_index_network_is_connected(seed):
+    rng = np.random.default_rng(seed)
+    # Two distant clusters: their k nearest neighbours never cross over.
+    lat = np.concatenate([rng.normal(-6, 0.1, 50), rng.normal(3, 0.1, 50)])
+    lon = np.concatenate([rng.normal(107, 0.1, 50), rng.normal(101, 0.1, 50)])
+    network = RoadNetwork.from_index(SpatialIndex(lat, lon), k=3)
+    src, dst = network.edges()
+    graph = nx.Graph()
+    graph.add_nodes_from(range(lat.size))
+    graph.add_edges_from(zip(src.tolist(), dst.tolist()))
+    assert nx.is_connected(graph)
+    path, length = network.route(0, lat.size - 1)
+    assert path[0] == 0 and path[-1] == lat.size - 1 and np.isfinite(length)
@@ -0,0 +1,51 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from core.sampling import max_edges, sample_gnm_edges, unrank_pairs
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 7, 40])
+def test_unrank_matches_enumeration(n):
+    i, j = unrank_pairs(np.arange(max_edges(n)), n)
+    assert list(zip(i.tolist(), j.tolist())) == list(itertools.combinations(range(n), 2))
+
+
+@pytest.mark.parametrize("n", [65_536, 1_000_003, 50_000_017])
+def test_unrank_round_trips_for_large_n(n):
+    # Indices near the ends of rows, where float sqrt is most likely to round wrongly.
+    rows = np.array([0, 1, 2, n // 3, n // 2, n - 3, n - 2], dtype=np.int64)
+    first = rows * (2 * n - rows - 1) // 2
+    index = np.concatenate([first, first - 1, first + 1])
+    index = index[(index >= 0) & (index < max_edges(n))]
+    i, j = unrank_pairs(index, n)
+    assert np.all((0 <= i) & (i < j) & (j < n))
+    np.testing.assert_array_equal(i * (2 * n - i - 1) // 2 + (j - i - 1), index)
+
+
+@pytest.mark.parametrize("n, m", [(1, 0), (2, 1), (50, 0), (50, 100), (50, 1000), (50, 1225)])
+def test_sample_is_a_simple_graph(n, m):
+    src, dst = sample_gnm_edges(n, m, seed=1)
+    assert src.size == m
+    assert np.all((0 <= src) & (src < dst) & (dst < n))
+    assert len(set(zip(src.tolist(), dst.tolist()))) == m
+
+
+def test_too_many_edges_is_rejected():
+    with pytest.raises(ValueError):
+        sample_gnm_edges(10, 46)
+
+
+@pytest.mark.parametrize("m", [3, 8])
+def test_sample_is_uniform(m):
+    # Each of the 10 pairs on 5 vertices is in a uniform G(5, m) with
+    # probability m / 10; m = 8 takes the complement path.
+    n, runs = 5, 4000
+    counts = np.zeros((n, n))
+    for seed in range(runs):
+        src, dst = sample_gnm_edges(n, m, seed=seed)
+        counts[src, dst] += 1
+    p = m / max_edges(n)
+    observed = counts[np.triu_indices(n, 1)] / runs
+    assert np.all(np.abs(observed - p) < 5 * np.sqrt(p * (1 - p) / runs))
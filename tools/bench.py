@@ -0,0 +1,450 @@
+"""Micro-benchmarks for the graph and map hot paths in ``core``.
+
+Every benchmark runs over a set of problem sizes (n = 10 ... 10^5, capped
+where the algorithm is quadratic).  Each case is timed several times after
+its setup (fast calls in a loop, so every timed sample lasts at least
+``MIN_SAMPLE_S``), and the minimum and median time per call are recorded together with any size
+metrics (HTML bytes, PNG bytes, ...).  Results are written as JSON and can
+be compared with a stored baseline; a case slower (or larger) than the
+baseline by more than the tolerance is a regression and makes the run fail.
+
+    python tools/bench.py                          # run all, compare with baseline
+    python tools/bench.py -k layout --max-n 1000   # a subset
+    python tools/bench.py --save-baseline          # record a new baseline
+    python tools/bench.py -k models --save-baseline --new-only   # add new cases only
+"""
+
+import argparse
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+BASELINE = Path(__file__).resolve().parent / "bench_baseline.json"
+SIZES = (10, 100, 1_000, 10_000, 100_000)
+# Regressions are reported when a case is this much slower than the baseline,
+# in both its fastest and its median repeat.
+TOLERANCE = 0.5
+# Calls faster than this are repeated within one sample: timer resolution
+# and scheduler jitter would otherwise swamp them.
+MIN_SAMPLE_S = 0.02
+MIN_TIME_S = 0.2
+MAX_REPEATS = 20
+# On a shared machine a neighbour's load can slow every sample for seconds.
+# A case slower than its baseline is therefore timed again, after a pause, up
+# to this many times (the fastest attempt is kept) before it counts, and a
+# baseline stores the median of this many attempts plus one, not a lucky one.
+RETRIES = 3
+RETRY_PAUSE_S = 1.0
+SEED = 42
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str, sizes=SIZES):
+    """Register ``setup(n) -> run`` where ``run()`` is the timed call.
+
+    ``run`` may return a dict of extra metrics (e.g. output size in bytes).
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, tuple(sizes))
+        return setup
+    return register
+
+
+def _graph(n: int, degree: int = 6):
+    from core.sampling import max_edges, sample_gnm_edges
+
+    m = min(n * degree // 2, max_edges(n))
+    return sample_gnm_edges(n, m, seed=SEED)
+
+
+def _points(n: int):
+    rng = np.random.default_rng(SEED)
+    return rng.uniform(-8.0, -6.0, n), rng.uniform(106.0, 109.0, n)
+
+
+# ---------------- GRAPH ----------------
+@benchmark("sampling.gnm")
+def bench_sampling(n):
+    from core.sampling import max_edges, sample_gnm_edges
+
+    m = min(3 * n, max_edges(n))
+    return lambda: sample_gnm_edges(n, m, seed=SEED)
+
+
+@benchmark("adjacency.build_csr")
+def bench_adjacency(n):
+    from core.adjacency import build_csr
+
+    src, dst = _graph(n)
+    return lambda: build_csr(src, dst, n)
+
+
+@benchmark("degree.stats")
+def bench_degree(n):
+    from core.degree import degree_summary, degrees_from_edges, log_binned_histogram, top_k
+
+    src, dst = _graph(n)
+
+    def run():
+        degrees = degrees_from_edges(src, dst, n)
+        degree_summary(degrees)
+        log_binned_histogram(degrees)
+        top_k(degrees)
+    return run
+
+
+@benchmark("connectivity.analyze")
+def bench_connectivity(n):
+    from core.connectivity import analyze_connectivity
+
+    src, dst = _graph(n, degree=2)
+
+    def run():
+        result = analyze_connectivity(src, dst, n)
+        return {"components": result["num_components"], "bridges": len(result["bridges"])}
+    return run
+
+
+@benchmark("layout.force", sizes=SIZES[:4])
+def bench_force_layout(n):
+    from core.layout import force_layout
+
+    src, dst = _graph(n)
+    return lambda: force_layout(src, dst, n, seed=SEED)
+
+
+@benchmark("layout.spectral")
+def bench_spectral_layout(n):
+    from core.layout import spectral_layout
+
+    src, dst = _graph(n)
+    return lambda: spectral_layout(src, dst, n, seed=SEED)
+
+
+@benchmark("render.png")
+def bench_render(n):
+    from core.layout import random_layout
+    from core.render import choose_mode, encode_figure, render_graph
+
+    src, dst = _graph(n)
+    pos = random_layout(n, seed=SEED)
+
+    def run():
+        png = encode_figure(render_graph(pos, src, dst), dpi=100)
+        return {"mode": choose_mode(n, len(src)), "png_bytes": len(png)}
+    return run
+
+
+@benchmark("render.cached")
+def bench_render_cached(n):
+    from core.layout import random_layout
+    from core.render import RenderCache, encode_figure, render_graph, render_key
+
+    src, dst = _graph(n)
+    pos = random_layout(n, seed=SEED)
+    cache = RenderCache()
+    cache.put(render_key(pos, src, dst), encode_figure(render_graph(pos, src, dst)))
+
+    def run():
+        # The page's hit path for a graph drawn before (in any session): hash
+        # the inputs, then look the image up.
+        png = cache.get(render_key(pos, src, dst))
+        return {"png_bytes": len(png)}
+    return run
+
+
+@benchmark("editing.edge")
+def bench_editing(n):
+    from core.editing import GraphEditor
+
+    src, dst = _graph(n)
+    editor = GraphEditor(src, dst, n, seed=SEED)
+    u, v = 0, n // 2
+    editor.remove_edge(u, v)
+
+    def run():
+        # One edge in and out again: degrees, components and layout updates.
+        editor.add_edge(u, v)
+        editor.remove_edge(u, v)
+    return run
+
+
+# ---------------- GENERATORS ----------------
+def _model_params(model: str, n: int) -> dict:
+    """Parameters giving each model a mean degree of about 6."""
+    return {
+        "gnp": {"p": min(6 / max(n - 1, 1), 1.0)},
+        "ba": {"m": 3},
+        "ws": {"k": 6, "p": 0.1},
+        "geometric": {"radius": float(np.sqrt(6 / (np.pi * n)))},
+        "sbm": {"blocks": 4, "p_in": min(15 / n, 1.0), "p_out": min(3 / n, 1.0)},
+    }[model]
+
+
+def _networkx_graph(model: str, n: int, params: dict):
+    import networkx as nx
+
+    if model == "gnp":
+        return nx.fast_gnp_random_graph(n, params["p"], seed=SEED)
+    if model == "ba":
+        return nx.barabasi_albert_graph(n, params["m"], seed=SEED)
+    if model == "ws":
+        return nx.watts_strogatz_graph(n, params["k"], params["p"], seed=SEED)
+    if model == "geometric":
+        return nx.random_geometric_graph(n, params["radius"], seed=SEED)
+    blocks = params["blocks"]
+    sizes = [n // blocks + (i < n % blocks) for i in range(blocks)]
+    probabilities = [[params["p_in"] if a == b else params["p_out"] for b in range(blocks)]
+                     for a in range(blocks)]
+    return nx.stochastic_block_model(sizes, probabilities, seed=SEED)
+
+
+def _register_model(model: str):
+    @benchmark(f"models.{model}")
+    def bench_model(n):
+        from core.generators import generate
+
+        params = _model_params(model, n)
+
+        def run():
+            src, _ = generate(model, n, seed=SEED, **params)
+            return {"edges": len(src)}
+        return run
+
+    # NetworkX builds these graphs edge by edge in Python; 10^5 takes minutes.
+    @benchmark(f"networkx.{model}", sizes=SIZES[:4])
+    def bench_networkx(n):
+        params = _model_params(model, n)
+        return lambda: {"edges": _networkx_graph(model, n, params).number_of_edges()}
+
+
+for _model in ("gnp", "ba", "ws", "geometric", "sbm"):
+    _register_model(_model)
+
+
+# ---------------- MAP ----------------
+@benchmark("distance.matrix", sizes=SIZES[:3] + (2_000,))
+def bench_distance_matrix(n):
+    from core.distance import distance_matrix
+
+    lat, lon = _points(n)
+    return lambda: distance_matrix(lat, lon, method="vincenty")
+
+
+@benchmark("distance.pairwise")
+def bench_distance_pairwise(n):
+    from core.distance import pairwise
+
+    lat, lon = _points(2 * n)
+    return lambda: pairwise(lat[:n], lon[:n], lat[n:], lon[n:], method="vincenty")
+
+
+@benchmark("maps.base_map", sizes=SIZES[:3])
+def bench_base_map(n):
+    from core.maps import build_base_map, fit_zoom
+
+    lat, lon = _points(n)
+    names = [f"City {i}" for i in range(n)]
+    coords = np.column_stack([lat, lon]).tolist()
+
+    def run():
+        m = build_base_map(names, coords, (float(lat.mean()), float(lon.mean())),
+                           fit_zoom(lat, lon), "Click for {city} info")
+        return {"html_bytes": len(m.get_root().render().encode())}
+    return run
+
+
+@benchmark("maps.cluster_index")
+def bench_cluster_index(n):
+    from core.cluster import ClusterIndex
+
+    lat, lon = _points(n)
+    return lambda: ClusterIndex(lat, lon)
+
+
+@benchmark("maps.cluster_view")
+def bench_cluster_view(n):
+    from core.cluster import ClusterIndex
+    from core.geojson import point_collection
+    from core.maps import fit_zoom
+
+    lat, lon = _points(n)
+    index = ClusterIndex(lat, lon)
+    zoom = fit_zoom(lat, lon) + 2
+
+    def run():
+        clat, clon, count, _ = index.clusters(zoom, ((-7.5, 107.0), (-6.5, 108.0)))
+        points = point_collection(clat, clon, {"count": count})
+        return {"features": int(count.size), "geojson_bytes": len(json.dumps(points))}
+    return run
+
+
+# ---------------- ASSETS ----------------
+@benchmark("assets.encode", sizes=(160, 320, 640))
+def bench_encode(width):
+    from core.assets import encode_image, encoder_format
+
+    path = ROOT / "assets" / "anggota1.jpg"
+    fmt = encoder_format()
+
+    def run():
+        return {"format": fmt, "bytes": len(encode_image(path, width, fmt).data)}
+    return run
+
+
+def _sample(run, loops: int):
+    """Seconds per call over ``loops`` back-to-back calls, and the last output."""
+    start = time.perf_counter()
+    for _ in range(loops):
+        out = run()
+    return (time.perf_counter() - start) / loops, out
+
+
+def time_case(run) -> dict:
+    """Time ``run`` until ``MIN_TIME_S`` has passed (at least 3, at most ``MAX_REPEATS``).
+
+    The number of calls per sample doubles until a sample takes at least
+    ``MIN_SAMPLE_S``; times are per call.
+    """
+    loops = 1
+    elapsed, out = _sample(run, loops)
+    while elapsed * loops < MIN_SAMPLE_S:
+        loops *= 2
+        elapsed, out = _sample(run, loops)
+    times = [elapsed]
+    while len(times) < 3 or (sum(times) * loops < MIN_TIME_S and len(times) < MAX_REPEATS):
+        elapsed, out = _sample(run, loops)
+        times.append(elapsed)
+    return {"min_s": min(times), "median_s": statistics.median(times),
+            "repeats": len(times), "loops": loops,
+            "metrics": out if isinstance(out, dict) else {}}
+
+
+def run_all(pattern: str = "*", max_n: int | None = None, baseline: list = (),
+            tolerance: float = TOLERANCE, attempts: int = 1) -> list:
+    previous = {(case["name"], case["n"]): case for case in baseline}
+    results = []
+    for name, (setup, sizes) in BENCHMARKS.items():
+        if not fnmatch.fnmatch(name, pattern) and pattern not in name:
+            continue
+        for n in sizes:
+            if max_n is not None and n > max_n:
+                continue
+            run = setup(n)
+            timings = sorted((time_case(run) for _ in range(attempts)),
+                             key=lambda timing: timing["min_s"])
+            case = {"name": name, "n": n, **timings[len(timings) // 2]}
+            old = previous.get((name, n))
+            for _ in range(RETRIES):
+                if old is None or not _slower(case, old, tolerance):
+                    break
+                time.sleep(RETRY_PAUSE_S)
+                retry = time_case(run)
+                if retry["min_s"] < case["min_s"]:
+                    case.update(retry)
+            results.append(case)
+            print(f"{name:<24} n={n:<7} min {case['min_s'] * 1000:10.3f} ms   "
+                  f"median {case['median_s'] * 1000:10.3f} ms   {case['metrics'] or ''}",
+                  flush=True)
+    return results
+
+
+def _slower(case: dict, old: dict, tolerance: float) -> bool:
+    # One noisy repeat moves the minimum or the median, rarely both.
+    return (case["min_s"] > old["min_s"] * (1 + tolerance)
+            and case["median_s"] > old["median_s"] * (1 + tolerance))
+
+
+def compare(results: list, baseline: list, tolerance: float = TOLERANCE) -> list:
+    """Descriptions of cases slower or larger than ``baseline`` beyond ``tolerance``."""
+    previous = {(case["name"], case["n"]): case for case in baseline}
+    regressions = []
+    for case in results:
+        old = previous.get((case["name"], case["n"]))
+        if old is None:
+            continue
+        label = f"{case['name']} n={case['n']}"
+        if _slower(case, old, tolerance):
+            regressions.append(f"{label}: {old['min_s'] * 1000:.3f} ms -> "
+                               f"{case['min_s'] * 1000:.3f} ms (median "
+                               f"{old['median_s'] * 1000:.3f} ms -> "
+                               f"{case['median_s'] * 1000:.3f} ms)")
+        for key, value in case["metrics"].items():
+            before = old["metrics"].get(key)
+            if (isinstance(value, (int, float)) and isinstance(before, (int, float))
+                    and key.endswith("bytes") and value > before * (1 + tolerance)):
+                regressions.append(f"{label}: {key} {before} -> {value}")
+    return regressions
+
+
+def merge_baseline(path: Path, report: dict, new_only: bool = False) -> dict:
+    """``report`` merged into the baseline at ``path``.
+
+    Cases that were not run keep their stored timings, so adding a benchmark
+    does not re-time (and silently shift) every other case.  With
+    ``new_only`` stored cases are not replaced either.
+    """
+    if not path.exists():
+        return report
+    stored = json.loads(path.read_text())
+    merged = {(case["name"], case["n"]): case for case in stored["results"]}
+    for case in report["results"]:
+        if not new_only or (case["name"], case["n"]) not in merged:
+            merged[(case["name"], case["n"])] = case
+    return {"meta": stored["meta"], "results": list(merged.values())}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", default="*", help="benchmark name pattern")
+    parser.add_argument("--max-n", type=int, help="skip sizes above this")
+    parser.add_argument("--out", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store the cases run in the baseline, keeping the others")
+    parser.add_argument("--new-only", action="store_true",
+                        help="with --save-baseline, only add cases missing from the baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if not args.save_baseline and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": run_all(args.filter, args.max_n, baseline or (), args.tolerance,
+                           attempts=RETRIES + 1 if args.save_baseline else 1),
+    }
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(merge_baseline(args.baseline, report, args.new_only),
+                                            indent=2))
+        return 0
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+
+    regressions = compare(report["results"], baseline, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
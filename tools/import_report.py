@@ -0,0 +1,104 @@
+"""Cold-start report: first-run time and import cost of every page.
+
+Each page runs once in a fresh interpreter (``python -X importtime``) through
+Streamlit's ``AppTest``, after Streamlit itself is already imported, so the
+numbers show what the page adds to a new worker's time to first paint.
+
+    python tools/import_report.py                 # table for all pages
+    python tools/import_report.py --budget 1500   # exit 1 if a page is slower
+    python tools/import_report.py --json report.json pages/MapsGraph.py
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MARKER = "--- page start ---"
+TOP_MODULES = 8
+
+RUNNER = f"""
+import sys, time
+from streamlit.testing.v1 import AppTest
+page = sys.argv[1]
+at = AppTest.from_file(page, default_timeout=120)
+print({MARKER!r}, file=sys.stderr, flush=True)
+start = time.perf_counter()
+at.run()
+print(f"--- page ms {{(time.perf_counter() - start) * 1000:.1f}}", file=sys.stderr)
+print(f"--- exceptions {{len(at.exception)}}", file=sys.stderr)
+"""
+
+
+def pages() -> list[Path]:
+    return [ROOT / "Home.py", *sorted((ROOT / "pages").glob("*.py"))]
+
+
+def parse_importtime(lines) -> dict:
+    """Cumulative microseconds per top-level import made by the page."""
+    imports = {}
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue  # nested import, already counted by its parent
+        name = name.strip()
+        imports[name] = imports.get(name, 0) + int(cumulative)
+    return imports
+
+
+def measure(page: Path) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUNNER, str(page)],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    lines = proc.stderr.splitlines()
+    if proc.returncode != 0 or MARKER not in lines:
+        raise RuntimeError(f"{page.name} failed:\n{proc.stderr[-2000:]}")
+    after = lines[lines.index(MARKER) + 1:]
+    imports = parse_importtime(after)
+    page_ms = next(float(l.split()[-1]) for l in after if l.startswith("--- page ms"))
+    errors = next(int(l.split()[-1]) for l in after if l.startswith("--- exceptions"))
+    return {
+        "page": str(page.relative_to(ROOT)),
+        "first_run_ms": page_ms,
+        "import_ms": sum(imports.values()) / 1000,
+        "exceptions": errors,
+        "top_imports": [
+            {"module": name, "ms": us / 1000}
+            for name, us in sorted(imports.items(), key=lambda kv: -kv[1])[:TOP_MODULES]
+        ],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", type=Path, help="page scripts (default: all)")
+    parser.add_argument("--budget", type=float, help="maximum first-run time per page in ms")
+    parser.add_argument("--json", type=Path, help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    report = [measure(page.resolve()) for page in (args.pages or pages())]
+    for entry in report:
+        flags = []
+        if args.budget is not None and entry["first_run_ms"] > args.budget:
+            flags.append("OVER BUDGET")
+        if entry["exceptions"]:
+            flags.append(f"{entry['exceptions']} EXCEPTION(S)")
+        print(f"{entry['page']:<34} first run {entry['first_run_ms']:8.1f} ms   "
+              f"imports {entry['import_ms']:8.1f} ms   {'  '.join(flags)}".rstrip())
+        for item in entry["top_imports"]:
+            print(f"    {item['module']:<40} {item['ms']:8.1f} ms")
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+    failed = [e for e in report if e["exceptions"]
+              or (args.budget is not None and e["first_run_ms"] > args.budget)]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())